@@ -0,0 +1,12 @@
+"""AgentWorker package
+
+Resident worker that keeps the agent packages imported and serves
+newline-delimited JSON jobs from stdin or a Unix socket, dispatching them to
+SkillVerification, MatchingAlgorithm, ProjectVerification and
+ReputationAdjustment on a bounded thread pool.
+"""
+
+__all__ = [
+    "cli",
+    "core",
+]
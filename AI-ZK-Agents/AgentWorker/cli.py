@@ -0,0 +1,93 @@
+import argparse
+import os
+import socketserver
+import sys
+import threading
+
+from .core import TASKS, Dispatcher, warm_up
+
+
+class _Connection:
+    """Serializes replies onto one output stream and tracks unanswered jobs."""
+
+    def __init__(self, out):
+        self._out = out
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending = 0
+
+    def reply(self, data: bytes) -> None:
+        with self._lock:
+            try:
+                self._out.write(data)
+                self._out.flush()
+            except (BrokenPipeError, ValueError, OSError):
+                pass
+            self._pending -= 1
+            self._idle.notify_all()
+
+    def serve(self, lines, dispatcher: Dispatcher) -> None:
+        for line in lines:
+            if not line.strip():
+                continue
+            with self._lock:
+                self._pending += 1
+            dispatcher.submit(line, self.reply)
+        with self._lock:
+            while self._pending:
+                self._idle.wait()
+
+
+def serve_stdin(dispatcher: Dispatcher) -> None:
+    out = sys.stdout.buffer
+    # Keep the protocol stream clean if task code prints anything.
+    sys.stdout = sys.stderr
+    _Connection(out).serve(sys.stdin.buffer, dispatcher)
+
+
+def serve_socket(path: str, dispatcher: Dispatcher) -> None:
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            _Connection(self.wfile).serve(self.rfile, dispatcher)
+
+    if os.path.exists(path):
+        os.unlink(path)
+    sys.stdout = sys.stderr
+    with socketserver.ThreadingUnixStreamServer(path, Handler) as server:
+        server.daemon_threads = True
+        try:
+            server.serve_forever()
+        finally:
+            os.unlink(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="agent-worker",
+        description="Serve newline-delimited JSON agent jobs from stdin or a Unix socket with warm imports",
+    )
+    parser.add_argument("--socket", help="Listen on this Unix socket path instead of stdin/stdout")
+    parser.add_argument("--concurrency", type=int, default=4, help="Jobs executed in parallel")
+    parser.add_argument("--max-pending", type=int, default=None, help="Jobs admitted before reads block (default 2x concurrency)")
+    parser.add_argument("--no-warm", action="store_true", help="Import task modules on first use instead of at startup")
+
+    args = parser.parse_args(argv)
+
+    if not args.no_warm:
+        for task, err in warm_up(TASKS).items():
+            sys.stderr.write(f"agent-worker: {task} unavailable ({err})\n")
+
+    dispatcher = Dispatcher(max_workers=args.concurrency, max_pending=args.max_pending)
+    try:
+        if args.socket:
+            serve_socket(args.socket, dispatcher)
+        else:
+            serve_stdin(dispatcher)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        dispatcher.shutdown(wait=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple
+
+from zk_common.lexicon import maybe_reload_lexicon
+
+
+# task name -> (module, callable); modules are imported once and stay warm
+TASKS: Dict[str, Tuple[str, str]] = {
+    "skills.verify": ("SkillVerification.core", "run_for_candidate"),
+    "match": ("MatchingAlgorithm.core", "match_job_to_candidate"),
+    "project.verify": ("ProjectVerification.core", "verify_submission"),
+    "reputation.adjust": ("ReputationAdjustment.core", "adjust_reputation"),
+}
+
+_resolved: Dict[str, Callable[..., Any]] = {}
+_resolve_lock = threading.Lock()
+
+
+def resolve_task(name: str) -> Callable[..., Any]:
+    fn = _resolved.get(name)
+    if fn is not None:
+        return fn
+    if name not in TASKS:
+        raise KeyError(f"unknown task: {name}")
+    module_name, attr = TASKS[name]
+    with _resolve_lock:
+        fn = getattr(importlib.import_module(module_name), attr)
+        _resolved[name] = fn
+    return fn
+
+
+def warm_up(tasks: Optional[Iterable[str]] = None) -> Dict[str, str]:
+    """Import the modules behind ``tasks`` (default: all) ahead of the first job.
+
+    Returns task -> error message for tasks whose imports failed, so a worker
+    missing an optional dependency can still serve the other tasks.
+    """
+    errors: Dict[str, str] = {}
+    for name in tasks or TASKS:
+        try:
+            resolve_task(name)
+            # agent packages import heavy dependencies lazily; load them here
+            preload = getattr(importlib.import_module(TASKS[name][0]), "preload", None)
+            if preload is not None:
+                preload()
+        except Exception as e:
+            errors[name] = f"{type(e).__name__}: {e}"
+    return errors
+
+
+def run_task(name: str, params: Mapping[str, Any]) -> Any:
+    if name == "ping":
+        return {"pid": os.getpid(), "warm": sorted(_resolved)}
+    res = resolve_task(name)(**params)
+    if hasattr(res, "to_zk_json"):
+        res = res.to_zk_json()
+    return res
+
+
+def handle_job(job: Mapping[str, Any]) -> Dict[str, Any]:
+    job_id = job.get("id")
+    try:
+        maybe_reload_lexicon()  # pick up lexicon edits without restarting the worker
+        result = run_task(job["task"], job.get("params") or {})
+        return {"id": job_id, "ok": True, "result": result}
+    except Exception as e:
+        return {"id": job_id, "ok": False, "error": f"{type(e).__name__}: {e}"}
+
+
+def encode_response(resp: Mapping[str, Any]) -> bytes:
+    return json.dumps(resp, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8") + b"\n"
+
+
+class Dispatcher:
+    """Runs jobs on a fixed-size thread pool with bounded admission.
+
+    ``submit`` blocks once ``max_pending`` jobs are queued or running, which
+    applies backpressure to whichever reader is feeding it.
+    """
+
+    def __init__(self, max_workers: int = 4, max_pending: Optional[int] = None) -> None:
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="agent-worker")
+        self._slots = threading.BoundedSemaphore(max_pending or max_workers * 2)
+
+    def submit(self, line: bytes, reply: Callable[[bytes], None]) -> None:
+        try:
+            job = json.loads(line)
+            if not isinstance(job, dict) or "task" not in job:
+                raise ValueError("job must be an object with a 'task' field")
+        except Exception as e:
+            reply(encode_response({"id": None, "ok": False, "error": f"bad job: {e}"}))
+            return
+
+        self._slots.acquire()
+
+        def _done(fut):
+            self._slots.release()
+            reply(encode_response(fut.result()))
+
+        self._pool.submit(handle_job, job).add_done_callback(_done)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
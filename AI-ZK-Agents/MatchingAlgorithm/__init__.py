@@ -2,11 +2,15 @@
 
 Provides core functions and a CLI to compute a weighted match score between
 candidate skills and job requirements. The CLI emits JSON suitable for ZK
-plumbing (commitments and structured outputs).
+plumbing (commitments and structured outputs). ``matrix.match_matrix`` scores
+many jobs against many candidates in one vectorized pass, and
+``index.SkillIndex`` answers top-K candidate queries from an inverted index.
 """
 
 __all__ = [
     "core",
+    "index",
+    "matrix",
     "utils",
 ]
 
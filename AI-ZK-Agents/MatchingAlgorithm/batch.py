@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import heapq
+import json
+import sys
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .core import match_job_to_candidate, match_many
+from .matrix import match_matrix
+from .utils import batch_to_zk_json, canonical_dumps
+
+# (id, skill -> weight/confidence) rows as read from JSONL
+Row = Tuple[str, Dict[str, float]]
+# (score, candidate_id, skills) entries kept for top-K ranking
+Ranked = Tuple[float, str, Dict[str, float]]
+
+
+def read_jsonl(path: str, id_key: str, value_key: str) -> Iterator[Row]:
+    """Stream ``(id, mapping)`` rows from a JSONL file, or stdin for ``-``.
+
+    Each non-blank line is an object like ``{"job_id": "j1", "requirements": {...}}``.
+    """
+    fh = sys.stdin if path == "-" else open(path, "r", encoding="utf-8")
+    try:
+        for lineno, line in enumerate(fh, 1):
+            if not line.strip():
+                continue
+            try:
+                obj = json.loads(line)
+                yield str(obj[id_key]), obj[value_key]
+            except (ValueError, KeyError, TypeError) as e:
+                raise ValueError(f"{path}:{lineno}: expected {{{id_key!r}, {value_key!r}}} object: {e}") from None
+    finally:
+        if fh is not sys.stdin:
+            fh.close()
+
+
+def iter_blocks(rows: Iterable[Row], size: int) -> Iterator[List[Row]]:
+    block: List[Row] = []
+    for row in rows:
+        block.append(row)
+        if len(block) >= size:
+            yield block
+            block = []
+    if block:
+        yield block
+
+
+def _rank_key(entry: Ranked) -> Tuple[float, str]:
+    # score descending, then candidate_id ascending
+    return (-entry[0], entry[1])
+
+
+def score_pairs_block(jobs: Sequence[Row], candidates: Sequence[Row], threshold: float) -> List[str]:
+    """Canonical result lines for every (job, candidate) pair of a block."""
+    lines: List[str] = []
+    for job_id, requirements in jobs:
+        results = match_many(job_id, requirements, candidates, threshold)
+        lines.extend(canonical_dumps(out).decode("utf-8") for out in batch_to_zk_json(results))
+    return lines
+
+
+def top_k_block(jobs: Sequence[Row], candidates: Sequence[Row], k: int) -> List[List[Ranked]]:
+    """Per job, the ``k`` best candidates of a block by vectorized score."""
+    scores = match_matrix([jr for _, jr in jobs], [cs for _, cs in candidates])
+    out: List[List[Ranked]] = []
+    for row in scores:
+        ranked = ((float(s), cid, cs) for s, (cid, cs) in zip(row, candidates))
+        out.append(heapq.nsmallest(k, ranked, key=_rank_key))
+    return out
+
+
+def _imap_bounded(
+    pool: Optional[Executor],
+    fn: Callable[..., Any],
+    arg_iter: Iterable[Tuple[Any, ...]],
+    max_inflight: int,
+) -> Iterator[Any]:
+    """Ordered map over ``arg_iter`` with at most ``max_inflight`` pending tasks."""
+    if pool is None:
+        for args in arg_iter:
+            yield fn(*args)
+        return
+    pending: deque = deque()
+    for args in arg_iter:
+        pending.append(pool.submit(fn, *args))
+        if len(pending) >= max_inflight:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def iter_batch_lines(
+    jobs_path: str,
+    candidates_path: str,
+    threshold: float = 0.6,
+    top_k: int = 0,
+    block_size: int = 512,
+    job_block_size: int = 256,
+    workers: int = 1,
+) -> Iterator[str]:
+    """Stream canonical JSON result lines for every job against every candidate.
+
+    Jobs are taken ``job_block_size`` at a time and the candidate file is
+    re-read in ``block_size`` blocks for each job block, so memory is bounded
+    by one block pair (plus ``top_k`` entries per job) however large the
+    inputs are. When candidates come from stdin they can only be read once,
+    so all jobs are held in a single block.
+
+    With ``top_k`` > 0 only the best ``top_k`` candidates per job are emitted
+    (score descending, then candidate_id ascending), once the job's block has
+    seen every candidate; otherwise one line per pair is emitted as each
+    block finishes. ``workers`` > 1 scores blocks in a process pool with a
+    bounded number of blocks in flight; output order does not depend on it.
+    """
+    if jobs_path == "-" and candidates_path == "-":
+        raise ValueError("jobs and candidates cannot both be read from stdin")
+    if candidates_path == "-":
+        job_block_size = sys.maxsize
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    max_inflight = 2 * workers
+    try:
+        for jobs in iter_blocks(read_jsonl(jobs_path, "job_id", "requirements"), job_block_size):
+            cand_blocks = iter_blocks(read_jsonl(candidates_path, "candidate_id", "skills"), block_size)
+            if not top_k:
+                units = ((jobs, cands, threshold) for cands in cand_blocks)
+                for lines in _imap_bounded(pool, score_pairs_block, units, max_inflight):
+                    yield from lines
+                continue
+
+            best: List[List[Ranked]] = [[] for _ in jobs]
+            units = ((jobs, cands, top_k) for cands in cand_blocks)
+            for block_best in _imap_bounded(pool, top_k_block, units, max_inflight):
+                for i, entries in enumerate(block_best):
+                    best[i] = heapq.nsmallest(top_k, best[i] + entries, key=_rank_key)
+            for (job_id, requirements), entries in zip(jobs, best):
+                results = [
+                    match_job_to_candidate(job_id, cid, requirements, skills, threshold)
+                    for _, cid, skills in entries
+                ]
+                for out in batch_to_zk_json(results):
+                    yield canonical_dumps(out).decode("utf-8")
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
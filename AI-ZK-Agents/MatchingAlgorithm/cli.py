@@ -12,22 +12,69 @@ def main(argv=None):
         prog="matching",
         description="Compute weighted match score between job requirements and candidate skills; emit ZK-friendly JSON",
     )
-    parser.add_argument("--job-id", required=True, help="Job identifier")
-    parser.add_argument("--candidate-id", required=True, help="Candidate identifier")
+    parser.add_argument("--job-id", help="Job identifier")
+    parser.add_argument("--candidate-id", help="Candidate identifier")
     parser.add_argument(
         "--job-json",
-        required=True,
-        help="Job requirements either as JSON or path to JSON file. Example: '{"python":0.9,"docker":0.6}'",
+        help="Job requirements either as JSON or path to JSON file. Example: '{\"python\":0.9,\"docker\":0.6}'",
     )
     parser.add_argument(
         "--skills-json",
-        required=True,
-        help="Candidate skills either as JSON or path to JSON file. Example: '{"python":0.8,"docker":0.7}'",
+        help="Candidate skills either as JSON or path to JSON file. Example: '{\"python\":0.8,\"docker\":0.7}'",
     )
     parser.add_argument("--threshold", type=float, default=0.6, help="Match threshold in [0,1]")
+    batch = parser.add_argument_group("batch mode")
+    batch.add_argument(
+        "--batch",
+        action="store_true",
+        help="Score every job in --jobs against every candidate in --candidates; one JSON line per result",
+    )
+    batch.add_argument(
+        "--jobs",
+        help='JSONL of {"job_id": ..., "requirements": {...}} objects, or - for stdin',
+    )
+    batch.add_argument(
+        "--candidates",
+        help='JSONL of {"candidate_id": ..., "skills": {...}} objects, or - for stdin',
+    )
+    batch.add_argument("--top-k", type=int, default=0, help="Emit only the best K candidates per job (0 = every pair)")
+    batch.add_argument("--block-size", type=int, default=512, help="Candidates scored per block")
+    batch.add_argument("--job-block-size", type=int, default=256, help="Jobs held in memory per pass over the candidates")
+    batch.add_argument("--workers", type=int, default=1, help="Score blocks in a pool of this many processes")
 
     args = parser.parse_args(argv)
 
+    if args.batch:
+        if not args.jobs or not args.candidates:
+            parser.error("--batch requires --jobs and --candidates")
+        if args.block_size < 1 or args.job_block_size < 1 or args.workers < 1 or args.top_k < 0:
+            parser.error("--block-size, --job-block-size and --workers must be >= 1 and --top-k >= 0")
+        from .batch import iter_batch_lines  # numpy; only batch mode needs it
+
+        try:
+            for line in iter_batch_lines(
+                args.jobs,
+                args.candidates,
+                threshold=args.threshold,
+                top_k=args.top_k,
+                block_size=args.block_size,
+                job_block_size=args.job_block_size,
+                workers=args.workers,
+            ):
+                sys.stdout.write(line + "\n")
+        except ValueError as e:
+            parser.error(str(e))
+        return
+
+    missing = [opt for opt, val in (
+        ("--job-id", args.job_id),
+        ("--candidate-id", args.candidate_id),
+        ("--job-json", args.job_json),
+        ("--skills-json", args.skills_json),
+    ) if val is None]
+    if missing:
+        parser.error("the following arguments are required: " + ", ".join(missing))
+
     job_req: Dict[str, float] = load_json_or_path(args.job_json)
     skills: Dict[str, float] = load_json_or_path(args.skills_json)
 
@@ -2,13 +2,24 @@ from __future__ import annotations
 
 from typing import Any, Dict, Iterable, List, Mapping, Tuple
 
+from zk_common.commitments import SecretMemo
+
 from .utils import (
+    HASHER,
     MatchResult,
     derive_secret,
     normalize_skill_name,
 )
 
 
+def normalize_skill_weights(skills: Mapping[str, float]) -> Dict[str, float]:
+    """Normalize skill keys and clamp values into [0,1].
+
+    Later keys win when several raw names normalize to the same skill.
+    """
+    return {normalize_skill_name(k): max(0.0, min(1.0, float(v))) for k, v in skills.items()}
+
+
 def compute_weighted_overlap(
     job_requirements: Mapping[str, float],
     user_skills: Mapping[str, float],
@@ -25,8 +36,8 @@ def compute_weighted_overlap(
         (score, details)
     """
     # Normalize keys
-    jr = {normalize_skill_name(k): max(0.0, min(1.0, float(v))) for k, v in job_requirements.items()}
-    us = {normalize_skill_name(k): max(0.0, min(1.0, float(v))) for k, v in user_skills.items()}
+    jr = normalize_skill_weights(job_requirements)
+    us = normalize_skill_weights(user_skills)
 
     denom = sum(jr.values()) or 1.0
     overlap_sum = 0.0
@@ -55,6 +66,15 @@ def compute_weighted_overlap(
     return score, details
 
 
+_JOB_SECRETS = SecretMemo(HASHER, "job")
+
+
+def job_secret_for(job_id: str, normalized_requirements: Mapping[str, float]) -> bytes:
+    """Job secret, memoized per (job_id, requirements) across calls."""
+    key = (job_id, tuple(sorted(normalized_requirements.items())))
+    return _JOB_SECRETS.get(key, {"job_id": job_id, "requirements": normalized_requirements})
+
+
 def match_job_to_candidate(
     job_id: str,
     candidate_id: str,
@@ -65,7 +85,7 @@ def match_job_to_candidate(
     score, details = compute_weighted_overlap(job_requirements, user_skills)
     is_match = score >= threshold
 
-    job_secret = derive_secret("job", {"job_id": job_id, "requirements": details["normalized"]["job_requirements"]})
+    job_secret = job_secret_for(job_id, details["normalized"]["job_requirements"])
     skills_secret = derive_secret("skills", {"candidate_id": candidate_id, "skills": details["normalized"]["user_skills"]})
     match_secret = derive_secret("match", {
         "job_id": job_id,
@@ -88,3 +108,17 @@ def match_job_to_candidate(
     )
 
 
+def match_many(
+    job_id: str,
+    job_requirements: Mapping[str, float],
+    candidates: Iterable[Tuple[str, Mapping[str, float]]],
+    threshold: float = 0.6,
+) -> List[MatchResult]:
+    """match_job_to_candidate for one job against many (candidate_id, skills).
+
+    Pair with ``utils.batch_to_zk_json`` to emit all results in one pass.
+    """
+    return [
+        match_job_to_candidate(job_id, candidate_id, job_requirements, skills, threshold)
+        for candidate_id, skills in candidates
+    ]
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import bisect
+import heapq
+import json
+import os
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from .core import normalize_skill_weights
+from .utils import canonical_dumps
+
+INDEX_FORMAT = 1
+
+# Slack for comparing upper bounds against exact scores; bounds are summed in
+# a different order than the exact overlap, so they may differ by a few ULPs.
+_BOUND_EPS = 1e-9
+
+
+class SkillIndex:
+    """Inverted index from normalized skill to candidates sorted by confidence.
+
+    Each posting list holds ``(-confidence, candidate_id)`` tuples so the
+    strongest candidates for a skill come first. The full normalized skill
+    dict of every candidate is kept as well so that candidates surfaced by a
+    posting list can be scored exactly with random access.
+    """
+
+    def __init__(self) -> None:
+        self._candidates: Dict[str, Dict[str, float]] = {}
+        self._postings: Dict[str, List[Tuple[float, str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._candidates)
+
+    def __contains__(self, candidate_id: object) -> bool:
+        return candidate_id in self._candidates
+
+    def add(self, candidate_id: str, user_skills: Mapping[str, float]) -> None:
+        """Insert or replace a candidate's skills."""
+        if candidate_id in self._candidates:
+            self.remove(candidate_id)
+        us = normalize_skill_weights(user_skills)
+        self._candidates[candidate_id] = us
+        for skill, conf in us.items():
+            if conf > 0.0:
+                bisect.insort(self._postings.setdefault(skill, []), (-conf, candidate_id))
+
+    def remove(self, candidate_id: str) -> None:
+        us = self._candidates.pop(candidate_id)
+        for skill, conf in us.items():
+            if conf <= 0.0:
+                continue
+            plist = self._postings[skill]
+            del plist[bisect.bisect_left(plist, (-conf, candidate_id))]
+            if not plist:
+                del self._postings[skill]
+
+    def max_confidence(self, skill: str) -> float:
+        plist = self._postings.get(skill)
+        return -plist[0][0] if plist else 0.0
+
+    def top_k(self, job_requirements: Mapping[str, float], k: int) -> List[Tuple[str, float]]:
+        """Return the best ``k`` (candidate_id, score) pairs for a job.
+
+        Ranking is by score descending, then candidate_id ascending, and the
+        result equals sorting ``compute_weighted_overlap`` over every
+        candidate. Skills are visited in decreasing order of their upper
+        bound ``min(weight, max_confidence)``; a posting list is abandoned
+        once no unseen candidate in it can beat the current k-th best, and
+        traversal stops once the remaining bounds cannot either.
+
+        Candidates are ranked by the divided score ``overlap / denom``, not
+        the raw overlap: overlaps a few ULPs apart can divide to the same
+        score, and those ties must fall back to candidate_id.
+        """
+        if k <= 0:
+            return []
+        jr = normalize_skill_weights(job_requirements)
+        denom = sum(jr.values()) or 1.0
+
+        terms = []
+        for skill, w in jr.items():
+            ub = min(w, self.max_confidence(skill))
+            if ub > 0.0:
+                terms.append((ub, skill, w))
+        terms.sort(key=lambda t: -t[0])
+        rest = [0.0] * (len(terms) + 1)
+        for i in range(len(terms) - 1, -1, -1):
+            rest[i] = rest[i + 1] + terms[i][0]
+
+        # best holds (-score, candidate_id) sorted ascending, at most k long
+        best: List[Tuple[float, str]] = []
+        seen = set()
+        # Upper bound on what an unseen candidate may have gained from posting
+        # lists that were abandoned before reaching it.
+        skipped = 0.0
+        for i, (ub, skill, w) in enumerate(terms):
+            if len(best) == k and (skipped + rest[i]) / denom < -best[-1][0] - _BOUND_EPS:
+                break
+            for neg_conf, cand in self._postings[skill]:
+                if cand in seen:
+                    continue
+                bound = min(w, -neg_conf)
+                if len(best) == k and (skipped + bound + rest[i + 1]) / denom < -best[-1][0] - _BOUND_EPS:
+                    skipped += bound
+                    break
+                seen.add(cand)
+                entry = (-(self._overlap(jr, cand) / denom), cand)
+                if len(best) < k:
+                    bisect.insort(best, entry)
+                elif entry < best[-1]:
+                    bisect.insort(best, entry)
+                    best.pop()
+
+        if len(best) < k:
+            # Every candidate with a positive overlap has been scored; pad with
+            # zero-score candidates in id order.
+            taken = {cand for _, cand in best}
+            fill = heapq.nsmallest(k - len(best), (c for c in self._candidates if c not in taken))
+            for cand in fill:
+                bisect.insort(best, (-(0.0 / denom), cand))
+        return [(cand, -neg) for neg, cand in best]
+
+    def _overlap(self, jr: Mapping[str, float], candidate_id: str) -> float:
+        # Same summation order as compute_weighted_overlap for identical floats.
+        us = self._candidates[candidate_id]
+        overlap = 0.0
+        for skill, w in jr.items():
+            overlap += min(w, us.get(skill, 0.0))
+        return overlap
+
+    def save(self, path: str) -> None:
+        data = {
+            "format": INDEX_FORMAT,
+            "candidates": self._candidates,
+            "postings": {s: [[cand, -neg] for neg, cand in plist] for s, plist in self._postings.items()},
+        }
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as fh:
+            fh.write(canonical_dumps(data))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "SkillIndex":
+        with open(path, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+        if data.get("format") != INDEX_FORMAT:
+            raise ValueError(f"unsupported skill index format: {data.get('format')}")
+        index = cls()
+        index._candidates = data["candidates"]
+        index._postings = {s: [(-conf, cand) for cand, conf in plist] for s, plist in data["postings"].items()}
+        return index
+
+    @classmethod
+    def from_candidates(cls, candidates: Mapping[str, Mapping[str, float]], path: Optional[str] = None) -> "SkillIndex":
+        index = cls()
+        for cand, skills in candidates.items():
+            index.add(cand, skills)
+        if path:
+            index.save(path)
+        return index
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .core import normalize_skill_weights
+
+
+class SkillVocabulary:
+    """Interns normalized skill names into dense column indices.
+
+    The last column (``pad_index``) is reserved as an always-zero column so
+    ragged requirement lists can be packed into rectangular arrays.
+    """
+
+    def __init__(self, skills: Iterable[str] = ()) -> None:
+        self._index: Dict[str, int] = {}
+        self.skills: List[str] = []
+        for s in skills:
+            self.intern(s)
+
+    def intern(self, skill: str) -> int:
+        idx = self._index.get(skill)
+        if idx is None:
+            idx = len(self.skills)
+            self._index[skill] = idx
+            self.skills.append(skill)
+        return idx
+
+    def index(self, skill: str) -> Optional[int]:
+        return self._index.get(skill)
+
+    @property
+    def pad_index(self) -> int:
+        return len(self.skills)
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def __contains__(self, skill: object) -> bool:
+        return skill in self._index
+
+
+def pack_requirements(
+    jobs: Sequence[Mapping[str, float]],
+    vocab: SkillVocabulary,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Pack job requirement dicts into (weights, columns) arrays of shape (J, K).
+
+    Skills keep their per-job insertion order so that accumulating column by
+    column reproduces the summation order of ``compute_weighted_overlap``.
+    Padding entries have weight 0.0 and point at ``vocab.pad_index``.
+    """
+    normalized = [normalize_skill_weights(j) for j in jobs]
+    for jr in normalized:
+        for s in jr:
+            vocab.intern(s)
+
+    width = max((len(jr) for jr in normalized), default=0)
+    weights = np.zeros((len(normalized), width), dtype=np.float64)
+    columns = np.full((len(normalized), width), vocab.pad_index, dtype=np.intp)
+    for row, jr in enumerate(normalized):
+        for k, (s, w) in enumerate(jr.items()):
+            weights[row, k] = w
+            columns[row, k] = vocab.index(s)
+    return weights, columns
+
+
+def pack_confidences(
+    candidates: Sequence[Mapping[str, float]],
+    vocab: SkillVocabulary,
+) -> np.ndarray:
+    """Pack candidate skill dicts into an (N, V + 1) confidence matrix.
+
+    Skills outside the vocabulary are dropped since no job can reference them.
+    """
+    conf = np.zeros((len(candidates), len(vocab) + 1), dtype=np.float64)
+    for row, cand in enumerate(candidates):
+        for s, c in normalize_skill_weights(cand).items():
+            col = vocab.index(s)
+            if col is not None:
+                conf[row, col] = c
+    return conf
+
+
+def overlap_scores(weights: np.ndarray, columns: np.ndarray, confidences: np.ndarray) -> np.ndarray:
+    """Compute sum(min(w, c)) / sum(w) for every (job, candidate) pair.
+
+    Accumulates one requirement slot at a time across all pairs, which keeps
+    the floating point summation order identical to the scalar path.
+    """
+    n_jobs, width = weights.shape
+    overlap = np.zeros((n_jobs, confidences.shape[0]), dtype=np.float64)
+    denom = np.zeros(n_jobs, dtype=np.float64)
+    for k in range(width):
+        w = weights[:, k]
+        overlap += np.minimum(w[:, None], confidences[:, columns[:, k]].T)
+        denom += w
+    denom[denom == 0.0] = 1.0
+    return overlap / denom[:, None]
+
+
+def match_matrix(
+    jobs: Sequence[Mapping[str, float]],
+    candidates: Sequence[Mapping[str, float]],
+) -> np.ndarray:
+    """Score every job against every candidate in one vectorized pass.
+
+    Returns a (len(jobs), len(candidates)) float64 array whose entries equal
+    ``compute_weighted_overlap(job, candidate)[0]``.
+    """
+    vocab = SkillVocabulary()
+    weights, columns = pack_requirements(jobs, vocab)
+    confidences = pack_confidences(candidates, vocab)
+    return overlap_scores(weights, columns, confidences)
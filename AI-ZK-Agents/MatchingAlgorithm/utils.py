@@ -1,46 +1,24 @@
 import json
 import os
-import re
 from dataclasses import dataclass
-from datetime import datetime
-from hashlib import blake2b
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
-
-VERSION = "0.1.0"
+from zk_common.commitments import DomainHasher, batch_to_zk_json as _batch_to_zk_json
+from zk_common.encoding import canonical_dumps
+from zk_common.utils import hash32, hex_to_bytes32, normalize_skill_name, now_utc_iso, to_hex32
 
 
-def canonical_dumps(obj: Any) -> bytes:
-    """Serialize object to canonical JSON bytes (sorted keys, no spaces)."""
-    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode("utf-8")
-
+VERSION = "0.1.0"
 
-def hash32(payload: bytes) -> bytes:
-    h = blake2b(digest_size=32)
-    h.update(payload)
-    return h.digest()
+HASHER = DomainHasher("MAI")
 
 
 def derive_secret(domain: str, payload_obj: Any, salt: bytes | None = None) -> bytes:
-    domain_prefix = f"MAI-{domain}|".encode("utf-8")
-    payload = canonical_dumps(payload_obj)
-    if salt:
-        return hash32(domain_prefix + salt + b"|" + payload)
-    return hash32(domain_prefix + payload)
+    return HASHER.derive_secret(domain, payload_obj, salt)
 
 
 def commitment_from_secret(secret32: bytes) -> bytes:
-    return hash32(b"MAI-COMMIT-v1|" + secret32)
-
-
-def to_hex32(b: bytes) -> str:
-    if len(b) != 32:
-        raise ValueError("expected 32-byte value")
-    return "0x" + b.hex()
-
-
-def now_utc_iso() -> str:
-    return datetime.utcnow().isoformat() + "Z"
+    return HASHER.commitment(secret32)
 
 
 def is_probable_json(s: str) -> bool:
@@ -58,31 +36,6 @@ def load_json_or_path(arg: str) -> Any:
     raise ValueError(f"Argument is neither existing path nor JSON: {arg}")
 
 
-def normalize_skill_name(name: str) -> str:
-    t = name.strip().lower()
-    t = re.sub(r"[^a-z0-9_\-+.#]", "", t)
-    aliases = {
-        "py": "python",
-        "js": "javascript",
-        "ts": "typescript",
-        "sklearn": "scikit-learn",
-        "tf": "tensorflow",
-        "torch": "pytorch",
-    }
-    t = aliases.get(t, t)
-    return t
-
-
-def hex_to_bytes32(x: str) -> bytes:
-    x = x.lower().strip()
-    if x.startswith("0x"):
-        x = x[2:]
-    b = bytes.fromhex(x)
-    if len(b) != 32:
-        raise ValueError("expected 32-byte hex value")
-    return b
-
-
 @dataclass
 class MatchResult:
     job_id: str
@@ -95,19 +48,30 @@ class MatchResult:
     skills_secret: bytes
     match_secret: bytes
 
-    def to_zk_json(self) -> Dict[str, Any]:
+    def zk_secrets(self) -> List[bytes]:
+        return [self.job_secret, self.skills_secret, self.match_secret]
+
+    def to_zk_json(
+        self,
+        generated_at: Optional[str] = None,
+        commitments: Optional[Mapping[bytes, bytes]] = None,
+    ) -> Dict[str, Any]:
+        def commit(secret: bytes) -> str:
+            c = commitments.get(secret) if commitments else None
+            return to_hex32(c or commitment_from_secret(secret))
+
         return {
             "module": "MatchingAlgorithm",
             "version": VERSION,
-            "generated_at": now_utc_iso(),
+            "generated_at": generated_at or now_utc_iso(),
             "ids": {"job_id": self.job_id, "candidate_id": self.candidate_id},
             "public": {
                 "match_score": round(self.score, 6),
                 "threshold": self.threshold,
                 "is_match": self.is_match,
-                "job_commitment": to_hex32(commitment_from_secret(self.job_secret)),
-                "skills_commitment": to_hex32(commitment_from_secret(self.skills_secret)),
-                "match_commitment": to_hex32(commitment_from_secret(self.match_secret)),
+                "job_commitment": commit(self.job_secret),
+                "skills_commitment": commit(self.skills_secret),
+                "match_commitment": commit(self.match_secret),
             },
             "witness": {
                 "job_secret": to_hex32(self.job_secret),
@@ -120,3 +84,6 @@ class MatchResult:
         }
 
 
+def batch_to_zk_json(results: Sequence[MatchResult]) -> List[Dict[str, Any]]:
+    """to_zk_json for many results with a shared timestamp and one commitment pass."""
+    return _batch_to_zk_json(results, HASHER, now_utc_iso)
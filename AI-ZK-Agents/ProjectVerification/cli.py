@@ -4,7 +4,7 @@ import sys
 from typing import Dict
 
 from .core import verify_submission
-from .utils import canonical_dumps
+from .utils import MANIFEST_MODES, canonical_dumps
 
 
 def main(argv=None):
@@ -18,6 +18,15 @@ def main(argv=None):
     parser.add_argument("--repo-path", required=True)
     parser.add_argument("--requirements-json", required=True, help="JSON or path to JSON for job requirements")
     parser.add_argument("--threshold", type=float, default=0.7)
+    parser.add_argument("--cache-dir", help="Reuse per-file scan results from earlier runs stored in this directory")
+    parser.add_argument(
+        "--manifest",
+        choices=MANIFEST_MODES,
+        default="list",
+        help="Commit to the full file list, or stream paths into a Merkle root for large trees "
+        "(constant memory only without --cache-dir)",
+    )
+    parser.add_argument("--manifest-sample", type=int, default=0, help="With --manifest merkle, keep this many paths in the output")
 
     args = parser.parse_args(argv)
 
@@ -38,6 +47,9 @@ def main(argv=None):
         repo_path=args.repo_path,
         job_requirements=req,
         threshold=args.threshold,
+        cache_dir=args.cache_dir,
+        manifest=args.manifest,
+        manifest_sample=args.manifest_sample,
     )
 
     out = res.to_zk_json()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, Optional
 
 from .utils import (
     VerificationResult,
@@ -17,8 +17,17 @@ def verify_submission(
     repo_path: str,
     job_requirements: Dict[str, float],
     threshold: float = 0.7,
+    cache_dir: Optional[str] = None,
+    manifest: str = "list",
+    manifest_sample: int = 0,
 ) -> VerificationResult:
-    coverage, details = score_repo_against_requirements(repo_path, job_requirements)
+    coverage, details = score_repo_against_requirements(
+        repo_path,
+        job_requirements,
+        cache_dir=cache_dir,
+        manifest=manifest,
+        manifest_sample=manifest_sample,
+    )
     passed = coverage >= threshold
 
     job_secret = derive_secret("job", {"job_id": job_id, "requirements": details["requirements"]})
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from hashlib import blake2b
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+MANIFEST_SCHEME = "PV-merkle-blake2b-v1"
+
+
+def _h(prefix: bytes, payload: bytes) -> bytes:
+    h = blake2b(digest_size=32)
+    h.update(prefix)
+    h.update(payload)
+    return h.digest()
+
+
+class MerkleAccumulator:
+    """Streaming binary Merkle tree over leaves in arrival order.
+
+    Keeps at most one pending subtree root per level (like a binary
+    counter), so memory is O(log n). Leaves and interior nodes use distinct
+    domain prefixes; when the leaf count is not a power of two, leftover
+    subtree roots are folded right to left into the final root.
+    """
+
+    LEAF = b"PV-leaf|"
+    NODE = b"PV-node|"
+    EMPTY = b"PV-empty|"
+
+    def __init__(self) -> None:
+        self._levels: List[Optional[bytes]] = []
+        self.count = 0
+
+    def add(self, data: bytes) -> None:
+        node = _h(self.LEAF, data)
+        self.count += 1
+        level = 0
+        while level < len(self._levels) and self._levels[level] is not None:
+            node = _h(self.NODE, self._levels[level] + node)
+            self._levels[level] = None
+            level += 1
+        if level == len(self._levels):
+            self._levels.append(node)
+        else:
+            self._levels[level] = node
+
+    def root(self) -> bytes:
+        acc: Optional[bytes] = None
+        for node in self._levels:
+            if node is None:
+                continue
+            acc = node if acc is None else _h(self.NODE, node + acc)
+        return acc if acc is not None else _h(self.EMPTY, b"")
+
+
+class FileManifest:
+    """Commits to a stream of repo-relative paths without storing them.
+
+    Wrap the file iterator with ``track``; every path that passes through is
+    hashed into the Merkle root and the first ``sample_size`` are kept.
+    """
+
+    def __init__(self, sample_size: int = 0) -> None:
+        self.sample_size = max(0, sample_size)
+        self.sample: List[str] = []
+        self._merkle = MerkleAccumulator()
+
+    def track(self, files: Iterable[str]) -> Iterator[str]:
+        for rel in files:
+            self._merkle.add(rel.encode("utf-8", errors="surrogateescape"))
+            if len(self.sample) < self.sample_size:
+                self.sample.append(rel)
+            yield rel
+
+    @property
+    def file_count(self) -> int:
+        return self._merkle.count
+
+    def to_details(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {
+            "manifest": MANIFEST_SCHEME,
+            "file_count": self.file_count,
+            "files_root": "0x" + self._merkle.root().hex(),
+        }
+        if self.sample_size:
+            out["files_sample"] = list(self.sample)
+        return out
@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import subprocess
+from hashlib import blake2b
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+
+from zk_common.lexicon import get_lexicon
+
+
+VCS_DIRS = {".git", ".hg", ".svn", ".bzr"}
+BINARY_SNIFF_BYTES = 8192
+MAX_SCAN_BYTES = 200_000
+
+# skill -> filename/content cues (matched case-insensitively as substrings), from the
+# shared lexicon as loaded at import; scans use default_cue_matcher() to follow reloads
+SKILL_CUES: Dict[str, List[str]] = dict(get_lexicon().cues)
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Regex matching where any of ``words`` starts, factored by common prefixes.
+
+    A flat alternation makes the engine try every word at each position; as
+    a trie it tries one branch per distinct next character. Longer words
+    below a complete one are dropped, since a prefix match is enough.
+    """
+    trie: Dict[str, dict] = {}
+    for w in words:
+        node = trie
+        for ch in w:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def emit(node: Dict[str, dict]) -> str:
+        if "" in node:
+            return ""
+        alts = [re.escape(ch) + emit(child) for ch, child in sorted(node.items())]
+        return alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+
+    return emit(trie) if trie else ""
+
+
+class CueMatcher:
+    """Finds which skills have a cue occurring anywhere in a text, in one pass.
+
+    All cues are compiled into a single zero-width lookahead over a prefix
+    trie, so the regex engine reports every position where some cue starts
+    (including overlapping ones) while scanning the text once in C. At each such
+    position only the cues of a length that fits are looked up, so the cost
+    depends on the text and the number of hits rather than the cue count.
+    One matcher serves a whole lexicon: skills a scan has already found are
+    passed as ``skip`` rather than compiled out of the pattern.
+    """
+
+    def __init__(self, cues: Mapping[str, Iterable[str]]) -> None:
+        by_cue: Dict[str, Set[str]] = {}
+        for skill, skill_cues in cues.items():
+            for cue in skill_cues:
+                by_cue.setdefault(cue.lower(), set()).add(skill)
+        self.skills: FrozenSet[str] = frozenset(cues)
+        self._cues = {skill: list(c) for skill, c in cues.items()}
+        self._by_cue: Dict[str, FrozenSet[str]] = {c: frozenset(s) for c, s in by_cue.items() if c}
+        self._lengths = sorted({len(c) for c in self._by_cue}, reverse=True)
+        trie = _trie_pattern(self._by_cue)
+        self._pattern = re.compile(f"(?={trie})") if trie else None
+
+    def find(self, text: str, skip: Iterable[str] = ()) -> Set[str]:
+        """Return skills not in ``skip`` with at least one cue in ``text`` (already lowercased)."""
+        skip = set(skip) & self.skills
+        if self._pattern is None or len(skip) == len(self.skills):
+            return set()
+        found = set(skip)
+        for m in self._pattern.finditer(text):
+            pos = m.start()
+            for n in self._lengths:
+                skills = self._by_cue.get(text[pos:pos + n])
+                if skills is not None and not skills <= found:
+                    found |= skills
+            if len(found) == len(self.skills):
+                break
+        return found - skip
+
+
+def default_cue_matcher() -> CueMatcher:
+    """CueMatcher over the current shared lexicon's cues, built once per lexicon."""
+    return get_lexicon().derived("ProjectVerification.cues", lambda lx: CueMatcher(lx.cues))
+
+
+def iter_repo_files(path: str) -> Iterator[str]:
+    """Yield every repo-relative file path, VCS metadata included.
+
+    Directories and files are visited in sorted order so the stream is
+    deterministic without materializing the whole listing. The scans skip
+    VCS directories themselves (``in_vcs_dir``), so file manifests still
+    list exactly what is on disk.
+    """
+    for root, dirnames, filenames in os.walk(path):
+        dirnames.sort()
+        for fn in sorted(filenames):
+            yield os.path.relpath(os.path.join(root, fn), path)
+
+
+def in_vcs_dir(rel: str) -> bool:
+    """True for paths inside a VCS metadata directory (``.git/...`` etc.)."""
+    return any(part in VCS_DIRS for part in rel.split(os.sep)[:-1])
+
+
+def read_scan_text(path: str, max_bytes: int = MAX_SCAN_BYTES) -> Optional[str]:
+    """Lowercased text of a file for cue matching, or None for binaries/unreadable files."""
+    try:
+        with open(path, "rb") as fh:
+            data = fh.read(max_bytes)
+    except Exception:
+        return None
+    if b"\0" in data[:BINARY_SNIFF_BYTES]:
+        return None
+    return data.decode("utf-8", errors="ignore").lower()
+
+
+def scan_file(matcher: CueMatcher, repo_abs: str, rel: str, skip: Iterable[str] = ()) -> Set[str]:
+    """Skills not in ``skip`` whose cues appear in a file's path or contents."""
+    skip = set(skip)
+    found = matcher.find(rel.lower(), skip)
+    if len(found | skip) < len(matcher.skills):
+        text = read_scan_text(os.path.join(repo_abs, rel))
+        if text:
+            found |= matcher.find(text, skip | found)
+    return found
+
+
+def scan_repo(repo_abs: str, files: Iterable[str], matcher: Optional[CueMatcher] = None) -> Dict[str, float]:
+    """Detect skills across ``files``; a skill stops being searched once found."""
+    matcher = matcher or default_cue_matcher()
+    detected: Dict[str, float] = {}
+    for rel in files:
+        if in_vcs_dir(rel):
+            continue
+        found = scan_file(matcher, repo_abs, rel, detected)
+        if found:
+            for s in found:
+                detected[s] = 1.0
+            if len(detected) == len(matcher.skills):
+                break
+    return detected
+
+
+SCAN_CACHE_FORMAT = 1
+
+
+def cues_version(cues: Optional[Mapping[str, Iterable[str]]] = None) -> str:
+    """Tag identifying the cue table and scan limits that produced cached results."""
+    if cues is None:
+        cues = get_lexicon().cues
+    payload = json.dumps({"cues": {k: list(v) for k, v in cues.items()}, "max_bytes": MAX_SCAN_BYTES}, sort_keys=True)
+    return blake2b(payload.encode("utf-8"), digest_size=12).hexdigest()
+
+
+def git_clean_blobs(repo_abs: str) -> Dict[str, str]:
+    """Map repo-relative path -> blob id for tracked files unmodified in the worktree.
+
+    Returns an empty dict outside git repositories.
+    """
+    try:
+        staged = subprocess.run(
+            ["git", "ls-files", "-s", "-z"], cwd=repo_abs, capture_output=True, check=True
+        ).stdout.decode("utf-8", errors="surrogateescape")
+        dirty = subprocess.run(
+            ["git", "diff", "--name-only", "--relative", "-z"], cwd=repo_abs, capture_output=True, check=True
+        ).stdout.decode("utf-8", errors="surrogateescape")
+    except Exception:
+        return {}
+    modified = set(filter(None, dirty.split("\0")))
+    blobs: Dict[str, str] = {}
+    for entry in filter(None, staged.split("\0")):
+        meta, _, rel = entry.partition("\t")
+        mode, sha, stage = meta.split(" ")
+        # skip submodules (160000), conflicted entries and worktree edits
+        if mode != "160000" and stage == "0" and rel not in modified:
+            blobs[rel.replace("/", os.sep)] = sha
+    return blobs
+
+
+def file_content_key(repo_abs: str, rel: str, blobs: Mapping[str, str]) -> Optional[str]:
+    sha = blobs.get(rel)
+    if sha:
+        return "blob:" + sha
+    try:
+        st = os.stat(os.path.join(repo_abs, rel))
+    except OSError:
+        return None
+    return f"stat:{st.st_mtime_ns}:{st.st_size}"
+
+
+def _scan_cache_path(cache_dir: str, repo_abs: str) -> str:
+    h = blake2b(repo_abs.encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(cache_dir, f"pv-scan-{h}.json")
+
+
+def scan_repo_incremental(
+    repo_abs: str,
+    files: Iterable[str],
+    cache_dir: str,
+    git_head: str = "",
+    matcher: Optional[CueMatcher] = None,
+) -> Tuple[Dict[str, float], Dict[str, int]]:
+    """Like scan_repo, but reuses per-file results from the previous run.
+
+    Each file's detected skills are cached under its git blob id (or
+    mtime+size for untracked, modified or non-git files), so only files whose
+    content changed since the last verified head are read again. Every
+    rescanned file is matched against all cues to keep cached entries
+    complete. Returns (detected, {"scanned": n, "reused": m}).
+
+    Memory grows with the file count whatever ``files`` is: the previous
+    and new cache entries and the git blob map hold one entry per file.
+    """
+    matcher = matcher or default_cue_matcher()
+    version = cues_version(matcher._cues)
+    path = _scan_cache_path(cache_dir, repo_abs)
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            cached = json.load(fh)
+        if cached.get("format") != SCAN_CACHE_FORMAT or cached.get("cues_version") != version:
+            cached = {}
+    except (OSError, ValueError):
+        cached = {}
+    old_files: Dict[str, List] = cached.get("files", {})
+
+    blobs = git_clean_blobs(repo_abs)
+    new_files: Dict[str, List] = {}
+    detected: Dict[str, float] = {}
+    stats = {"scanned": 0, "reused": 0}
+    for rel in files:
+        if in_vcs_dir(rel):
+            continue
+        key = file_content_key(repo_abs, rel, blobs)
+        prev = old_files.get(rel)
+        if key is not None and prev is not None and prev[0] == key:
+            skills = prev[1]
+            stats["reused"] += 1
+        else:
+            skills = sorted(scan_file(matcher, repo_abs, rel))
+            stats["scanned"] += 1
+        if key is not None:
+            new_files[rel] = [key, skills]
+        for s in skills:
+            detected[s] = 1.0
+
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump({
+            "format": SCAN_CACHE_FORMAT,
+            "cues_version": version,
+            "repo": repo_abs,
+            "git_head": git_head,
+            "files": new_files,
+        }, fh)
+    os.replace(tmp, path)
+    return detected, stats
@@ -1,47 +1,30 @@
-import json
 import os
-import re
 import subprocess
 from dataclasses import dataclass
-from datetime import datetime
-from hashlib import blake2b
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
+from zk_common.commitments import DomainHasher, batch_to_zk_json as _batch_to_zk_json
+from zk_common.encoding import canonical_dumps
+from zk_common.utils import hash32, normalize_skill_name, now_utc_iso, to_hex32
 
-VERSION = "0.1.0"
-
-
-def canonical_dumps(obj: Any) -> bytes:
-    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode("utf-8")
-
+from .manifest import FileManifest
+from .scanner import iter_repo_files, scan_repo, scan_repo_incremental
 
-def hash32(payload: bytes) -> bytes:
-    h = blake2b(digest_size=32)
-    h.update(payload)
-    return h.digest()
 
+VERSION = "0.1.0"
 
-def to_hex32(b: bytes) -> str:
-    if len(b) != 32:
-        raise ValueError("expected 32-byte value")
-    return "0x" + b.hex()
-
+HASHER = DomainHasher("PV")
 
-def now_utc_iso() -> str:
-    return datetime.utcnow().isoformat() + "Z"
+MANIFEST_MODES = ("list", "merkle")
 
 
 def derive_secret(domain: str, payload_obj: Any, salt: bytes | None = None) -> bytes:
-    domain_prefix = f"PV-{domain}|".encode("utf-8")
-    payload = canonical_dumps(payload_obj)
-    if salt:
-        return hash32(domain_prefix + salt + b"|" + payload)
-    return hash32(domain_prefix + payload)
+    return HASHER.derive_secret(domain, payload_obj, salt)
 
 
 def commitment_from_secret(secret32: bytes) -> bytes:
-    return hash32(b"PV-COMMIT-v1|" + secret32)
+    return HASHER.commitment(secret32)
 
 
 def git_describe(path: str) -> str:
@@ -53,12 +36,7 @@ def git_describe(path: str) -> str:
 
 
 def list_repo_files(path: str) -> List[str]:
-    files = []
-    for root, _, filenames in os.walk(path):
-        for fn in filenames:
-            p = os.path.join(root, fn)
-            files.append(os.path.relpath(p, path))
-    return sorted(files)
+    return sorted(iter_repo_files(path))
 
 
 def read_text_safe(path: str, max_bytes: int = 200_000) -> str:
@@ -70,51 +48,48 @@ def read_text_safe(path: str, max_bytes: int = 200_000) -> str:
         return ""
 
 
-def normalize_skill_name(name: str) -> str:
-    t = name.strip().lower()
-    t = re.sub(r"[^a-z0-9_\-+.#]", "", t)
-    aliases = {
-        "py": "python",
-        "js": "javascript",
-        "ts": "typescript",
-        "sklearn": "scikit-learn",
-        "tf": "tensorflow",
-        "torch": "pytorch",
-    }
-    t = aliases.get(t, t)
-    return t
-
-
-def score_repo_against_requirements(repo_path: str, requirements: Dict[str, float]) -> Tuple[float, Dict[str, Any]]:
+def score_repo_against_requirements(
+    repo_path: str,
+    requirements: Dict[str, float],
+    cache_dir: Optional[str] = None,
+    manifest: str = "list",
+    manifest_sample: int = 0,
+) -> Tuple[float, Dict[str, Any]]:
     """Heuristic: detect skills via filename/content keywords and compute overlap.
 
     requirements: normalized skill -> weight [0,1]
+    cache_dir: if set, per-file detections are cached there and only files
+        changed since the previous run are rescanned
+    manifest: "list" stores every relative path in details["repo"]["files"];
+        "merkle" streams paths into a Merkle root (plus file count and the
+        first ``manifest_sample`` paths) so large trees use constant memory;
+        combined with ``cache_dir`` the per-file scan cache still holds one
+        entry per file, so only uncached "merkle" runs are constant-memory
     Returns (coverage_score, details)
     """
+    if manifest not in MANIFEST_MODES:
+        raise ValueError(f"unknown manifest mode: {manifest}")
     repo_abs = os.path.abspath(repo_path)
-    file_list = list_repo_files(repo_abs)
-    detected: Dict[str, float] = {}
-
-    keywords = {
-        "python": [".py", "python"],
-        "javascript": [".js", "javascript"],
-        "typescript": [".ts", "typescript"],
-        "docker": ["dockerfile", "docker-compose", "FROM "],
-        "kubernetes": ["k8s", "apiVersion:", "kind:"],
-        "pandas": ["import pandas", "read_csv("],
-        "numpy": ["import numpy", "np."],
-        "pytorch": ["import torch", "torch."],
-        "tensorflow": ["import tensorflow", "tf."],
-    }
-
-    # Simple heuristic: any match gives confidence 1.0 for that skill
-    for rel in file_list:
-        lower = rel.lower()
-        abspath = os.path.join(repo_abs, rel)
-        text = read_text_safe(abspath)
-        for skill, cues in keywords.items():
-            if any(cue.lower() in lower for cue in cues) or any(cue.lower() in text.lower() for cue in cues):
-                detected[skill] = max(1.0, detected.get(skill, 0.0))
+    git_head = git_describe(repo_abs)
+    repo_details: Dict[str, Any] = {"path": repo_abs, "git_head": git_head}
+
+    if manifest == "merkle":
+        tracker = FileManifest(sample_size=manifest_sample)
+        files = tracker.track(iter_repo_files(repo_abs))
+    else:
+        files = list_repo_files(repo_abs)
+        repo_details["files"] = files
+
+    # Any cue in a file's path or (non-binary) contents gives confidence 1.0
+    if cache_dir:
+        detected, _ = scan_repo_incremental(repo_abs, files, cache_dir, git_head=git_head)
+    else:
+        detected = scan_repo(repo_abs, files)
+
+    if manifest == "merkle":
+        for _ in files:  # the scan may stop early; the manifest must see every path
+            pass
+        repo_details.update(tracker.to_details())
 
     # Compute coverage against requirements
     req = {normalize_skill_name(k): max(0.0, min(1.0, float(v))) for k, v in requirements.items()}
@@ -134,11 +109,7 @@ def score_repo_against_requirements(repo_path: str, requirements: Dict[str, floa
 
     coverage = overlap / denom
     details = {
-        "repo": {
-            "path": repo_abs,
-            "git_head": git_describe(repo_abs),
-            "files": file_list,
-        },
+        "repo": repo_details,
         "requirements": req,
         "detected_skills": sorted(list(detected.keys())),
         "per_skill": per_skill,
@@ -161,18 +132,29 @@ class VerificationResult:
     submission_secret: bytes
     nullifier_secret: bytes
 
-    def to_zk_json(self) -> Dict[str, Any]:
+    def zk_secrets(self) -> List[bytes]:
+        return [self.job_secret, self.submission_secret]
+
+    def to_zk_json(
+        self,
+        generated_at: Optional[str] = None,
+        commitments: Optional[Mapping[bytes, bytes]] = None,
+    ) -> Dict[str, Any]:
+        def commit(secret: bytes) -> str:
+            c = commitments.get(secret) if commitments else None
+            return to_hex32(c or commitment_from_secret(secret))
+
         return {
             "module": "ProjectVerification",
             "version": VERSION,
-            "generated_at": now_utc_iso(),
+            "generated_at": generated_at or now_utc_iso(),
             "ids": {"job_id": self.job_id, "submission_id": self.submission_id, "worker_id": self.worker_id},
             "public": {
                 "coverage": round(self.coverage, 6),
                 "threshold": self.threshold,
                 "passed": self.passed,
-                "job_commitment": to_hex32(commitment_from_secret(self.job_secret)),
-                "submission_commitment": to_hex32(commitment_from_secret(self.submission_secret)),
+                "job_commitment": commit(self.job_secret),
+                "submission_commitment": commit(self.submission_secret),
                 "release_nullifier": to_hex32(self.nullifier_secret),
             },
             "witness": {
@@ -186,3 +168,6 @@ class VerificationResult:
         }
 
 
+def batch_to_zk_json(results: Sequence[VerificationResult]) -> List[Dict[str, Any]]:
+    """to_zk_json for many results with a shared timestamp and one commitment pass."""
+    return _batch_to_zk_json(results, HASHER, now_utc_iso)
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import csv
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from .core import adjust_reputation, clamp01
+from .utils import ReputationResult
+
+EVENT_COLUMNS = ("worker_id", "job_complexity", "employer_rating", "verified_projects")
+
+
+@dataclass
+class EventLog:
+    """Columnar reputation events; row order is the order events are applied."""
+
+    worker_id: np.ndarray
+    job_complexity: np.ndarray
+    employer_rating: np.ndarray
+    verified_projects: np.ndarray
+
+    @classmethod
+    def from_columns(
+        cls,
+        worker_id: Sequence[str],
+        job_complexity: Sequence[float],
+        employer_rating: Sequence[float],
+        verified_projects: Sequence[int],
+    ) -> "EventLog":
+        log = cls(
+            worker_id=np.asarray(worker_id, dtype=str),
+            job_complexity=np.asarray(job_complexity, dtype=np.float64),
+            employer_rating=np.asarray(employer_rating, dtype=np.float64),
+            verified_projects=np.asarray(verified_projects).astype(np.int64),
+        )
+        n = len(log.worker_id)
+        if any(len(col) != n for col in (log.job_complexity, log.employer_rating, log.verified_projects)):
+            raise ValueError("event columns must have equal length")
+        if np.isnan(log.job_complexity).any() or np.isnan(log.employer_rating).any():
+            raise ValueError("event log contains NaN complexity or rating")
+        return log
+
+    def __len__(self) -> int:
+        return len(self.worker_id)
+
+
+def load_event_log(path: str, fmt: Optional[str] = None) -> EventLog:
+    """Load events from CSV, NumPy ``.npz`` or Parquet (needs pyarrow).
+
+    The format is taken from the file extension unless ``fmt`` is given.
+    Every format must provide the columns in ``EVENT_COLUMNS``.
+    """
+    fmt = (fmt or os.path.splitext(path)[1].lstrip(".")).lower()
+    if fmt == "csv":
+        cols: Dict[str, List[str]] = {c: [] for c in EVENT_COLUMNS}
+        with open(path, "r", encoding="utf-8", newline="") as fh:
+            for row in csv.DictReader(fh):
+                for c in EVENT_COLUMNS:
+                    cols[c].append(row[c])
+        cols["verified_projects"] = [int(v) for v in cols["verified_projects"]]
+        return EventLog.from_columns(**cols)
+    if fmt == "npz":
+        with np.load(path, allow_pickle=False) as data:
+            return EventLog.from_columns(**{c: data[c] for c in EVENT_COLUMNS})
+    if fmt == "parquet":
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise RuntimeError("reading Parquet event logs requires pyarrow") from e
+        table = pq.read_table(path, columns=list(EVENT_COLUMNS))
+        return EventLog.from_columns(**{c: table.column(c).to_numpy(zero_copy_only=False) for c in EVENT_COLUMNS})
+    raise ValueError(f"unsupported event log format: {fmt!r} (expected csv, npz or parquet)")
+
+
+def _clip01(x: np.ndarray) -> np.ndarray:
+    return np.maximum(0.0, np.minimum(1.0, x))
+
+
+def replay_events(
+    log: EventLog,
+    initial: Optional[Mapping[str, float]] = None,
+    default_base: float = 0.5,
+) -> List[ReputationResult]:
+    """Fold every worker's events in order and return one result per worker.
+
+    Equivalent to calling ``adjust_reputation`` once per event with the
+    previous call's ``new_reputation`` as the next base, starting from
+    ``initial.get(worker_id, default_base)``. Each event's adjustment does
+    not depend on the base, so it is computed for the whole log at once;
+    the base recurrence then advances one step per round, across every
+    worker that still has events, using the same float operations as the
+    scalar rule. The returned result (secrets, details) is the scalar
+    function applied to each worker's last event, sorted by worker_id.
+    """
+    initial = initial or {}
+    if not len(log):
+        return []
+    workers, codes = np.unique(log.worker_id, return_inverse=True)
+
+    complexity = _clip01(log.job_complexity)
+    rating = _clip01(log.employer_rating)
+    projects = np.maximum(1, np.maximum(0, log.verified_projects))
+    project_factor = 1.0 - np.power(0.5, projects.astype(np.float64))
+    adjustment = 0.4 * complexity + 0.4 * rating + 0.2 * project_factor
+
+    # Rank of each event within its worker; round r applies every rank-r event.
+    by_worker = np.argsort(codes, kind="stable")
+    counts = np.bincount(codes, minlength=len(workers))
+    starts = np.cumsum(counts) - counts
+    rank = np.empty(len(codes), dtype=np.int64)
+    rank[by_worker] = np.arange(len(codes)) - np.repeat(starts, counts)
+    by_round = by_worker[np.argsort(rank[by_worker], kind="stable")]
+    round_ends = np.cumsum(np.bincount(rank))
+
+    state = np.array([clamp01(initial.get(w, default_base)) for w in workers.tolist()], dtype=np.float64)
+    prev = state.copy()
+    lo = 0
+    for hi in round_ends:
+        idx = by_round[lo:hi]
+        w = codes[idx]
+        prev[w] = state[w]
+        state[w] = _clip01(0.7 * state[w] + 0.3 * adjustment[idx])
+        lo = hi
+
+    last_event = by_worker[starts + counts - 1]
+    results: List[ReputationResult] = []
+    for i, worker_id in enumerate(workers.tolist()):
+        e = last_event[i]
+        results.append(adjust_reputation(
+            worker_id=worker_id,
+            base_reputation=float(prev[i]),
+            job_complexity=float(log.job_complexity[e]),
+            employer_rating=float(log.employer_rating[e]),
+            verified_projects=int(log.verified_projects[e]),
+        ))
+    return results
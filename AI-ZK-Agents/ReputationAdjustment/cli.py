@@ -1,8 +1,10 @@
 import argparse
+import json
 import sys
 
 from .core import adjust_reputation
-from .utils import canonical_dumps
+from .store import ReputationStore
+from .utils import batch_to_zk_json, canonical_dumps
 
 
 def main(argv=None):
@@ -10,14 +12,87 @@ def main(argv=None):
         prog="reputation-adjustment",
         description="Adjust reputation from job complexity, employer rating, and verified projects; emit ZK-friendly JSON",
     )
-    parser.add_argument("--worker-id", required=True)
-    parser.add_argument("--base-reputation", type=float, required=True)
-    parser.add_argument("--job-complexity", type=float, required=True)
-    parser.add_argument("--employer-rating", type=float, required=True)
-    parser.add_argument("--verified-projects", type=int, required=True)
+    parser.add_argument("--worker-id")
+    parser.add_argument("--base-reputation", type=float, help="Starting reputation (default for every worker with --events)")
+    parser.add_argument("--job-complexity", type=float)
+    parser.add_argument("--employer-rating", type=float)
+    parser.add_argument("--verified-projects", type=int)
+    parser.add_argument(
+        "--events",
+        help="Replay an event log (CSV, .npz or Parquet with worker_id, job_complexity, "
+        "employer_rating, verified_projects columns); one JSON line per worker",
+    )
+    parser.add_argument("--events-format", choices=["csv", "npz", "parquet"], help="Event log format (default: from extension)")
+    parser.add_argument("--bases", help="JSON file mapping worker_id -> starting reputation for --events")
+    parser.add_argument(
+        "--store",
+        help="Reputation store directory; the event is logged and applied to the worker's stored "
+        "reputation, so --base-reputation is optional (it resets the base when given)",
+    )
+    parser.add_argument("--default-base", type=float, default=0.5, help="Starting reputation for new workers in a new --store")
+    parser.add_argument("--snapshot-every", type=int, default=0, help="Snapshot the --store state every N events (0 = never)")
+    parser.add_argument("--snapshot", action="store_true", help="Snapshot the --store state and exit")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the --store state from its latest snapshot and exit")
 
     args = parser.parse_args(argv)
 
+    if args.store:
+        with ReputationStore(args.store, default_base=args.default_base, snapshot_every=args.snapshot_every) as store:
+            if args.snapshot or args.rebuild:
+                summary = {"workers": len(store), "events": store.event_count}
+                if args.rebuild:
+                    summary["replayed"] = store.rebuild()
+                if args.snapshot:
+                    summary["snapshot"] = store.snapshot()
+                sys.stdout.write(canonical_dumps(summary).decode("utf-8") + "\n")
+                return
+            missing = [opt for opt, val in (
+                ("--worker-id", args.worker_id),
+                ("--job-complexity", args.job_complexity),
+                ("--employer-rating", args.employer_rating),
+                ("--verified-projects", args.verified_projects),
+            ) if val is None]
+            if missing:
+                parser.error("the following arguments are required: " + ", ".join(missing))
+            try:
+                res = store.apply(
+                    worker_id=args.worker_id,
+                    job_complexity=args.job_complexity,
+                    employer_rating=args.employer_rating,
+                    verified_projects=args.verified_projects,
+                    base_reputation=args.base_reputation,
+                )
+            except ValueError as e:
+                parser.error(str(e))
+        sys.stdout.write(canonical_dumps(res.to_zk_json()).decode("utf-8") + "\n")
+        return
+
+    if args.events:
+        from .bulk import load_event_log, replay_events  # numpy; only bulk replay needs it
+
+        initial = {}
+        if args.bases:
+            with open(args.bases, "r", encoding="utf-8") as fh:
+                initial = json.load(fh)
+        default_base = 0.5 if args.base_reputation is None else args.base_reputation
+        try:
+            log = load_event_log(args.events, args.events_format)
+        except (OSError, ValueError, KeyError) as e:
+            parser.error(f"cannot read event log: {e}")
+        for out in batch_to_zk_json(replay_events(log, initial, default_base)):
+            sys.stdout.write(canonical_dumps(out).decode("utf-8") + "\n")
+        return
+
+    missing = [opt for opt, val in (
+        ("--worker-id", args.worker_id),
+        ("--base-reputation", args.base_reputation),
+        ("--job-complexity", args.job_complexity),
+        ("--employer-rating", args.employer_rating),
+        ("--verified-projects", args.verified_projects),
+    ) if val is None]
+    if missing:
+        parser.error("the following arguments are required: " + ", ".join(missing))
+
     res = adjust_reputation(
         worker_id=args.worker_id,
         base_reputation=args.base_reputation,
@@ -0,0 +1,363 @@
+from __future__ import annotations
+
+import glob
+import math
+import mmap
+import os
+import shutil
+import struct
+from hashlib import blake2b
+from typing import Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # not POSIX: stores are not protected against concurrent writers
+    fcntl = None
+
+from .core import adjust_reputation
+from .utils import ReputationResult
+
+WORKER_ID_BYTES = 64
+
+# events.log: header (magic, default base for new workers), then fixed-width records
+# (worker_id, base or NaN to continue from stored state, complexity, rating, projects)
+LOG_MAGIC = b"RAEVLOG1"
+LOG_HEADER = struct.Struct("<8sd")
+EVENT = struct.Struct(f"<{WORKER_ID_BYTES}sdddq")
+
+# state.tbl: header, then an open-addressing table of
+# (worker_id, reputation, log sequence of its last event, last adjustment_secret) slots
+TABLE_MAGIC = b"RASTATE1"
+HEADER = struct.Struct("<8sQQQ")  # magic, capacity, count, events_applied
+SLOT = struct.Struct(f"<{WORKER_ID_BYTES}sdQ32s")
+MAX_LOAD = 0.7
+
+Event = Tuple[str, Optional[float], float, float, int]
+
+
+def _encode_worker_id(worker_id: str) -> bytes:
+    raw = worker_id.encode("utf-8")
+    if not raw or len(raw) > WORKER_ID_BYTES or b"\0" in raw:
+        raise ValueError(f"worker_id must be 1-{WORKER_ID_BYTES} UTF-8 bytes without NUL: {worker_id!r}")
+    return raw.ljust(WORKER_ID_BYTES, b"\0")
+
+
+def _slot_hash(key: bytes) -> int:
+    return int.from_bytes(blake2b(key, digest_size=8).digest(), "little")
+
+
+class StateTable:
+    """Memory-mapped worker_id -> (reputation, last_seq, adjustment_secret) table.
+
+    Fixed-width slots with linear probing; capacity is a power of two and
+    the file is rebuilt at double size when the load factor exceeds
+    ``MAX_LOAD``. Lookups touch only the probed slots, so the table can
+    hold millions of workers without being read into memory. Growing fills
+    and fsyncs the new table before it replaces the old file, so a crash
+    mid-grow leaves the previous table intact.
+    """
+
+    def __init__(self, path: str, capacity: int = 1024) -> None:
+        self.path = path
+        if not os.path.exists(path):
+            self._create(path, max(8, 1 << (capacity - 1).bit_length()))
+        self._open()
+
+    @staticmethod
+    def _create(path: str, capacity: int, events_applied: int = 0) -> None:
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as fh:
+            fh.write(HEADER.pack(TABLE_MAGIC, capacity, 0, events_applied))
+            fh.truncate(HEADER.size + capacity * SLOT.size)
+        os.replace(tmp, path)
+
+    def _open(self) -> None:
+        self._fh = open(self.path, "r+b")
+        self._mm = mmap.mmap(self._fh.fileno(), 0)
+        magic, self.capacity, self.count, self.events_applied = HEADER.unpack_from(self._mm, 0)
+        if magic != TABLE_MAGIC:
+            raise ValueError(f"{self.path} is not a reputation state table")
+
+    def close(self) -> None:
+        self.flush()
+        self._mm.close()
+        self._fh.close()
+
+    def _write_header(self) -> None:
+        HEADER.pack_into(self._mm, 0, TABLE_MAGIC, self.capacity, self.count, self.events_applied)
+
+    def set_events_applied(self, n: int) -> None:
+        self.events_applied = n
+        self._write_header()
+
+    def flush(self) -> None:
+        self._write_header()
+        self._mm.flush()
+
+    def sync(self) -> None:
+        """flush() and fsync the file, so its contents survive a crash."""
+        self.flush()
+        os.fsync(self._fh.fileno())
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _find(self, key: bytes) -> Tuple[int, bool]:
+        """Offset of ``key``'s slot (or the empty slot it would take) and whether it exists."""
+        mask = self.capacity - 1
+        i = _slot_hash(key) & mask
+        while True:
+            off = HEADER.size + i * SLOT.size
+            stored = self._mm[off:off + WORKER_ID_BYTES]
+            if stored == key:
+                return off, True
+            if stored[0] == 0:
+                return off, False
+            i = (i + 1) & mask
+
+    def get(self, worker_id: str) -> Optional[Tuple[float, int, bytes]]:
+        off, found = self._find(_encode_worker_id(worker_id))
+        if not found:
+            return None
+        _, rep, seq, secret = SLOT.unpack_from(self._mm, off)
+        return rep, seq, secret
+
+    def put(self, worker_id: str, reputation: float, seq: int, secret: bytes) -> None:
+        key = _encode_worker_id(worker_id)
+        off, found = self._find(key)
+        if not found:
+            if (self.count + 1) > self.capacity * MAX_LOAD:
+                self._grow()
+                off, _ = self._find(key)
+            self.count += 1
+        SLOT.pack_into(self._mm, off, key, reputation, seq, secret)
+
+    def items(self) -> Iterator[Tuple[str, float, int, bytes]]:
+        for i in range(self.capacity):
+            key, rep, seq, secret = SLOT.unpack_from(self._mm, HEADER.size + i * SLOT.size)
+            if key[0]:
+                yield key.rstrip(b"\0").decode("utf-8"), rep, seq, secret
+
+    def _grow(self) -> None:
+        grown_path = self.path + ".grow"
+        if os.path.exists(grown_path):
+            os.unlink(grown_path)  # left over from an interrupted grow
+        grown = StateTable(grown_path, capacity=self.capacity * 2)
+        try:
+            for worker_id, rep, seq, secret in self.items():
+                grown.put(worker_id, rep, seq, secret)
+            grown.events_applied = self.events_applied
+            grown.sync()
+        finally:
+            grown.close()
+        self.close()
+        os.replace(grown_path, self.path)
+        _fsync_dir(os.path.dirname(os.path.abspath(self.path)))
+        self._open()
+
+
+def _fsync_dir(path: str) -> None:
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class ReputationStore:
+    """Persistent reputation state: append-only event log + mmap state table.
+
+    ``apply`` appends the event to ``events.log`` and then updates the
+    worker's slot in ``state.tbl``, so each event costs one append and one
+    table probe. ``snapshot`` copies the table as of the current log
+    position; ``rebuild`` restores the newest snapshot and replays only the
+    events logged after it.
+
+    ``default_base`` (the starting reputation of workers first seen without
+    an explicit base) is fixed when the store is created and recorded in
+    the log header. On open, events logged but not yet reflected in the
+    table (e.g. after a crash) are replayed automatically; each slot records
+    the log sequence of its last event, so replaying an event that already
+    reached the table is a no-op.
+
+    An open store holds an exclusive lock on ``<path>/store.lock``; a second
+    writer on the same directory blocks until the first one closes it.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        default_base: float = 0.5,
+        capacity: int = 1024,
+        snapshot_every: int = 0,
+        keep_snapshots: int = 2,
+    ) -> None:
+        self.path = path
+        self.snapshot_every = snapshot_every
+        self.keep_snapshots = keep_snapshots
+        os.makedirs(path, exist_ok=True)
+        self._lock = self._acquire_lock(os.path.join(path, "store.lock"))
+        self._log_path = os.path.join(path, "events.log")
+        self._table_path = os.path.join(path, "state.tbl")
+        self._log = self._open_log(default_base)
+        self.table = StateTable(self._table_path, capacity=capacity)
+        if self.table.events_applied > self.event_count:
+            self.rebuild()
+        elif self.table.events_applied < self.event_count:
+            self._replay(self.table.events_applied)
+
+    @staticmethod
+    def _acquire_lock(path: str):
+        fh = open(path, "a+b")
+        if fcntl is not None:
+            try:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+            except BaseException:
+                fh.close()
+                raise
+        return fh
+
+    def _open_log(self, default_base: float):
+        fh = open(self._log_path, "a+b")
+        fh.seek(0, os.SEEK_END)
+        size = fh.tell()
+        if size < LOG_HEADER.size:
+            fh.truncate(0)
+            fh.write(LOG_HEADER.pack(LOG_MAGIC, default_base))
+            fh.flush()
+            size = LOG_HEADER.size
+        fh.seek(0)
+        magic, self.default_base = LOG_HEADER.unpack(fh.read(LOG_HEADER.size))
+        if magic != LOG_MAGIC:
+            raise ValueError(f"{self._log_path} is not a reputation event log")
+        torn = (size - LOG_HEADER.size) % EVENT.size
+        if torn:  # drop a partially written trailing record
+            fh.truncate(size - torn)
+        fh.seek(0, os.SEEK_END)
+        return fh
+
+    def __enter__(self) -> "ReputationStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        try:
+            self.table.close()
+            self._log.close()
+        finally:
+            self._lock.close()  # releases the flock
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    @property
+    def event_count(self) -> int:
+        return (os.fstat(self._log.fileno()).st_size - LOG_HEADER.size) // EVENT.size
+
+    def get(self, worker_id: str) -> Optional[Tuple[float, bytes]]:
+        """Current (reputation, last adjustment_secret) for a worker, if known."""
+        entry = self.table.get(worker_id)
+        return None if entry is None else (entry[0], entry[2])
+
+    def events(self, start: int = 0) -> Iterator[Event]:
+        """Logged events from index ``start`` on; base is None unless the event reset it."""
+        with open(self._log_path, "rb") as fh:
+            fh.seek(LOG_HEADER.size + start * EVENT.size)
+            while True:
+                raw = fh.read(EVENT.size)
+                if len(raw) < EVENT.size:
+                    return
+                key, base, complexity, rating, projects = EVENT.unpack(raw)
+                yield (
+                    key.rstrip(b"\0").decode("utf-8"),
+                    None if math.isnan(base) else base,
+                    complexity,
+                    rating,
+                    projects,
+                )
+
+    def _fold(self, event: Event, seq: int) -> Optional[ReputationResult]:
+        """Apply the event logged at 1-based position ``seq``; None if already applied."""
+        worker_id, base, complexity, rating, projects = event
+        entry = self.table.get(worker_id)
+        res = None
+        if entry is None or entry[1] < seq:
+            if base is None:
+                base = entry[0] if entry is not None else self.default_base
+            res = adjust_reputation(worker_id, base, complexity, rating, projects)
+            self.table.put(worker_id, res.new_reputation, seq, res.adjustment_secret)
+        self.table.set_events_applied(seq)
+        return res
+
+    def apply(
+        self,
+        worker_id: str,
+        job_complexity: float,
+        employer_rating: float,
+        verified_projects: int,
+        base_reputation: Optional[float] = None,
+    ) -> ReputationResult:
+        """Record one event and fold it into the worker's stored reputation.
+
+        ``base_reputation`` overrides the stored value (or the store default
+        for a new worker) as the starting point of this event.
+        """
+        event = (worker_id, base_reputation, float(job_complexity), float(employer_rating), int(verified_projects))
+        self._log.write(EVENT.pack(
+            _encode_worker_id(worker_id),
+            math.nan if base_reputation is None else float(base_reputation),
+            *event[2:],
+        ))
+        self._log.flush()
+        res = self._fold(event, self.event_count)
+        if self.snapshot_every and self.table.events_applied % self.snapshot_every == 0:
+            self.snapshot()
+        return res
+
+    def _replay(self, start: int) -> int:
+        n = 0
+        for n, event in enumerate(self.events(start), 1):
+            self._fold(event, start + n)
+        self.table.flush()
+        return n
+
+    def snapshots(self) -> List[Tuple[int, str]]:
+        """(events_applied, path) of every snapshot, oldest first."""
+        out = []
+        for p in glob.glob(os.path.join(self.path, "snapshot-*.tbl")):
+            stem = os.path.basename(p)[len("snapshot-"):-len(".tbl")]
+            if stem.isdigit():
+                out.append((int(stem), p))
+        return sorted(out)
+
+    def snapshot(self) -> str:
+        """Copy the state table as of the current log position; prunes old snapshots."""
+        self.table.flush()
+        path = os.path.join(self.path, f"snapshot-{self.table.events_applied:012d}.tbl")
+        tmp = path + ".tmp"
+        shutil.copyfile(self._table_path, tmp)
+        os.replace(tmp, path)
+        if self.keep_snapshots > 0:
+            for _, old in self.snapshots()[:-self.keep_snapshots]:
+                os.unlink(old)
+        return path
+
+    def rebuild(self) -> int:
+        """Restore the newest usable snapshot and replay later events; returns events replayed."""
+        self.table.close()
+        usable = [(n, p) for n, p in self.snapshots() if n <= self.event_count]
+        if usable:
+            tmp = self._table_path + ".tmp"
+            shutil.copyfile(usable[-1][1], tmp)
+            os.replace(tmp, self._table_path)
+        else:
+            os.unlink(self._table_path)
+        self.table = StateTable(self._table_path)
+        return self._replay(self.table.events_applied)
@@ -1,43 +1,22 @@
-import json
 from dataclasses import dataclass
-from datetime import datetime
-from hashlib import blake2b
-from typing import Any, Dict
+from typing import Any, Dict, List, Mapping, Optional, Sequence
 
+from zk_common.commitments import DomainHasher, batch_to_zk_json as _batch_to_zk_json
+from zk_common.encoding import canonical_dumps
+from zk_common.utils import hash32, now_utc_iso, to_hex32
 
-VERSION = "0.1.0"
-
-
-def canonical_dumps(obj: Any) -> bytes:
-    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode("utf-8")
-
-
-def hash32(payload: bytes) -> bytes:
-    h = blake2b(digest_size=32)
-    h.update(payload)
-    return h.digest()
-
-
-def to_hex32(b: bytes) -> str:
-    if len(b) != 32:
-        raise ValueError("expected 32-byte value")
-    return "0x" + b.hex()
 
+VERSION = "0.1.0"
 
-def now_utc_iso() -> str:
-    return datetime.utcnow().isoformat() + "Z"
+HASHER = DomainHasher("RA")
 
 
 def derive_secret(domain: str, payload_obj: Any, salt: bytes | None = None) -> bytes:
-    domain_prefix = f"RA-{domain}|".encode("utf-8")
-    payload = canonical_dumps(payload_obj)
-    if salt:
-        return hash32(domain_prefix + salt + b"|" + payload)
-    return hash32(domain_prefix + payload)
+    return HASHER.derive_secret(domain, payload_obj, salt)
 
 
 def commitment_from_secret(secret32: bytes) -> bytes:
-    return hash32(b"RA-COMMIT-v1|" + secret32)
+    return HASHER.commitment(secret32)
 
 
 @dataclass
@@ -52,16 +31,27 @@ class ReputationResult:
     worker_secret: bytes
     adjustment_secret: bytes
 
-    def to_zk_json(self) -> Dict[str, Any]:
+    def zk_secrets(self) -> List[bytes]:
+        return [self.worker_secret, self.adjustment_secret]
+
+    def to_zk_json(
+        self,
+        generated_at: Optional[str] = None,
+        commitments: Optional[Mapping[bytes, bytes]] = None,
+    ) -> Dict[str, Any]:
+        def commit(secret: bytes) -> str:
+            c = commitments.get(secret) if commitments else None
+            return to_hex32(c or commitment_from_secret(secret))
+
         return {
             "module": "RepurationAdjustment",
             "version": VERSION,
-            "generated_at": now_utc_iso(),
+            "generated_at": generated_at or now_utc_iso(),
             "ids": {"worker_id": self.worker_id},
             "public": {
                 "new_reputation": round(self.new_reputation, 6),
-                "worker_commitment": to_hex32(commitment_from_secret(self.worker_secret)),
-                "adjustment_commitment": to_hex32(commitment_from_secret(self.adjustment_secret)),
+                "worker_commitment": commit(self.worker_secret),
+                "adjustment_commitment": commit(self.adjustment_secret),
             },
             "witness": {
                 "worker_secret": to_hex32(self.worker_secret),
@@ -73,3 +63,6 @@ class ReputationResult:
         }
 
 
+def batch_to_zk_json(results: Sequence[ReputationResult]) -> List[Dict[str, Any]]:
+    """to_zk_json for many results with a shared timestamp and one commitment pass."""
+    return _batch_to_zk_json(results, HASHER, now_utc_iso)
@@ -0,0 +1,60 @@
+import os, json, tempfile, time
+from hashlib import blake2b
+from .config import CACHE_DIR
+from .telemetry import incr
+
+def cache_key(*parts):
+    """Stable string key for a tuple of JSON-serializable parts."""
+    return json.dumps(parts, ensure_ascii=False, separators=(",", ":"), sort_keys=True, default=str)
+
+class DiskCache:
+    """Content-addressed JSON store: one file per key under <root>/<namespace>.
+
+    Keys are hashed with blake2b so any string is a valid key; values must be
+    JSON-serializable. Writes go through a temp file + rename so concurrent
+    readers never see partial entries. ``max_age`` (seconds) on ``get``
+    treats older entries as missing. Lookups are counted in the
+    ``zk_cache_requests_total`` telemetry counter unless ``track`` is false.
+    """
+
+    def __init__(self, namespace, root=None, track=True):
+        self.namespace = namespace
+        self.track = track
+        self.dir = os.path.join(root or CACHE_DIR, namespace)
+
+    def _path(self, key):
+        h = blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.dir, h[:2], h + ".json")
+
+    def get(self, key, default=None, max_age=None):
+        entry = self._load(key, max_age)
+        if self.track:
+            incr("zk_cache_requests_total", namespace=self.namespace, result="miss" if entry is None else "hit")
+        return default if entry is None else entry["value"]
+
+    def _load(self, key, max_age):
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as fh:
+                entry = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        if entry.get("key") != key:
+            return None
+        if max_age is not None and time.time() - entry.get("at", 0) > max_age:
+            return None
+        return entry
+
+    def set(self, key, value):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump({"key": key, "at": time.time(), "value": value}, fh, ensure_ascii=False)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
@@ -0,0 +1,78 @@
+import json, threading
+from hashlib import blake2b
+from .cache import DiskCache, cache_key
+from zk_common.lexicon import get_lexicon
+from .config import LLM_MODEL, CANONICAL_CACHE_TTL, CACHE_ENABLED
+
+MISSING = object()
+
+def mapping_version(model=LLM_MODEL, lexicon_version=None):
+    """Version tag for cached mappings; changes with the LLM model or lexicon."""
+    lexicon_version = lexicon_version or get_lexicon().version
+    payload = json.dumps({"model": model, "lexicon": lexicon_version}, sort_keys=True).encode("utf-8")
+    return blake2b(payload, digest_size=12).hexdigest()
+
+class CanonicalMappingStore:
+    """Persistent raw token -> canonical skill mapping learned from the LLM.
+
+    Entries are keyed by (version, allowed skills, token) and expire after
+    ``ttl`` seconds. Tokens the LLM mapped to NONE are remembered too, so a
+    token only reaches the LLM once per version. ``lexicon_version``
+    defaults to the live shared lexicon, so a lexicon reload starts a new
+    version. ``hits``/``misses`` count lookups over the life of the store.
+    """
+
+    def __init__(self, cache=None, ttl=CANONICAL_CACHE_TTL, model=LLM_MODEL, lexicon_version=None):
+        self.cache = cache if cache is not None else DiskCache("canonical_map")
+        self.ttl = ttl
+        self.model = model
+        self.lexicon_version = lexicon_version
+        self._versions = {}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def version(self):
+        lv = self.lexicon_version or get_lexicon().version
+        v = self._versions.get(lv)
+        if v is None:
+            v = self._versions[lv] = mapping_version(self.model, lv)
+        return v
+
+    def _key(self, token, allowed):
+        return cache_key(self.version, sorted(allowed), token)
+
+    def lookup(self, token, allowed):
+        """Return the cached mapping dict, None for a cached NONE, or MISSING."""
+        entry = self.cache.get(self._key(token, allowed), max_age=self.ttl)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return MISSING
+            self.hits += 1
+        return entry["mapping"]
+
+    def store(self, token, allowed, mapping):
+        try:
+            self.cache.set(self._key(token, allowed), {"mapping": mapping})
+        except OSError:
+            pass
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            }
+
+_store = None
+
+def get_mapping_store():
+    """Process-wide store, or None when caching is disabled."""
+    global _store
+    if _store is None and CACHE_ENABLED:
+        _store = CanonicalMappingStore()
+    return _store
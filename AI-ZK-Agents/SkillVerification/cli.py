@@ -0,0 +1,34 @@
+import argparse, json, sys
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="skill-verification",
+        description="Collect resume, GitHub and Kaggle evidence for a candidate and score lexicon skills",
+    )
+    parser.add_argument("--candidate-id", required=True)
+    parser.add_argument("--resume", action="append", dest="resumes", help="Path to a resume PDF (repeatable)")
+    parser.add_argument("--github", help="GitHub username to scan")
+    parser.add_argument("--kaggle", action="append", dest="kaggle_urls", help="Kaggle notebook URL (repeatable)")
+    parser.add_argument("--compact", action="store_true", help="Print one JSON line instead of indented JSON")
+    args = parser.parse_args(argv)
+    if not (args.resumes or args.github or args.kaggle_urls):
+        parser.error("at least one of --resume, --github or --kaggle is required")
+
+    # .env may set OPENAI_API_KEY / GITHUB_TOKEN, which config reads at import
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
+    from .core import run_for_candidate
+
+    result = run_for_candidate(
+        candidate_id=args.candidate_id,
+        resume_paths=args.resumes,
+        github_username=args.github,
+        kaggle_urls=args.kaggle_urls,
+    )
+    sys.stdout.write(json.dumps(result, indent=None if args.compact else 2) + "\n")
+
+if __name__ == "__main__":
+    main()
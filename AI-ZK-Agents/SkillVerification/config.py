@@ -1,22 +1,50 @@
 import os
 import math
+from zk_common.lexicon import get_lexicon
+
+CACHE_DIR = os.getenv("ZK_AGENTS_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "zk-agents"))
+CACHE_ENABLED = os.getenv("ZK_AGENTS_CACHE", "1") != "0"
+
+TRANSPORT_MODE = os.getenv("ZK_TRANSPORT", "live")  # "live", "record" or "replay"
+CASSETTE_DIR = os.getenv("ZK_CASSETTE_DIR", os.path.join(CACHE_DIR, "cassettes"))
+REPLAY_LATENCY_MS = os.getenv("ZK_REPLAY_LATENCY_MS", "0")  # "40" or "github=30,openai=400,20"
+TELEMETRY_JSONL = os.getenv("ZK_TELEMETRY_JSONL")  # append finished spans to this file
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-USE_OPENAI = bool(OPENAI_API_KEY)
+# replaying a cassette with recorded OpenAI calls exercises the LLM paths without a key
+USE_OPENAI = bool(OPENAI_API_KEY) or (
+    TRANSPORT_MODE == "replay" and os.path.isdir(os.path.join(CASSETTE_DIR, "openai.chat"))
+)
 
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")  #
 
 MAX_REPOS = 12
+GITHUB_WORKERS = int(os.getenv("GITHUB_WORKERS", "6"))
+KAGGLE_WORKERS = int(os.getenv("KAGGLE_WORKERS", "8"))
+KAGGLE_PER_HOST = int(os.getenv("KAGGLE_PER_HOST", "4"))  # concurrent requests per host
+KAGGLE_TIMEOUT = float(os.getenv("KAGGLE_TIMEOUT", "10"))
+RESUME_WORKERS = int(os.getenv("RESUME_WORKERS", "4"))
+RESUME_PAGES_PER_TASK = int(os.getenv("RESUME_PAGES_PER_TASK", "8"))
+RESUME_STOP_EARLY = os.getenv("RESUME_STOP_EARLY", "0") == "1"  # stop reading pages once the skills section is found
+# seconds each evidence source may take in run_for_candidate (0 = no limit);
+# a source past its deadline is reported as incomplete and scoring goes on without it
+SOURCE_DEADLINES = {
+    "resume": float(os.getenv("RESUME_DEADLINE", "0")),
+    "github": float(os.getenv("GITHUB_DEADLINE", "0")),
+    "kaggle": float(os.getenv("KAGGLE_DEADLINE", "0")),
+}
 WEIGHTS = {"repo": 0.6, "notebook": 0.25, "resume": 0.15}
 MAX_EXPECTED = math.log(250)
 
 EMBED_MODEL = "text-embedding-3-small"
+EMBED_BATCH_SIZE = 256
+EMBED_BACKEND = os.getenv("ZK_EMBED_BACKEND", "openai")  # "openai" or "local"
+CLUSTER_THRESHOLD = 0.86
+CANONICAL_CACHE_TTL = int(os.getenv("CANONICAL_CACHE_TTL", str(30 * 24 * 3600)))  # seconds
 LLM_MODEL = "gpt-4o-mini"
+LLM_MAX_INFLIGHT = int(os.getenv("LLM_MAX_INFLIGHT", "4"))
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "20"))  # seconds per explanation call
 
-BASE_SKILL_LEXICON = {
-    "python": "Python", "javascript": "JavaScript", "ts": "TypeScript", "numpy": "NumPy",
-    "pandas": "Pandas", "sklearn": "Scikit-Learn", "scikit-learn": "Scikit-Learn",
-    "tensorflow": "TensorFlow", "torch": "PyTorch", "keras": "Keras",
-    "docker": "Docker", "kubernetes": "Kubernetes", "aws": "AWS", "azure": "Azure", "gcp": "GCP",
-    "react": "React", "django": "Django", "flask": "Flask",
-}
+# mention token -> canonical skill, from zk_common/skills_lexicon.json (ZK_SKILL_LEXICON
+# overrides the path); a snapshot at import, use lexicon.get_matcher() for hot reloads
+BASE_SKILL_LEXICON = dict(get_lexicon().mentions)
@@ -1,45 +1,139 @@
-import json
+import json, importlib, threading, time
 from collections import defaultdict
+from concurrent.futures import Future, wait, FIRST_EXCEPTION
 from datetime import datetime
-from .resume_parser import parse_resume_pdf_bytes, extract_skills_from_resume_text
+from .resume_parser import extract_resume_skills
 from .github_analyzer import analyze_github_user
-from .kaggle_analyzer import analyze_kaggle_notebook
+from .kaggle_analyzer import analyze_kaggle_notebooks
 from .llm_utils import canonicalize_skills_with_embeddings
 from .scoring import aggregate_and_score
-from .config import BASE_SKILL_LEXICON
+from .lexicon import allowed_skills
+from .config import SOURCE_DEADLINES
+from .telemetry import span, bind, incr
 
-def run_for_candidate(candidate_id, resume_paths=None, github_username=None, kaggle_urls=None):
+# third-party modules the stages import on first use
+HEAVY_MODULES = ("pdfplumber", "github", "git", "nbformat", "requests", "openai", "numpy")
+
+def preload():
+    """Import the stages' heavy dependencies now (e.g. when a worker warms up)."""
+    for name in HEAVY_MODULES:
+        importlib.import_module(name)
+
+def _collect_resume(resume_paths, stop=None):
+    with span("resume", files=len(resume_paths)):
+        return list(extract_resume_skills(resume_paths, stop=stop))
+
+def _collect_github(github_username, github_client, stop=None):
+    with span("github", user=github_username):
+        return analyze_github_user(github_username, client=github_client, stop=stop)
+
+def _collect_kaggle(kaggle_urls, stop=None):
+    with span("kaggle", notebooks=len(kaggle_urls)):
+        return analyze_kaggle_notebooks(kaggle_urls, stop=stop)
+
+def _start(fn, args, stop):
+    """Run ``fn(*args, stop=stop)`` on a daemon thread, so the caller can
+    stop waiting for it at its deadline."""
+    fut = Future()
+    def run():
+        if fut.set_running_or_notify_cancel():
+            try:
+                fut.set_result(fn(*args, stop=stop))
+            except BaseException as e:
+                fut.set_exception(e)
+    threading.Thread(target=bind(run), name=f"zk-source-{fn.__name__}", daemon=True).start()
+    return fut
+
+def collect_sources(sources, deadlines=None):
+    """Run evidence sources concurrently; returns (results, incomplete).
+
+    ``sources`` is a list of (name, fn, args); each is called as
+    ``fn(*args, stop=event)``. A source gets ``deadlines[name]`` seconds
+    (missing/0 = no limit) from the start of the call; one that misses it is
+    left out of ``results``, its name added to ``incomplete`` and its
+    ``stop`` event set. If a source raises, every other source is stopped
+    and the error propagates.
+
+    Sources check ``stop`` between units of work (a repository, a notebook,
+    a page range) and return early once it is set, so an abandoned source
+    finishes only the units already in flight. Their worker pools are still
+    joined at interpreter exit, so those units delay exit, but no more.
+    """
+    deadlines = SOURCE_DEADLINES if deadlines is None else deadlines
+    if len(sources) == 1 and not deadlines.get(sources[0][0]):
+        name, fn, args = sources[0]
+        return {name: fn(*args)}, []
+    t0 = time.monotonic()
+    stops = {name: threading.Event() for name, _, _ in sources}
+    names = {_start(fn, args, stops[name]): name for name, fn, args in sources}
+    pending = set(names)
+    results, timed_out = {}, set()
+    try:
+        while pending:
+            now = time.monotonic()
+            limits = {f: t0 + deadlines[names[f]] - now for f in pending if deadlines.get(names[f])}
+            for f, left in limits.items():
+                if left <= 0 and not f.done():
+                    pending.discard(f)
+                    timed_out.add(names[f])
+                    stops[names[f]].set()
+                    incr("zk_source_timeouts_total", source=names[f])
+            live = [left for f, left in limits.items() if f in pending]
+            done, pending = wait(pending, timeout=min(live) if live else None, return_when=FIRST_EXCEPTION)
+            for f in done:
+                results[names[f]] = f.result()
+    except BaseException:
+        for ev in stops.values():
+            ev.set()
+        raise
+    return results, [name for name, _, _ in sources if name in timed_out]
+
+def run_for_candidate(candidate_id, resume_paths=None, github_username=None, kaggle_urls=None, github_client=None, deadlines=None):
+    """Skill report for a candidate from resume, GitHub and Kaggle evidence.
+
+    The sources are collected concurrently, each bounded by its deadline
+    (``deadlines`` overrides SOURCE_DEADLINES, name -> seconds); sources that
+    miss it are listed under ``incomplete`` and scoring uses the rest.
+    Evidence is merged resume, GitHub, Kaggle, so output does not depend on
+    which source finishes first.
+    """
+    with span("run_for_candidate", candidate_id=candidate_id):
+        return _run_for_candidate(candidate_id, resume_paths, github_username, kaggle_urls, github_client, deadlines)
+
+def _run_for_candidate(candidate_id, resume_paths, github_username, kaggle_urls, github_client, deadlines):
     skills_map = defaultdict(list)
     resume_skills = []
 
-    # Resume
+    sources = []
     if resume_paths:
-        for p in resume_paths:
-            with open(p, "rb") as fh:
-                text = parse_resume_pdf_bytes(fh.read())
-                rs = extract_skills_from_resume_text(text)
-                resume_skills.extend(rs)
-                for s,src in rs:
-                    skills_map[s].append({"source":"resume", "type": src})
+        sources.append(("resume", _collect_resume, (resume_paths,)))
+    if github_username:
+        sources.append(("github", _collect_github, (github_username, github_client)))
+    if kaggle_urls:
+        sources.append(("kaggle", _collect_kaggle, (kaggle_urls,)))
+    collected, incomplete = collect_sources(sources, deadlines) if sources else ({}, [])
+
+    # Resume
+    for rs in collected.get("resume", ()):
+        resume_skills.extend(rs)
+        for s,src in rs:
+            skills_map[s].append({"source":"resume", "type": src})
 
     # GitHub
-    if github_username:
-        gh = analyze_github_user(github_username)
-        for s, evids in gh.items():
-            skills_map[s].extend(evids)
+    for s, evids in collected.get("github", {}).items():
+        skills_map[s].extend(evids)
 
     # Kaggle
-    if kaggle_urls:
-        for u in kaggle_urls:
-            kg = analyze_kaggle_notebook(u)
-            for s, evid in kg.items():
-                skills_map[s].extend(evid)
+    for kg in collected.get("kaggle", ()):
+        for s, evid in kg.items():
+            skills_map[s].extend(evid)
 
     # Canonicalize into allowed skills only
     all_tokens = list(skills_map.keys())
     if all_tokens:
-        allowed = set(BASE_SKILL_LEXICON.values())
-        canonical_map = canonicalize_skills_with_embeddings(all_tokens, allowed_canonical=allowed)
+        allowed = allowed_skills()
+        with span("canonicalize", tokens=len(all_tokens)):
+            canonical_map = canonicalize_skills_with_embeddings(all_tokens, allowed_canonical=allowed)
         new_map = defaultdict(list)
         for tok, evids in skills_map.items():
             cm = canonical_map.get(tok)
@@ -50,7 +144,8 @@ def run_for_candidate(candidate_id, resume_paths=None, github_username=None, kag
         skills_map = new_map
 
     # Score
-    scored = aggregate_and_score(skills_map, resume_skills)
+    with span("score", skills=len(skills_map)):
+        scored = aggregate_and_score(skills_map, resume_skills)
     out = {
         "id": candidate_id,
         "generated_at": datetime.utcnow().isoformat() + "Z",
@@ -65,4 +160,6 @@ def run_for_candidate(candidate_id, resume_paths=None, github_username=None, kag
             for i, r in enumerate(scored)
         ]
     }
+    if incomplete:
+        out["incomplete"] = incomplete
     return out
\ No newline at end of file
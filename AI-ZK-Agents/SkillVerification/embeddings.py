@@ -0,0 +1,115 @@
+from hashlib import blake2b
+from .cache import DiskCache, cache_key
+from .config import EMBED_MODEL, EMBED_BATCH_SIZE, EMBED_BACKEND, CACHE_ENABLED
+from .transport import get_transport
+
+class OpenAIEmbedder:
+    """Embeds texts with the OpenAI embeddings endpoint, ``batch_size`` per request."""
+
+    def __init__(self, model=EMBED_MODEL, batch_size=EMBED_BATCH_SIZE):
+        self.model = model
+        self.batch_size = batch_size
+
+    def embed(self, texts):
+        import openai
+        out = []
+        transport = get_transport()
+        for i in range(0, len(texts), self.batch_size):
+            batch = texts[i:i + self.batch_size]
+            request = {"model": self.model, "input": batch}
+            transport.count_call("openai.embeddings")
+            resp = transport.call("openai.embeddings", request, lambda: openai.Embedding.create(**request))
+            rows = sorted(resp["data"], key=lambda d: d["index"])
+            out.extend(r["embedding"] for r in rows)
+        return out
+
+class HashingEmbedder:
+    """Deterministic local embedder: hashed character trigrams, no network.
+
+    Stands in for the OpenAI backend in tests and offline runs; similar
+    spellings land close together, unrelated tokens do not.
+    """
+
+    def __init__(self, dim=256):
+        self.dim = dim
+        self.model = f"local-hash-{dim}"
+
+    def embed(self, texts):
+        out = []
+        for t in texts:
+            v = [0.0] * self.dim
+            s = f"  {t.lower()} "
+            for i in range(len(s) - 2):
+                h = int.from_bytes(blake2b(s[i:i + 3].encode("utf-8"), digest_size=4).digest(), "little")
+                v[h % self.dim] += 1.0 if h & 0x80000000 else -1.0
+            out.append(v)
+        return out
+
+class CachedEmbedder:
+    """Wraps a backend with a persistent (model, token) -> vector cache.
+
+    Only tokens missing from the cache are sent to the backend, in one
+    batched call.
+    """
+
+    def __init__(self, backend, cache=None):
+        self.backend = backend
+        self.model = backend.model
+        self.cache = cache if cache is not None else DiskCache("embeddings")
+
+    def embed(self, texts):
+        keys = [cache_key(self.model, t) for t in texts]
+        out = [self.cache.get(k) for k in keys]
+        missing = [i for i, v in enumerate(out) if v is None]
+        if missing:
+            fresh = self.backend.embed([texts[i] for i in missing])
+            for i, vec in zip(missing, fresh):
+                out[i] = vec
+                try:
+                    self.cache.set(keys[i], vec)
+                except OSError:
+                    pass
+        return out
+
+_embedder = None
+
+def get_embedder():
+    global _embedder
+    if _embedder is None:
+        backend = HashingEmbedder() if EMBED_BACKEND == "local" else OpenAIEmbedder()
+        _embedder = CachedEmbedder(backend) if CACHE_ENABLED else backend
+    return _embedder
+
+def set_embedder(embedder):
+    """Replace the process-wide embedder (e.g. with HashingEmbedder in tests)."""
+    global _embedder
+    _embedder = embedder
+
+def cluster_by_similarity(vectors, threshold):
+    """Greedy single-pass clustering on cosine similarity.
+
+    Mirrors the original pairwise loop: each unused item seeds a cluster and
+    absorbs every later-unused item whose similarity exceeds ``threshold``.
+    Similarities come from one normalized matrix product. Returns clusters as
+    lists of indices.
+    """
+    import numpy as np
+    n = len(vectors)
+    if n == 0:
+        return []
+    x = np.asarray(vectors, dtype=np.float64)
+    norms = np.linalg.norm(x, axis=1)
+    norms[norms == 0.0] = np.inf  # zero vectors get similarity 0 with everything
+    x = x / norms[:, None]
+    sim = x @ x.T
+
+    used = np.zeros(n, dtype=bool)
+    clusters = []
+    for i in range(n):
+        if used[i]:
+            continue
+        used[i] = True
+        members = np.flatnonzero(~used & (sim[i] > threshold))
+        used[members] = True
+        clusters.append([i] + members.tolist())
+    return clusters
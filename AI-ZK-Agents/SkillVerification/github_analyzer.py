@@ -1,10 +1,15 @@
-import os, re, tempfile, json
+import os, re, tempfile, json, shutil, time
 from collections import defaultdict
-import nbformat
-from github import Github
-from git import Repo
-from .config import GITHUB_TOKEN, MAX_REPOS, BASE_SKILL_LEXICON
-from .utils import normalize_to_lexicon, IMPORT_RE
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from .cache import DiskCache, cache_key
+from zk_common.lexicon import get_lexicon
+from .config import GITHUB_TOKEN, MAX_REPOS, GITHUB_WORKERS, CACHE_ENABLED
+from .lexicon import get_matcher
+from .telemetry import span, current_span, bind
+from .transport import get_transport
+from .utils import normalize_to_lexicon, normalize_import, IMPORT_RE
 
 def _iter_dep_tokens_from_text(fname, body):
     if fname == "package.json":
@@ -39,104 +44,224 @@ def _iter_dep_tokens_from_text(fname, body):
         toks.append(tok)
     return toks
 
-def analyze_github_user(username, max_repos=MAX_REPOS):
-    gh = Github(GITHUB_TOKEN) if GITHUB_TOKEN else Github()
-    user = gh.get_user(username)
-    repos = list(user.get_repos())[:max_repos]
-    skills_found = defaultdict(list)
+_CACHE_VERSION = 1
 
-    for repo in repos:
-        try:
-            name = repo.full_name
-            pushed = repo.pushed_at
-            loc = max(10, repo.size * 50)  # rough LOC estimate
-            readme_text = ""
+def _is_missing(e):
+    # 404s (no README, empty repo) mean "nothing there", not a failed scan
+    return getattr(e, "status", None) == 404
 
-            try:
-                readme_text = repo.get_readme().decoded_content.decode('utf-8', errors='ignore')
-            except Exception:
-                pass
+def _lexicon_tag():
+    return get_lexicon().version
 
-            # Languages → keep only lexicon skills
-            try:
-                for lang in repo.get_languages().keys():
-                    canon = normalize_to_lexicon(lang)
-                    if canon:
-                        skills_found[canon].append(dict(
-                            source="github", repo=name, type="language", detail=lang, loc=loc, recency=pushed
-                        ))
-            except Exception:
-                pass
+def _repo_cache_key(repo):
+    pushed = repo.pushed_at
+    if not pushed:
+        return None
+    stamp = pushed.isoformat() if isinstance(pushed, datetime) else str(pushed)
+    return cache_key(_CACHE_VERSION, _lexicon_tag(), repo.full_name, stamp)
 
-            # Dependency files → parse and keep only lexicon skills
-            try:
-                contents = repo.get_contents("")
-                topnames = {c.name.lower(): c for c in contents}
-            except Exception:
-                topnames = {}
-
-            for fname in ("requirements.txt","pyproject.toml","package.json","Pipfile","environment.yml"):
-                if fname in topnames:
-                    try:
-                        body = repo.get_contents(fname).decoded_content.decode('utf-8', errors='ignore')
-                        for tok in _iter_dep_tokens_from_text(fname, body):
-                            canon = normalize_to_lexicon(tok)
-                            if not canon:
-                                continue
-                            skills_found[canon].append(dict(
-                                source="github", repo=name, type="dependency_file",
-                                detail=tok, file=fname, loc=loc, recency=pushed
-                            ))
-                    except Exception:
-                        pass
-
-            # Shallow clone for imports → keep only lexicon skills
-            if repo.size < 2000:
-                tmp = tempfile.mkdtemp(prefix="repo_")
-                giturl = repo.clone_url
-                if GITHUB_TOKEN:
-                    giturl = giturl.replace("https://", f"https://{GITHUB_TOKEN}@")
+def _encode_findings(found):
+    out = []
+    for canon, ev in found:
+        ev = dict(ev)
+        if isinstance(ev.get("recency"), datetime):
+            ev["recency"] = ev["recency"].isoformat()
+        out.append([canon, ev])
+    return out
+
+def _decode_findings(data):
+    out = []
+    for canon, ev in data:
+        if isinstance(ev.get("recency"), str):
+            ev["recency"] = datetime.fromisoformat(ev["recency"])
+        out.append((canon, ev))
+    return out
+
+def _api_call(sp):
+    sp.add("api_calls")
+    get_transport().count_call("github")
+
+def _scan_clone(path, name, loc, pushed, found):
+    sp = current_span()
+    # sorted walk: evidence order must not depend on directory entry order,
+    # or a replayed clone (see transport.py) would yield different snippets
+    for root, dirs, files in os.walk(path):
+        dirs[:] = sorted(d for d in dirs if d != ".git")
+        for f in sorted(files):
+            if f.endswith(('.py','.ipynb','.js','.ts')):
+                fp = os.path.join(root, f)
                 try:
-                    Repo.clone_from(giturl, tmp, depth=1)
-                    for root, _, files in os.walk(tmp):
-                        for f in files:
-                            if f.endswith(('.py','.ipynb','.js','.ts')):
-                                fp = os.path.join(root, f)
-                                try:
-                                    with open(fp,'r',errors='ignore') as fh:
-                                        data = fh.read()
-                                        if f.endswith('.ipynb'):
-                                            nb = nbformat.reads(data, as_version=4)
-                                            data = "\n".join(cell.source for cell in nb.cells if cell.cell_type == 'code')
-                                        for m in IMPORT_RE.finditer(data):
-                                            token = m.group(1) or m.group(2)
-                                            if token:
-                                                base = token.split('.')[0]
-                                                canon = normalize_to_lexicon(base)
-                                                if not canon:
-                                                    continue
-                                                skills_found[canon].append(dict(
-                                                    source="github", repo=name, type="import",
-                                                    detail=token, file=f, loc=loc, recency=pushed
-                                                ))
-                                except Exception:
-                                    pass
+                    with open(fp,'r',errors='ignore') as fh:
+                        data = fh.read()
+                        sp.add("files_scanned")
+                        sp.add("bytes_read", os.fstat(fh.fileno()).st_size)
+                        if f.endswith('.ipynb'):
+                            import nbformat
+                            nb = nbformat.reads(data, as_version=4)
+                            data = "\n".join(cell.source for cell in nb.cells if cell.cell_type == 'code')
+                        for m in IMPORT_RE.finditer(data):
+                            token = m.group(1) or m.group(2)
+                            if token:
+                                base = token.split('.')[0]
+                                canon = normalize_import(base)
+                                if not canon:
+                                    continue
+                                found.append((canon, dict(
+                                    source="github", repo=name, type="import",
+                                    detail=token, file=f, loc=loc, recency=pushed
+                                )))
                 except Exception:
                     pass
 
-            # README scan → lexicon tokens only
-            for tok in BASE_SKILL_LEXICON.keys():
+def analyze_repo(repo):
+    """Collect lexicon evidence for one repository.
+
+    Returns (findings, complete): findings is a list of (canonical_skill,
+    evidence) in discovery order; complete is False when an API call or the
+    clone failed, in which case the result must not be cached.
+    """
+    found = []
+    complete = True
+    sp = current_span()
+    try:
+        name = repo.full_name
+        pushed = repo.pushed_at
+        loc = max(10, repo.size * 50)  # rough LOC estimate
+        readme_text = ""
+
+        try:
+            _api_call(sp)
+            readme_text = repo.get_readme().decoded_content.decode('utf-8', errors='ignore')
+        except Exception as e:
+            complete = complete and _is_missing(e)
+
+        # Languages → keep only lexicon skills
+        try:
+            _api_call(sp)
+            for lang in repo.get_languages().keys():
+                canon = normalize_to_lexicon(lang)
+                if canon:
+                    found.append((canon, dict(
+                        source="github", repo=name, type="language", detail=lang, loc=loc, recency=pushed
+                    )))
+        except Exception:
+            complete = False
+
+        # Dependency files → parse and keep only lexicon skills
+        try:
+            _api_call(sp)
+            contents = repo.get_contents("")
+            topnames = {c.name.lower(): c for c in contents}
+        except Exception as e:
+            complete = complete and _is_missing(e)
+            topnames = {}
+
+        for fname in ("requirements.txt","pyproject.toml","package.json","Pipfile","environment.yml"):
+            if fname in topnames:
                 try:
-                    if re.search(r'\b'+re.escape(tok)+r'\b', readme_text, re.I):
-                        canon = normalize_to_lexicon(tok)
-                        if canon:
-                            skills_found[canon].append(dict(
-                                source="github", repo=name, type="readme",
-                                detail=tok, loc=loc, recency=pushed
-                            ))
+                    _api_call(sp)
+                    body = repo.get_contents(fname).decoded_content.decode('utf-8', errors='ignore')
+                    for tok in _iter_dep_tokens_from_text(fname, body):
+                        canon = normalize_import(tok)
+                        if not canon:
+                            continue
+                        found.append((canon, dict(
+                            source="github", repo=name, type="dependency_file",
+                            detail=tok, file=fname, loc=loc, recency=pushed
+                        )))
                 except Exception:
-                    pass
-        except Exception:
+                    complete = False
+
+        # Shallow clone for imports → keep only lexicon skills
+        if repo.size < 2000:
+            from git import Repo
+            tmp = tempfile.mkdtemp(prefix="repo_")
+            giturl = repo.clone_url
+            if GITHUB_TOKEN:
+                giturl = giturl.replace("https://", f"https://{GITHUB_TOKEN}@")
+            try:
+                t0 = time.perf_counter()
+                get_transport().count_call("git_clone")
+                get_transport().clone(repo.clone_url, tmp, lambda: Repo.clone_from(giturl, tmp, depth=1))
+                sp.set(clone_s=round(time.perf_counter() - t0, 6))
+                _scan_clone(tmp, name, loc, pushed, found)
+            except Exception:
+                complete = False
+            finally:
+                shutil.rmtree(tmp, ignore_errors=True)
+
+        # README scan → lexicon tokens only
+        for tok in get_matcher().find(readme_text, ignore_case=True):
+            canon = normalize_to_lexicon(tok)
+            if canon:
+                found.append((canon, dict(
+                    source="github", repo=name, type="readme",
+                    detail=tok, loc=loc, recency=pushed
+                )))
+    except Exception:
+        complete = False
+    return found, complete
+
+def _analyze_repo_cached(repo, cache):
+    with span("github.repo", repo=repo.full_name) as sp:
+        key = _repo_cache_key(repo) if cache is not None else None
+        if key:
+            hit = cache.get(key)
+            if hit is not None:
+                sp.set(cached=True)
+                return _decode_findings(hit)
+        sp.set(cached=False)
+        found, complete = analyze_repo(repo)
+        sp.set(findings=len(found), complete=complete)
+    if key and complete:
+        try:
+            cache.set(key, _encode_findings(found))
+        except OSError:
             pass
+    return found
+
+def analyze_github_user(username, max_repos=MAX_REPOS, client=None, cache=None, max_workers=GITHUB_WORKERS, stop=None):
+    """Scan a user's repositories for lexicon skills.
+
+    Repositories are analyzed on a thread pool of ``max_workers`` and merged
+    in listing order, so output matches a sequential scan. Per-repo results
+    are cached by (full_name, pushed_at); ``client`` may be any object with
+    the PyGithub ``get_user`` interface, and ``cache`` any object with
+    ``get``/``set`` (defaults to the on-disk cache unless disabled). Once
+    the ``stop`` event is set no further repositories are started and the
+    skills found so far are returned.
+    """
+    if client is None:
+        from github import Github
+        client = Github(GITHUB_TOKEN) if GITHUB_TOKEN else Github()
+    per_page = getattr(client, "per_page", None) or 30
+    transport = get_transport()
+    client = transport.github(client)
+    if cache is None and CACHE_ENABLED:
+        cache = DiskCache("github_repos")
+    transport.count_call("github")
+    user = client.get_user(username)
+    # the listing is paginated; stop reading pages once max_repos are in
+    repos = list(islice(user.get_repos(), max_repos))
+    transport.count_call("github", max(1, -(-len(repos) // per_page)))
+    current_span().set(repos=len(repos))
+    skills_found = defaultdict(list)
+    if not repos:
+        return skills_found
+
+    def scan(repo):
+        if stop is not None and stop.is_set():
+            return None
+        return _analyze_repo_cached(repo, cache)
+
+    pool = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(repos))))
+    try:
+        for found in pool.map(bind(scan), repos):
+            if found is None:
+                break
+            for canon, ev in found:
+                skills_found[canon].append(ev)
+    finally:
+        pool.shutdown(cancel_futures=True)
 
-    return skills_found
\ No newline at end of file
+    return skills_found
@@ -1,19 +1,139 @@
-import requests
+import threading
 from collections import defaultdict
-from .utils import normalize_to_lexicon, IMPORT_RE
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from .cache import DiskCache
+from .config import CACHE_ENABLED, KAGGLE_WORKERS, KAGGLE_PER_HOST, KAGGLE_TIMEOUT
+from .transport import get_transport
+from .utils import normalize_import, IMPORT_RE
 
-def analyze_kaggle_notebook(url):
+_CHUNK_CHARS = 64 * 1024
+_session = None
+_session_lock = threading.Lock()
+_host_slots = {}
+
+def get_session():
+    """Process-wide pooled session, so repeated fetches reuse connections."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            s = requests.Session()
+            adapter = HTTPAdapter(pool_connections=KAGGLE_WORKERS, pool_maxsize=max(KAGGLE_WORKERS, KAGGLE_PER_HOST))
+            s.mount("http://", adapter)
+            s.mount("https://", adapter)
+            _session = s
+        return _session
+
+def _host_slot(url):
+    host = urlsplit(url).netloc.lower()
+    with _session_lock:
+        slot = _host_slots.get(host)
+        if slot is None:
+            slot = _host_slots[host] = threading.BoundedSemaphore(KAGGLE_PER_HOST)
+        return slot
+
+def iter_import_tokens(chunks):
+    """Yield import tokens from streamed text chunks without joining them.
+
+    Buffered text is scanned in blocks of about ``_CHUNK_CHARS``, cut after
+    the last newline so import lines stay whole. Text without a newline is
+    cut at ``_CHUNK_CHARS`` rather than buffered to the end of the page; only
+    a statement straddling such a cut can be missed.
+    """
+    buf = ""
+    for chunk in chunks:
+        buf += chunk
+        while len(buf) >= _CHUNK_CHARS:
+            cut = buf.rfind("\n") + 1 or _CHUNK_CHARS
+            block, buf = buf[:cut], buf[cut:]
+            for m in IMPORT_RE.finditer(block):
+                yield (m.group(1) or m.group(2)).split('.')[0]
+    for m in IMPORT_RE.finditer(buf):
+        yield (m.group(1) or m.group(2)).split('.')[0]
+
+def _get_page(url, session, timeout):
+    with _host_slot(url):
+        r = session.get(url, timeout=timeout)
+        return {"status": r.status_code, "text": r.text}
+
+def fetch_import_tokens(url, session=None, cache=None, timeout=KAGGLE_TIMEOUT):
+    """Import tokens found on a notebook page, revalidated with ETag/Last-Modified.
+
+    The tokens from the last full response are cached with its validators;
+    a 304 reuses them without downloading the page again. When recording or
+    replaying (see transport.py) the whole page is stored unconditionally.
+    """
+    session = session or get_session()
+    transport = get_transport()
+    transport.count_call("kaggle")
+    if not transport.live:
+        page = transport.call("kaggle", {"method": "GET", "url": url}, lambda: _get_page(url, session, timeout))
+        return list(iter_import_tokens([page["text"]]))
+    cached = cache.get(url) if cache is not None else None
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    with _host_slot(url):
+        with session.get(url, headers=headers, timeout=timeout, stream=True) as r:
+            if r.status_code == 304 and cached:
+                return cached["tokens"]
+            r.encoding = r.encoding or "utf-8"
+            tokens = list(iter_import_tokens(r.iter_content(chunk_size=_CHUNK_CHARS, decode_unicode=True)))
+            etag, last_modified = r.headers.get("ETag"), r.headers.get("Last-Modified")
+            if cache is not None and r.status_code == 200 and (etag or last_modified):
+                try:
+                    cache.set(url, {"etag": etag, "last_modified": last_modified, "tokens": tokens})
+                except OSError:
+                    pass
+            return tokens
+
+def analyze_kaggle_notebook(url, session=None, cache=None):
     skills = defaultdict(list)
     try:
-        r = requests.get(url, timeout=10)
-        text = r.text
-        for m in IMPORT_RE.finditer(text):
-            tok = (m.group(1) or m.group(2)).split('.')[0]
-            canon = normalize_to_lexicon(tok)
+        for tok in fetch_import_tokens(url, session=session, cache=cache):
+            canon = normalize_import(tok)
             if canon:
                 skills[canon].append(dict(
                     source="kaggle", url=url, type="import", detail=tok
                 ))
     except Exception:
         pass
-    return skills
\ No newline at end of file
+    return skills
+
+def analyze_kaggle_notebooks(urls, max_workers=KAGGLE_WORKERS, session=None, cache=None, stop=None):
+    """analyze_kaggle_notebook for many URLs concurrently; results in input order.
+
+    Fetches share one pooled session and at most KAGGLE_PER_HOST requests
+    run against the same host at a time. Once the ``stop`` event is set no
+    further URLs are fetched and the results so far are returned.
+    """
+    urls = list(urls)
+    if cache is None and CACHE_ENABLED:
+        cache = DiskCache("kaggle_http")
+
+    def analyze(url):
+        if stop is not None and stop.is_set():
+            return None
+        return analyze_kaggle_notebook(url, session, cache)
+
+    if len(urls) <= 1 or max_workers <= 1:
+        results = map(analyze, urls)
+        pool = None
+    else:
+        pool = ThreadPoolExecutor(max_workers=min(max_workers, len(urls)))
+        results = pool.map(analyze, urls)
+    out = []
+    try:
+        for skills in results:
+            if skills is None:
+                break
+            out.append(skills)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+    return out
@@ -0,0 +1,79 @@
+import re
+from zk_common.lexicon import get_lexicon
+
+class LexiconMatcher:
+    """Finds every lexicon key mentioned in a text in one regex pass.
+
+    A key counts as mentioned where ``\\b<key>\\b`` matches, exactly as with a
+    separate ``re.search`` per key. All keys are compiled into one lookahead
+    alternation that reports each position where some key starts; there
+    only the keys of a length that fits are confirmed, so scan time depends
+    on the text and the number of hits rather than on the lexicon size.
+    Also keeps the reverse (lowercased canonical name -> canonical) index
+    used by ``canonical``, and an optional import-name map.
+    """
+
+    def __init__(self, lexicon, imports=None):
+        self.lexicon = dict(lexicon)
+        self.imports = dict(imports or {})
+        self._order = {k: i for i, k in enumerate(self.lexicon)}
+        self._lengths = sorted({len(k) for k in self.lexicon if k}, reverse=True)
+        self._by_lower = {}
+        for k in self.lexicon:
+            if k:
+                self._by_lower.setdefault(k.lower(), []).append(k)
+        self._key_count = sum(len(ks) for ks in self._by_lower.values())
+        self._canonical = {}
+        for canon in self.lexicon.values():
+            self._canonical.setdefault(canon.lower(), canon)
+        alternation = "|".join(re.escape(k) for k in sorted(self.lexicon, key=len, reverse=True) if k)
+        self._scan = {}
+        self._exact = {}
+        for flags in (0, re.I):
+            self._scan[flags] = re.compile(r'(?=\b(?:' + alternation + r')\b)', flags) if alternation else None
+            self._exact[flags] = {}
+
+    def _confirm(self, key, text, pos, flags):
+        pat = self._exact[flags].get(key)
+        if pat is None:
+            pat = self._exact[flags][key] = re.compile(r'\b' + re.escape(key) + r'\b', flags)
+        return pat.match(text, pos) is not None
+
+    def find(self, text, ignore_case=False):
+        """Lexicon keys mentioned in ``text``, in lexicon order."""
+        flags = re.I if ignore_case else 0
+        scan = self._scan[flags]
+        if scan is None or not text:
+            return []
+        found = set()
+        for m in scan.finditer(text):
+            pos = m.start()
+            for n in self._lengths:
+                for k in self._by_lower.get(text[pos:pos + n].lower(), ()):
+                    if k not in found and self._confirm(k, text, pos, flags):
+                        found.add(k)
+            if len(found) == self._key_count:
+                break
+        return sorted(found, key=self._order.__getitem__)
+
+    def canonical(self, token):
+        """Canonical skill for a raw token (key or canonical name), or None."""
+        t = (token or "").strip()
+        if not t:
+            return None
+        t_low = re.sub(r'[^A-Za-z0-9_\-+.#]', '', t).lower()
+        if t_low in self.lexicon:
+            return self.lexicon[t_low]
+        return self._canonical.get(t_low)
+
+    def canonical_import(self, token):
+        """Canonical skill for an import/package name, or None."""
+        return self.canonical(token) or self.imports.get((token or "").strip().lower())
+
+def get_matcher():
+    """Matcher for the current shared lexicon (rebuilt once after a reload)."""
+    return get_lexicon().derived("SkillVerification.matcher", lambda lx: LexiconMatcher(lx.mentions, lx.imports))
+
+def allowed_skills():
+    """Canonical skill names of the current shared lexicon."""
+    return set(get_lexicon().canonical)
@@ -1,20 +1,37 @@
-import time, json, math
-import openai
-from .config import EMBED_MODEL, LLM_MODEL, USE_OPENAI, BASE_SKILL_LEXICON
+import json, threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from .config import LLM_MODEL, USE_OPENAI, CLUSTER_THRESHOLD, LLM_MAX_INFLIGHT, LLM_TIMEOUT
+from .embeddings import get_embedder, cluster_by_similarity
+from .canonical_cache import get_mapping_store, MISSING
+from .lexicon import allowed_skills
+from .telemetry import span, bind, incr
+from .transport import get_transport
 
-def get_embedding(text):
-    resp = openai.Embeddings.create(model=EMBED_MODEL, input=text)
-    return resp["data"][0]["embedding"]
-
-def cosine_sim(a,b):
-    dot = sum(x*y for x,y in zip(a,b))
-    na = math.sqrt(sum(x*x for x in a))
-    nb = math.sqrt(sum(x*x for x in b))
-    if na==0 or nb==0: return 0.0
-    return dot/(na*nb)
+def _llm_canonical_for_cluster(cluster, allowed_list):
+    prompt = (
+        "You normalize raw tech tokens into a fixed skill list.\n"
+        f"Allowed skills ONLY: {allowed_list}\n"
+        f"Tokens: {cluster}\n"
+        "Return JSON: {\"canonical_name\": <one of allowed or NONE>, \"synonyms\": [...], \"rationale\": \"...\"}"
+    )
+    request = dict(
+        model=LLM_MODEL,
+        messages=[
+            {"role":"system","content":"Choose the closest allowed canonical skill or NONE if no match."},
+            {"role":"user","content":prompt}
+        ],
+        max_tokens=200,
+        temperature=0.0
+    )
+    import openai
+    transport = get_transport()
+    transport.count_call("openai.chat")
+    resp = transport.call("openai.chat", request, lambda: openai.ChatCompletion.create(**request))
+    return resp["choices"][0]["message"]["content"]
 
-def canonicalize_skills_with_embeddings(skill_tokens, allowed_canonical=None):
-    allowed = set(allowed_canonical or BASE_SKILL_LEXICON.values())
+def canonicalize_skills_with_embeddings(skill_tokens, allowed_canonical=None, embedder=None, store=None):
+    allowed = set(allowed_canonical or allowed_skills())
 
     if not USE_OPENAI:
         # Keep only tokens already in allowed
@@ -23,55 +40,47 @@ def canonicalize_skills_with_embeddings(skill_tokens, allowed_canonical=None):
             for t in skill_tokens if t in allowed
         }
 
-    embeddings = {}
+    # Tokens mapped (or rejected) before skip embedding and the LLM entirely
+    store = store if store is not None else get_mapping_store()
+    canonical_map, pending = {}, []
     for t in skill_tokens:
-        embeddings[t] = get_embedding(t)
-        time.sleep(0.1)
+        cached = store.lookup(t, allowed) if store is not None else MISSING
+        if cached is MISSING:
+            pending.append(t)
+        elif cached:
+            canonical_map[t] = cached
+    if not pending:
+        return canonical_map
 
-    clusters, used = [], set()
-    for t in skill_tokens:
-        if t in used: continue
-        cluster = [t]; used.add(t)
-        for u in skill_tokens:
-            if u in used: continue
-            if cosine_sim(embeddings[t], embeddings[u]) > 0.86:
-                cluster.append(u)
-                used.add(u)
-        clusters.append(cluster)
+    with span("canonicalize.embed", tokens=len(pending)):
+        vectors = (embedder or get_embedder()).embed(pending)
+        clusters = [
+            [pending[i] for i in c]
+            for c in cluster_by_similarity(vectors, CLUSTER_THRESHOLD)
+        ]
 
-    canonical_map = {}
     allowed_list = sorted(list(allowed))
+    with span("canonicalize.llm", clusters=len(clusters)):
+        _canonicalize_clusters(clusters, allowed_list, allowed, canonical_map, store)
+    return canonical_map
+
+def _canonicalize_clusters(clusters, allowed_list, allowed, canonical_map, store):
     for c in clusters:
-        prompt = (
-            "You normalize raw tech tokens into a fixed skill list.\n"
-            f"Allowed skills ONLY: {allowed_list}\n"
-            f"Tokens: {c}\n"
-            "Return JSON: {\"canonical_name\": <one of allowed or NONE>, \"synonyms\": [...], \"rationale\": \"...\"}"
-        )
-        resp = openai.ChatCompletion.create(
-            model=LLM_MODEL,
-            messages=[
-                {"role":"system","content":"Choose the closest allowed canonical skill or NONE if no match."},
-                {"role":"user","content":prompt}
-            ],
-            max_tokens=200,
-            temperature=0.0
-        )
-        txt = resp["choices"][0]["message"]["content"]
+        txt = _llm_canonical_for_cluster(c, allowed_list)
         try:
             j = json.loads(txt)
             name = j.get("canonical_name")
-            if name in allowed:
-                for token in c:
-                    canonical_map[token] = j
-            # else drop cluster (no mapping)
+            mapping = j if isinstance(name, str) and name in allowed else None  # else drop cluster (no mapping)
         except Exception:
-            # drop cluster on parse error
-            pass
+            # drop cluster on parse error, and retry it next time
+            continue
+        for token in c:
+            if mapping:
+                canonical_map[token] = mapping
+            if store is not None:
+                store.store(token, allowed, mapping)
 
-    return canonical_map
-
-def llm_explain_score(skill, evidence_snippets, base_confidence):
+def llm_explain_score(skill, evidence_snippets, base_confidence, timeout=None):
     if not USE_OPENAI:
         return 0, "no LLM adjustment"
 
@@ -81,15 +90,21 @@ def llm_explain_score(skill, evidence_snippets, base_confidence):
         f"Current confidence (0-100): {base_confidence}\n\n"
         "Return JSON: {\"adjust\": <int -10..10>, \"explain\": \"one-sentence reason for adjust\"}."
     )
-    resp = openai.ChatCompletion.create(
+    request = dict(
         model=LLM_MODEL,
         messages=[
             {"role":"system","content":"You are an objective tech evaluator. Suggest small numeric adjustments (-10..10) to a confidence score and explain briefly."},
             {"role":"user","content":prompt}
         ],
         max_tokens=120,
-        temperature=0.0
+        temperature=0.0,
     )
+    import openai
+    transport = get_transport()
+    transport.count_call("openai.chat")
+    resp = transport.call("openai.chat", request, lambda: openai.ChatCompletion.create(
+        **request, **({"request_timeout": timeout} if timeout else {})
+    ))
     txt = resp["choices"][0]["message"]["content"]
     try:
         j = json.loads(txt)
@@ -97,4 +112,47 @@ def llm_explain_score(skill, evidence_snippets, base_confidence):
         explain = j.get("explain","")
     except Exception:
         adj, explain = 0, "no LLM adjustment"
-    return adj, explain
\ No newline at end of file
+    return adj, explain
+
+NO_ADJUSTMENT = (0, "no LLM adjustment")
+_EXPLAIN_MEMO_MAX = 4096
+_explain_memo = OrderedDict()
+_explain_lock = threading.Lock()
+
+def _explain_key(skill, evidence_snippets, base_confidence):
+    # llm_explain_score only shows the model the first 8 snippets
+    return (skill, tuple(evidence_snippets[:8]), int(base_confidence))
+
+def _explain_memoized(skill, evidence_snippets, base_confidence, timeout):
+    key = _explain_key(skill, evidence_snippets, base_confidence)
+    with _explain_lock:
+        if key in _explain_memo:
+            _explain_memo.move_to_end(key)
+            incr("zk_cache_requests_total", namespace="llm_explain_memo", result="hit")
+            return _explain_memo[key]
+    incr("zk_cache_requests_total", namespace="llm_explain_memo", result="miss")
+    try:
+        res = llm_explain_score(skill, evidence_snippets, base_confidence, timeout=timeout)
+    except Exception:
+        return NO_ADJUSTMENT  # not memoized, so a later call can retry
+    with _explain_lock:
+        _explain_memo[key] = res
+        if len(_explain_memo) > _EXPLAIN_MEMO_MAX:
+            _explain_memo.popitem(last=False)
+    return res
+
+def llm_explain_many(items, max_inflight=LLM_MAX_INFLIGHT, timeout=LLM_TIMEOUT):
+    """Run llm_explain_score for each (skill, snippets, base_confidence).
+
+    Calls are issued concurrently with at most ``max_inflight`` outstanding,
+    each bounded by ``timeout`` seconds; a failed or timed-out call falls
+    back to no adjustment. Results are memoized and returned in input order.
+    """
+    items = list(items)
+    if not USE_OPENAI:
+        return [NO_ADJUSTMENT] * len(items)
+    with span("llm_explain", items=len(items)):
+        if max_inflight <= 1 or len(items) <= 1:
+            return [_explain_memoized(s, sn, bc, timeout) for s, sn, bc in items]
+        with ThreadPoolExecutor(max_workers=min(max_inflight, len(items))) as pool:
+            return list(pool.map(bind(lambda it: _explain_memoized(it[0], it[1], it[2], timeout)), items))
@@ -1,20 +1,35 @@
-import io, re
-import pdfplumber
+import io, re, threading, multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from hashlib import blake2b
+from .cache import DiskCache, cache_key
+from .lexicon import get_matcher
 from .utils import normalize_token, normalize_to_lexicon
-from .config import BASE_SKILL_LEXICON
+from .config import CACHE_ENABLED, RESUME_WORKERS, RESUME_PAGES_PER_TASK, RESUME_STOP_EARLY
 
-def parse_resume_pdf_bytes(pdf_bytes):
-    text = ""
+SECTION_RE = re.compile(r'(skills|technical skills|technologies|proficiencies)[:\s\-]+\n?(.{10,800})', re.I)
+_SECTION_TAIL_RE = re.compile(r'[:\s\-]*\Z')
+_SECTION_KEYWORD_MAX = len("technical skills")
+_TEXT_CACHE_VERSION = 1
+_WORKER_PDFS = 4    # PDFs a pool worker keeps in memory for the next ranges of the same file
+_pools = {}         # max_workers -> shared pool
+_pool_lock = threading.Lock()
+_worker_pdfs = {}   # digest -> PDF bytes, per worker process
+
+def iter_resume_pages(pdf_bytes, start=0, stop=None):
+    """Yield the extracted text of pages [start, stop), one page at a time."""
+    import pdfplumber
     with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-        for p in pdf.pages:
-            text += p.extract_text() or ""
-            text += "\n"
-    return text
+        for p in pdf.pages[start:stop]:
+            yield p.extract_text() or ""
 
-def extract_skills_from_resume_text(text):
+def parse_resume_pdf_bytes(pdf_bytes):
+    return "".join(t + "\n" for t in iter_resume_pages(pdf_bytes))
+
+def _section_skills(lower):
     skills = []
-    lower = text.lower()
-    m = re.search(r'(skills|technical skills|technologies|proficiencies)[:\s\-]+\n?(.{10,800})', lower, re.I)
+    m = SECTION_RE.search(lower)
     if m:
         block = m.group(2)
         block = re.split(r'\n[A-Z][a-z]{1,30}[:\n]', block, maxsplit=1)[0]
@@ -25,14 +40,185 @@ def extract_skills_from_resume_text(text):
             canon = normalize_to_lexicon(s)
             if canon:
                 skills.append((canon, "resume_skills_section"))
+    return skills
 
-    for token in BASE_SKILL_LEXICON.keys():
-        if re.search(r'\b'+re.escape(token)+r'\b', lower):
-            skills.append((normalize_token(token), "resume_mention"))
+def extract_skills_from_resume_text(text):
+    lower = text.lower()
+    skills = _section_skills(lower)
+
+    for token in get_matcher().find(lower):
+        skills.append((normalize_token(token), "resume_mention"))
 
     out, seen = [], set()
     for s,src in skills:
         if s not in seen:
             seen.add(s)
             out.append((s,src))
-    return out
\ No newline at end of file
+    return out
+
+class ResumeSkillExtractor:
+    """Incremental extract_skills_from_resume_text over a stream of pages.
+
+    ``feed`` returns True once the skills section has been seen, so callers
+    may stop reading further pages; ``skills`` then covers the pages fed so
+    far. Fed every page, it matches the one-shot function exactly.
+    """
+
+    def __init__(self):
+        self._parts = []
+        self._len = 0
+        self._scan_from = 0
+        self.section_found = False
+
+    def feed(self, page_text):
+        part = (page_text + "\n").lower()
+        self._parts.append(part)
+        self._len += len(part)
+        if not self.section_found:
+            # only a match that ran into the previous end of text can start before this page
+            text = "".join(self._parts) if len(self._parts) > 1 else part
+            self.section_found = SECTION_RE.search(text, self._scan_from) is not None
+            if not self.section_found:
+                tail = _SECTION_TAIL_RE.search(text).start()
+                self._scan_from = max(0, tail - _SECTION_KEYWORD_MAX)
+                self._parts = [text]
+        return self.section_found
+
+    def skills(self):
+        return extract_skills_from_resume_text("".join(self._parts))
+
+def _pdf_digest(pdf_bytes):
+    return blake2b(pdf_bytes, digest_size=32).hexdigest()
+
+def _load_pdf(path, digest):
+    """PDF bytes of ``path`` in a pool worker, read once per worker and file.
+
+    Raises if the file no longer has ``digest``, so text parsed from a
+    changed file is never cached under the old content hash.
+    """
+    data = _worker_pdfs.get(digest)
+    if data is None:
+        with open(path, "rb") as fh:
+            data = fh.read()
+        if _pdf_digest(data) != digest:
+            raise RuntimeError(f"{path} changed while it was being parsed")
+        if len(_worker_pdfs) >= _WORKER_PDFS:
+            _worker_pdfs.pop(next(iter(_worker_pdfs)))
+        _worker_pdfs[digest] = data
+    return data
+
+def _parse_page_range(path, digest, start, stop):
+    return list(iter_resume_pages(_load_pdf(path, digest), start, stop))
+
+def get_pool(max_workers=RESUME_WORKERS):
+    """Process-wide pool of ``max_workers`` parsers, started on first use.
+
+    One pool is kept per size, so callers asking for the same size share it.
+    Workers come from a forkserver (spawn where unavailable): resumes are
+    parsed from source threads, and forking a threaded process is unsafe.
+    """
+    with _pool_lock:
+        pool = _pools.get(max_workers)
+        if pool is None:
+            methods = multiprocessing.get_all_start_methods()
+            ctx = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            pool = _pools[max_workers] = ProcessPoolExecutor(max_workers=max_workers, mp_context=ctx)
+        return pool
+
+def _discard_pool(pool):
+    with _pool_lock:
+        for size, p in list(_pools.items()):
+            if p is pool:
+                del _pools[size]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def _page_count(pdf_bytes):
+    import pdfplumber
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        return len(pdf.pages)
+
+def _text_cache_key(digest):
+    import pdfplumber
+    return cache_key("resume_text", _TEXT_CACHE_VERSION, pdfplumber.__version__, digest)
+
+def _chunk_pages(chunk):
+    return chunk.result() if isinstance(chunk, Future) else chunk()
+
+def extract_resume_skills(paths, max_workers=RESUME_WORKERS, pages_per_task=RESUME_PAGES_PER_TASK,
+                          stop_early=RESUME_STOP_EARLY, cache=None, stop=None):
+    """Skills for each resume in ``paths`` (same order), parsed in a process pool.
+
+    Parsing runs on the shared pool of ``max_workers`` processes (see
+    get_pool); with ``max_workers`` <= 1 each PDF is opened once and parsed
+    in this process. Resumes longer than ``pages_per_task`` are split into
+    page ranges so a large PDF is spread across workers too. Range tasks
+    carry the path and content hash rather than the PDF, and each worker
+    reads a file at most once. Page text is streamed into a
+    ResumeSkillExtractor in page order; with ``stop_early`` the rest of a
+    resume is skipped (pending ranges cancelled) once its skills section is
+    found. Fully extracted page text is cached by PDF content hash. Once
+    the ``stop`` event is set pending ranges are cancelled and the skills of
+    the resumes finished so far are returned.
+    """
+    if cache is None and CACHE_ENABLED:
+        cache = DiskCache("resume_text")
+
+    plans = []
+    for path in paths:
+        with open(path, "rb") as fh:
+            data = fh.read()
+        digest = _pdf_digest(data)
+        key = _text_cache_key(digest)
+        cached = cache.get(key) if cache is not None else None
+        if cached is not None:
+            plans.append((key, cached, None, []))
+            continue
+        n = _page_count(data)
+        ranges = [(path, digest, a, min(a + pages_per_task, n)) for a in range(0, n, pages_per_task)]
+        plans.append((key, None, data, ranges))
+
+    tasks = sum(len(plan[3]) for plan in plans)
+    pool = get_pool(max_workers) if max_workers > 1 and tasks > 1 else None
+    jobs = []
+    try:
+        for key, cached, data, ranges in plans:
+            if pool is not None:
+                chunks = [pool.submit(_parse_page_range, *r) for r in ranges]
+            else:
+                chunks = [partial(iter_resume_pages, data)] if ranges else []
+            jobs.append((key, chunks, cached))
+
+        results = []
+        for key, chunks, cached in jobs:
+            if stop is not None and stop.is_set():
+                break
+            extractor = ResumeSkillExtractor()
+            stream = cached if cached is not None else (t for c in chunks for t in _chunk_pages(c))
+            pages = []
+            for t in stream:
+                if stop is not None and stop.is_set():
+                    break
+                pages.append(t)
+                if extractor.feed(t) and stop_early:
+                    break
+            else:
+                if cached is None and cache is not None:
+                    try:
+                        cache.set(key, pages)
+                    except OSError:
+                        pass
+            if chunks and pool is not None:
+                for c in chunks:
+                    c.cancel()
+            if stop is not None and stop.is_set():
+                break
+            results.append(extractor.skills())
+        return results
+    except BrokenProcessPool:
+        _discard_pool(pool)  # a worker died; the next call starts a fresh pool
+        raise
+    finally:
+        if pool is not None:
+            for _, chunks, _ in jobs:
+                for c in chunks:
+                    c.cancel()
@@ -1,7 +1,7 @@
 import math
 from .config import WEIGHTS, MAX_EXPECTED
 from .utils import months_since
-from .llm_utils import llm_explain_score
+from .llm_utils import llm_explain_many
 
 def _snippet(e):
     src = e.get("source", "")
@@ -53,7 +53,7 @@ def _score_resume(evidences):
     return min(1.0, s / 3.0)
 
 def aggregate_and_score(skills_map, resume_skills):
-    results = []
+    pending = []
     for skill, evids in skills_map.items():
         gh = [e for e in evids if e.get("source") == "github"]
         kg = [e for e in evids if e.get("source") == "kaggle"]
@@ -74,8 +74,13 @@ def aggregate_and_score(skills_map, resume_skills):
             sn = _snippet(e)
             if sn and sn not in snippets:
                 snippets.append(sn)
+        pending.append((skill, snippets, int(base_conf)))
+
+    # LLM adjustments are independent per skill, so issue them concurrently
+    adjustments = llm_explain_many(pending)
 
-        adj, explain = llm_explain_score(skill, snippets, int(base_conf))
+    results = []
+    for (skill, snippets, base_conf), (adj, explain) in zip(pending, adjustments):
         final_conf = max(0, min(100, int(base_conf + adj)))
 
         results.append({
@@ -85,4 +90,4 @@ def aggregate_and_score(skills_map, resume_skills):
             "llm_explain": explain
         })
     results.sort(key=lambda r: r["confidence"], reverse=True)
-    return results
\ No newline at end of file
+    return results
@@ -0,0 +1,165 @@
+import os, json, time, threading, contextvars, itertools
+from collections import deque
+from .config import TELEMETRY_JSONL
+
+class Span:
+    """One timed stage. ``attrs`` hold labels and counts (``add``) reported with it."""
+
+    __slots__ = ("name", "span_id", "parent_id", "trace_id", "attrs", "start", "end")
+
+    def __init__(self, name, parent, attrs):
+        self.name = name
+        self.span_id = next(_ids)
+        self.parent_id = parent.span_id if parent is not None else None
+        self.trace_id = parent.trace_id if parent is not None else self.span_id
+        self.attrs = dict(attrs)
+        self.start = time.time()
+        self.end = None
+
+    @property
+    def duration(self):
+        return ((self.end or time.time()) - self.start)
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+    def add(self, key, n=1):
+        self.attrs[key] = self.attrs.get(key, 0) + n
+
+    def to_dict(self):
+        return dict(
+            name=self.name, span_id=self.span_id, parent_id=self.parent_id, trace_id=self.trace_id,
+            start=round(self.start, 6), duration_s=round(self.duration, 6), attrs=self.attrs,
+        )
+
+class _NoSpan:
+    """Stand-in returned by current_span() outside any span; drops updates."""
+
+    def set(self, **attrs):
+        pass
+
+    def add(self, key, n=1):
+        pass
+
+NO_SPAN = _NoSpan()
+_ids = itertools.count(1)
+_current = contextvars.ContextVar("zk_span", default=None)
+_lock = threading.Lock()
+_counters = {}      # (name, sorted label items) -> value
+_span_stats = {}    # span name -> [count, total seconds]
+_recent = deque(maxlen=1000)
+_sinks = []
+
+class span:
+    """Context manager timing a stage; nested spans record their parent.
+
+        with span("github.repo", repo=name) as sp:
+            sp.add("api_calls")
+
+    Finished spans update the per-name duration totals, go to the recent
+    ring buffer and to any sinks (a JSONL file when ZK_TELEMETRY_JSONL is set).
+    """
+
+    def __init__(self, name, **attrs):
+        self.name = name
+        self.attrs = attrs
+
+    def __enter__(self):
+        self.span = Span(self.name, _current.get(), self.attrs)
+        self._token = _current.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        sp = self.span
+        _current.reset(self._token)
+        sp.end = time.time()
+        if exc_type is not None:
+            sp.attrs["error"] = exc_type.__name__
+        _finish(sp)
+        return False
+
+def _finish(sp):
+    with _lock:
+        st = _span_stats.setdefault(sp.name, [0, 0.0])
+        st[0] += 1
+        st[1] += sp.duration
+        _recent.append(sp)
+        sinks = list(_sinks)
+    for sink in sinks:
+        try:
+            sink(sp)
+        except Exception:
+            pass  # telemetry must never fail the pipeline
+
+def current_span():
+    return _current.get() or NO_SPAN
+
+def bind(fn):
+    """``fn`` running under the caller's current span, for use on worker threads."""
+    ctx = contextvars.copy_context()
+    return lambda *a, **kw: ctx.copy().run(fn, *a, **kw)
+
+def incr(name, n=1, **labels):
+    key = (name, tuple(sorted(labels.items())))
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + n
+
+def counters():
+    """{(name, ((label, value), ...)): count} snapshot."""
+    with _lock:
+        return dict(_counters)
+
+def recent_spans():
+    with _lock:
+        return [sp.to_dict() for sp in _recent]
+
+def add_sink(fn):
+    """Call ``fn(span)`` for every finished span."""
+    with _lock:
+        _sinks.append(fn)
+
+def reset():
+    with _lock:
+        _counters.clear()
+        _span_stats.clear()
+        _recent.clear()
+
+class JsonlSink:
+    """Appends each finished span as one JSON line."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def __call__(self, sp):
+        line = json.dumps(sp.to_dict(), ensure_ascii=False, default=str)
+        with self._lock, open(self.path, "a", encoding="utf-8") as fh:
+            fh.write(line + "\n")
+
+def _label_str(labels):
+    if not labels:
+        return ""
+    esc = lambda v: str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return "{" + ",".join(f'{k}="{esc(v)}"' for k, v in labels) + "}"
+
+def prometheus_text():
+    """Counters and span duration totals in the Prometheus text exposition format."""
+    with _lock:
+        cnt = sorted(_counters.items())
+        stats = sorted(_span_stats.items())
+    lines, seen = [], set()
+    for (name, labels), value in cnt:
+        if name not in seen:
+            seen.add(name)
+            lines.append(f"# TYPE {name} counter")
+        lines.append(f"{name}{_label_str(labels)} {value}")
+    if stats:
+        lines.append("# TYPE zk_span_seconds summary")
+        for name, (count, total) in stats:
+            lines.append(f'zk_span_seconds_sum{{span="{name}"}} {total:.6f}')
+            lines.append(f'zk_span_seconds_count{{span="{name}"}} {count}')
+    return "\n".join(lines) + "\n"
+
+if TELEMETRY_JSONL:
+    os.makedirs(os.path.dirname(os.path.abspath(TELEMETRY_JSONL)), exist_ok=True)
+    add_sink(JsonlSink(TELEMETRY_JSONL))
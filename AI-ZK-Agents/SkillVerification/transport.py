@@ -0,0 +1,238 @@
+import io, os, json, tarfile, tempfile, threading, time
+from datetime import datetime
+from hashlib import blake2b
+from .cache import DiskCache, cache_key
+from .config import TRANSPORT_MODE, CASSETTE_DIR, REPLAY_LATENCY_MS
+from .telemetry import incr
+
+MODES = ("live", "record", "replay")
+
+class CassetteMiss(LookupError):
+    """Replay found no recorded response for a request."""
+
+class ReplayedError(Exception):
+    """A recorded HTTP error; ``status`` matches the original exception's."""
+
+    def __init__(self, message, status):
+        super().__init__(message)
+        self.status = status
+
+def parse_latency(spec):
+    """'40' -> {'': 40.0}; 'github=30,openai=400,20' -> per-service ms ('' is the default)."""
+    out = {}
+    for part in (spec or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, ms = part.rpartition("=")
+        out[name.strip()] = float(ms)
+    return out
+
+class Transport:
+    """Routes external calls live, or through a cassette store.
+
+    - live: call the service
+    - record: call the service and store the response under the request
+    - replay: serve the stored response after the configured latency, never
+      touching the network; a request that was not recorded raises CassetteMiss
+
+    Responses are kept per service (``github``, ``clone``, ``kaggle``,
+    ``openai.chat``, ``openai.embeddings``) in DiskCache namespaces under
+    ``cassette_dir``. HTTP errors (exceptions with an integer ``status``) are
+    recorded too and replayed as ReplayedError.
+
+    Callers report each request they make with ``count_call``, which feeds
+    ``zk_external_calls_total`` only when the request really reaches the
+    service (live or record).
+    """
+
+    def __init__(self, mode="live", cassette_dir=CASSETTE_DIR, latency_ms=None):
+        if mode not in MODES:
+            raise ValueError(f"unknown transport mode: {mode}")
+        self.mode = mode
+        self.dir = cassette_dir
+        self.latency_ms = dict(latency_ms or {})
+        self._stores = {}
+        self._lock = threading.Lock()
+
+    @property
+    def live(self):
+        return self.mode == "live"
+
+    def _store(self, service):
+        with self._lock:
+            store = self._stores.get(service)
+            if store is None:
+                store = self._stores[service] = DiskCache(service, root=self.dir, track=False)
+            return store
+
+    def count_call(self, service, n=1):
+        """Count ``n`` requests to ``service``; replayed requests are not external."""
+        if self.mode != "replay" and n:
+            incr("zk_external_calls_total", n, service=service)
+
+    def latency(self, service):
+        """Injected replay latency in seconds (exact service, then its prefix, then default)."""
+        for name in (service, service.split(".")[0], ""):
+            if name in self.latency_ms:
+                return self.latency_ms[name] / 1000.0
+        return 0.0
+
+    def _wait(self, service):
+        delay = self.latency(service)
+        if delay > 0:
+            time.sleep(delay)
+
+    def call(self, service, request, live_fn):
+        """Response for ``request`` (JSON-serializable) from ``live_fn()`` or the cassette."""
+        if self.mode == "live":
+            return live_fn()
+        key = cache_key(request)
+        store = self._store(service)
+        if self.mode == "replay":
+            entry = store.get(key)
+            if entry is None:
+                raise CassetteMiss(f"{service}: no recording for {key[:200]}")
+            self._wait(service)
+            if "error" in entry:
+                raise ReplayedError(entry["error"]["message"], entry["error"]["status"])
+            return entry["response"]
+        try:
+            resp = live_fn()
+        except Exception as e:
+            status = getattr(e, "status", None)
+            if isinstance(status, int):
+                store.set(key, {"error": {"status": status, "message": str(e)}})
+            raise
+        store.set(key, {"response": json.loads(json.dumps(resp, default=_encode_default))})
+        return resp
+
+    def _archive_path(self, url):
+        h = blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.dir, "clone", h[:2], h + ".tar.gz")
+
+    def clone(self, url, dest, live_fn):
+        """Fill ``dest`` with the working tree of ``url``.
+
+        Recording archives the cloned tree (without .git) and replay unpacks
+        it, so clone-based scans run offline.
+        """
+        if self.mode == "live":
+            return live_fn()
+        path = self._archive_path(url)
+        if self.mode == "replay":
+            if not os.path.exists(path):
+                raise CassetteMiss(f"clone: no recording for {url}")
+            self._wait("clone")
+            with tarfile.open(path, "r:gz") as tar:
+                if hasattr(tarfile, "data_filter"):
+                    tar.extractall(dest, filter="data")
+                else:
+                    tar.extractall(dest)
+            return None
+        live_fn()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        buf = io.BytesIO()
+        with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+            tar.add(dest, arcname=".", filter=lambda ti: None if ti.name == "./.git" or ti.name.startswith("./.git/") else ti)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(buf.getvalue())
+        os.replace(tmp, path)
+        return None
+
+    def github(self, client):
+        """``client`` itself when live, else a recording/replaying proxy with the same interface."""
+        return client if self.live else GithubCassette(self, client)
+
+def _encode_default(o):
+    if isinstance(o, datetime):
+        return {"__datetime__": o.isoformat()}
+    if isinstance(o, bytes):
+        return o.decode("utf-8", errors="replace")
+    raise TypeError(f"not JSON serializable: {type(o).__name__}")
+
+def _decode_datetime(v):
+    if isinstance(v, dict) and "__datetime__" in v:
+        return datetime.fromisoformat(v["__datetime__"])
+    return v
+
+# -- GitHub --------------------------------------------------------------------
+# Only the part of the PyGithub interface analyze_github_user uses is proxied.
+
+_REPO_FIELDS = ("full_name", "pushed_at", "size", "clone_url")
+
+class _Content:
+    def __init__(self, name, text=""):
+        self.name = name
+        self.decoded_content = text.encode("utf-8")
+
+class _RepoCassette:
+    def __init__(self, transport, fields, repo=None):
+        self._t = transport
+        self._repo = repo
+        self.full_name = fields["full_name"]
+        self.pushed_at = _decode_datetime(fields["pushed_at"])
+        self.size = fields["size"]
+        self.clone_url = fields["clone_url"]
+
+    def _call(self, op, live_fn, **args):
+        return self._t.call("github", dict(op=op, repo=self.full_name, **args), live_fn)
+
+    def get_readme(self):
+        text = self._call("readme", lambda: self._repo.get_readme().decoded_content.decode("utf-8", errors="ignore"))
+        return _Content("README", text)
+
+    def get_languages(self):
+        return self._call("languages", lambda: dict(self._repo.get_languages()))
+
+    def get_contents(self, path):
+        if path == "":
+            names = self._call("ls", lambda: [c.name for c in self._repo.get_contents("")], path="")
+            return [_Content(n) for n in names]
+        text = self._call("file", lambda: self._repo.get_contents(path).decoded_content.decode("utf-8", errors="ignore"), path=path)
+        return _Content(os.path.basename(path), text)
+
+class _UserCassette:
+    def __init__(self, transport, username, user=None):
+        self._t = transport
+        self._user = user
+        self.username = username
+
+    def get_repos(self):
+        live = {}
+
+        def fetch():
+            repos = list(self._user.get_repos())
+            live.update((r.full_name, r) for r in repos)
+            return [{f: getattr(r, f) for f in _REPO_FIELDS} for r in repos]
+
+        rows = self._t.call("github", {"op": "repos", "user": self.username}, fetch)
+        rows = json.loads(json.dumps(rows, default=_encode_default))
+        return [_RepoCassette(self._t, row, live.get(row["full_name"])) for row in rows]
+
+class GithubCassette:
+    """PyGithub-like client whose calls go through a recording/replaying Transport."""
+
+    def __init__(self, transport, client=None):
+        self._t = transport
+        self._client = client
+
+    def get_user(self, username):
+        live = self._t.mode != "replay" and self._client is not None
+        user = self._client.get_user(username) if live else None
+        return _UserCassette(self._t, username, user)
+
+_transport = None
+
+def get_transport():
+    """Process-wide transport from ZK_TRANSPORT / ZK_CASSETTE_DIR / ZK_REPLAY_LATENCY_MS."""
+    global _transport
+    if _transport is None:
+        _transport = Transport(TRANSPORT_MODE, CASSETTE_DIR, parse_latency(REPLAY_LATENCY_MS))
+    return _transport
+
+def set_transport(transport):
+    """Replace the process-wide transport (e.g. a replaying one in benchmarks)."""
+    global _transport
+    _transport = transport
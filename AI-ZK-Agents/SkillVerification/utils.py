@@ -1,6 +1,6 @@
 import re
 from datetime import datetime, timezone
-from .config import BASE_SKILL_LEXICON
+from .lexicon import get_matcher
 
 IMPORT_RE = re.compile(
     r'^\s*(?:from\s+([A-Za-z0-9_\.]+)\s+import|import\s+([A-Za-z0-9_\.]+))',
@@ -8,26 +8,21 @@ IMPORT_RE = re.compile(
 )
 
 def normalize_token(token):
+    lexicon = get_matcher().lexicon
     t = token.strip().lower()
     t = re.sub(r'[^a-z0-9_\-+.#]', '', t)
-    if t in BASE_SKILL_LEXICON:
-        return BASE_SKILL_LEXICON[t]
+    if t in lexicon:
+        return lexicon[t]
     t = re.sub(r'([=<>!].*)$', '', t)
-    if t in BASE_SKILL_LEXICON:
-        return BASE_SKILL_LEXICON[t]
+    if t in lexicon:
+        return lexicon[t]
     return token.capitalize()
 
 def normalize_to_lexicon(token):
-    t = (token or "").strip()
-    if not t:
-        return None
-    t_low = re.sub(r'[^A-Za-z0-9_\-+.#]', '', t).lower()
-    if t_low in BASE_SKILL_LEXICON:
-        return BASE_SKILL_LEXICON[t_low]
-    for canon in BASE_SKILL_LEXICON.values():
-        if canon.lower() == t_low:
-            return canon
-    return None
+    return get_matcher().canonical(token)
+
+def normalize_import(token):
+    return get_matcher().canonical_import(token)
 
 def is_skill_token(token):
     return normalize_to_lexicon(token) is not None
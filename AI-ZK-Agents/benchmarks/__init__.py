@@ -0,0 +1,11 @@
+"""benchmarks package
+
+Reproducible benchmarks for the four agents on synthetic data. Run with
+``python -m benchmarks.run --out results.json`` from AI-ZK-Agents; pass
+``--compare old.json`` to diff against an earlier run.
+"""
+
+__all__ = [
+    "generators",
+    "harness",
+]
@@ -0,0 +1,126 @@
+"""Check and time the shared zk_common secret derivation.
+
+Re-derives every module's secrets with the original per-module
+implementation (json.dumps + blake2b over prefix||payload) and with
+zk_common, asserts they are bit-for-bit identical, and reports timings.
+Each module is checked under the domains it really derives secrets in.
+
+Usage (from AI-ZK-Agents):
+    python -m benchmarks.bench_zk_common --payloads 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from hashlib import blake2b
+
+from MatchingAlgorithm import utils as mai_utils
+from ProjectVerification import utils as pv_utils
+from ReputationAdjustment import utils as ra_utils
+
+
+MODULES = {
+    "MAI": (mai_utils, ["job", "skills", "match"]),
+    "PV": (pv_utils, ["job", "submission", "nullifier"]),
+    "RA": (ra_utils, ["worker", "adjustment"]),
+}
+
+
+def legacy_canonical_dumps(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+
+def legacy_hash32(payload):
+    h = blake2b(digest_size=32)
+    h.update(payload)
+    return h.digest()
+
+
+def legacy_derive_secret(prefix, domain, payload_obj, salt=None):
+    domain_sep = f"{prefix}-{domain}|".encode("utf-8")
+    payload = legacy_canonical_dumps(payload_obj)
+    if salt:
+        return legacy_hash32(domain_sep + salt + b"|" + payload)
+    return legacy_hash32(domain_sep + payload)
+
+
+def legacy_commitment(prefix, secret32):
+    return legacy_hash32(f"{prefix}-COMMIT-v1|".encode("utf-8") + secret32)
+
+
+SKILLS = ["python", "pytorch", "docker", "c++", "c#", "node.js", "scikit-learn", "café", "数据"]
+
+
+def make_payloads(n, seed):
+    rng = random.Random(seed)
+    out = []
+    for i in range(n):
+        kind = i % 3
+        if kind == 0:
+            # flat skill -> weight map, the common case
+            out.append({s: rng.random() for s in rng.sample(SKILLS, rng.randint(1, len(SKILLS)))})
+        elif kind == 1:
+            out.append({
+                "job_id": f"job-{rng.randint(0, 999)}",
+                "candidate_id": f"cand-{i}",
+                "score": round(rng.random(), 6),
+                "threshold": 0.7,
+                "is_match": rng.random() > 0.5,
+            })
+        else:
+            out.append({
+                "worker_id": f"w-{i}",
+                "base": rng.uniform(0, 100),
+                "new": rng.uniform(0, 100),
+                "ratings": [rng.randint(1, 5) for _ in range(rng.randint(0, 5))],
+                "note": None,
+            })
+    return out
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--payloads", type=int, default=20000)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+
+    payloads = make_payloads(args.payloads, args.seed)
+    salt = b"salt"
+    report = {"payloads": len(payloads), "modules": {}}
+
+    for prefix, (mod, domains) in MODULES.items():
+        for domain in domains:
+            for p in payloads:
+                old = legacy_derive_secret(prefix, domain, p)
+                new = mod.derive_secret(domain, p)
+                if old != new:
+                    raise SystemExit(f"{prefix}-{domain}: secret mismatch for {p!r}")
+                if legacy_commitment(prefix, old) != mod.commitment_from_secret(new):
+                    raise SystemExit(f"{prefix}-{domain}: commitment mismatch for {p!r}")
+            if legacy_derive_secret(prefix, domain, payloads[0], salt) != mod.derive_secret(domain, payloads[0], salt):
+                raise SystemExit(f"{prefix}-{domain}: salted secret mismatch")
+
+        domain = domains[0]
+        legacy_s = timed(lambda: [legacy_commitment(prefix, legacy_derive_secret(prefix, domain, p)) for p in payloads])
+        shared_s = timed(lambda: [mod.commitment_from_secret(mod.derive_secret(domain, p)) for p in payloads])
+        report["modules"][prefix] = {
+            "identical": True,
+            "legacy_us_per_secret": round(legacy_s / len(payloads) * 1e6, 3),
+            "shared_us_per_secret": round(shared_s / len(payloads) * 1e6, 3),
+            "speedup": round(legacy_s / shared_s, 3) if shared_s else None,
+        }
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import base64
+import os
+import random
+import subprocess
+import threading
+import zlib
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from zk_common.lexicon import get_lexicon
+
+
+def skill_vocabulary(extra: int = 0, seed: int = 0) -> List[str]:
+    """Lexicon skill ids followed by ``extra`` made-up skill names."""
+    rng = random.Random(seed)
+    vocab = list(get_lexicon().names)
+    for i in range(extra):
+        vocab.append(f"skill-{i:05d}-{rng.choice(('core', 'ops', 'ml', 'web', 'data'))}")
+    return vocab
+
+
+def skill_dict(rng: random.Random, vocab: Sequence[str], size: int) -> Dict[str, float]:
+    """``size`` distinct skills from ``vocab`` with weights in (0, 1]."""
+    picked = rng.sample(list(vocab), min(size, len(vocab)))
+    return {s: round(rng.uniform(0.05, 1.0), 3) for s in picked}
+
+
+def skill_pairs(n: int, vocab: Sequence[str], job_size: int, user_size: int, seed: int = 0) -> List[Tuple[Dict[str, float], Dict[str, float]]]:
+    rng = random.Random(seed)
+    return [(skill_dict(rng, vocab, job_size), skill_dict(rng, vocab, user_size)) for _ in range(n)]
+
+
+def reputation_events(n: int, workers: int, seed: int = 0) -> List[Tuple[str, float, float, float, int]]:
+    """(worker_id, base, complexity, rating, verified_projects) tuples."""
+    rng = random.Random(seed)
+    return [
+        (f"worker-{rng.randrange(workers):06d}", rng.random(), rng.random(), rng.random(), rng.randrange(0, 12))
+        for _ in range(n)
+    ]
+
+
+_CODE_LINES = {
+    "python": "import numpy as np\nimport pandas as pd\n\ndef main():\n    return np.zeros(3)\n",
+    "javascript": "const express = require('express');\nexport function handler(req, res) { res.send('ok'); }\n",
+    "rust": "fn main() {\n    println!(\"hello\");\n}\n",
+    "go": "package main\n\nfunc main() {}\n",
+}
+_EXTENSIONS = {"python": ".py", "javascript": ".js", "rust": ".rs", "go": ".go"}
+
+
+def make_repo_tree(root: str, n_files: int, depth: int = 3, file_lines: int = 40, seed: int = 0) -> List[str]:
+    """Write a fake source tree of ``n_files`` files under ``root``; returns relative paths.
+
+    Files are spread over ``depth`` directory levels and mix languages plus
+    dependency manifests, so the ProjectVerification cues have something to find.
+    """
+    rng = random.Random(seed)
+    os.makedirs(root, exist_ok=True)
+    langs = sorted(_CODE_LINES)
+    paths: List[str] = []
+    manifests = {
+        "requirements.txt": "numpy\npandas\nscikit-learn\ntorch\n",
+        "package.json": '{"dependencies": {"react": "^18.0.0", "express": "^4.0.0"}}\n',
+        "Dockerfile": "FROM python:3.11-slim\n",
+        "README.md": "# Demo\n\nBuilt with Python, React and Docker.\n",
+    }
+    for name, body in manifests.items():
+        with open(os.path.join(root, name), "w", encoding="utf-8") as fh:
+            fh.write(body)
+        paths.append(name)
+    for i in range(max(0, n_files - len(manifests))):
+        parts = [f"pkg{rng.randrange(8)}" for _ in range(rng.randrange(1, depth + 1))]
+        lang = rng.choice(langs)
+        rel = os.path.join(*parts, f"mod_{i:05d}{_EXTENSIONS[lang]}")
+        full = os.path.join(root, rel)
+        os.makedirs(os.path.dirname(full), exist_ok=True)
+        reps = max(1, file_lines // _CODE_LINES[lang].count("\n"))
+        with open(full, "w", encoding="utf-8") as fh:
+            fh.write(_CODE_LINES[lang] * reps)
+        paths.append(rel)
+    return paths
+
+
+def init_git_repo(root: str) -> str:
+    """Commit everything under ``root`` into a fresh git repo; returns a file:// URL."""
+    env = dict(os.environ, GIT_AUTHOR_NAME="bench", GIT_AUTHOR_EMAIL="bench@example.invalid",
+               GIT_COMMITTER_NAME="bench", GIT_COMMITTER_EMAIL="bench@example.invalid")
+    for args in (["init", "-q"], ["add", "-A"], ["commit", "-q", "-m", "fixture"]):
+        subprocess.run(["git", *args], cwd=root, env=env, check=True, stdout=subprocess.DEVNULL)
+    return "file://" + os.path.abspath(root)
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(pages: Sequence[Sequence[str]]) -> bytes:
+    """Minimal PDF with one Helvetica text line per entry of each page."""
+    n = len(pages)
+    font_obj = 3 + 2 * n
+    objs = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [%s] /Count %d >>" % (" ".join(f"{3 + 2 * i} 0 R" for i in range(n)), n),
+    ]
+    for i, lines in enumerate(pages):
+        ops = ["BT", "/F1 11 Tf", "14 TL", "50 760 Td"]
+        ops.extend(f"({_pdf_escape(ln)}) Tj T*" for ln in lines)
+        ops.append("ET")
+        stream = "\n".join(ops)
+        objs.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {4 + 2 * i} 0 R "
+            f"/Resources << /Font << /F1 {font_obj} 0 R >> >> >>"
+        )
+        objs.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+    objs.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for i, body in enumerate(objs, 1):
+        offsets.append(len(out))
+        out += f"{i} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objs) + 1}\n0000000000 65535 f \n".encode("ascii")
+    for off in offsets:
+        out += f"{off:010d} 00000 n \n".encode("ascii")
+    out += f"trailer\n<< /Size {len(objs) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("ascii")
+    return bytes(out)
+
+
+def resume_pages(n_pages: int, seed: int = 0, lines_per_page: int = 40) -> List[List[str]]:
+    """Resume text: filler experience pages with a Skills section on the last page."""
+    rng = random.Random(seed)
+    mentions = list(get_lexicon().mentions)
+    pages: List[List[str]] = []
+    for p in range(n_pages):
+        lines = ["Experience"] if p == 0 else []
+        for _ in range(lines_per_page):
+            lines.append(f"Worked on {rng.choice(mentions)} services and delivered project {rng.randrange(1000)}.")
+        pages.append(lines)
+    pages[-1] = pages[-1][: lines_per_page // 2] + ["Skills", ", ".join(rng.sample(mentions, min(8, len(mentions))))]
+    return pages
+
+
+def write_resumes(directory: str, count: int, n_pages: int, seed: int = 0) -> List[str]:
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"resume_{i:03d}.pdf")
+        with open(path, "wb") as fh:
+            fh.write(make_pdf(resume_pages(n_pages, seed=seed + i)))
+        paths.append(path)
+    return paths
+
+
+# -- recorded GitHub responses ---------------------------------------------------
+
+class _Missing(Exception):
+    """Stands in for a GitHub 404; ``status`` is what the analyzer inspects."""
+
+    status = 404
+
+
+class FakeContentFile:
+    def __init__(self, name: str, body: str = "") -> None:
+        self.name = name
+        self.path = name
+        self.type = "file"
+        self.decoded_content = body.encode("utf-8")
+        self.content = base64.b64encode(self.decoded_content).decode("ascii")
+
+
+class FakeRepo:
+    """Offline stand-in for ``github.Repository`` built from a recorded response dict."""
+
+    def __init__(self, data: Mapping[str, object]) -> None:
+        self._data = data
+        self.full_name = str(data["full_name"])
+        self.pushed_at = data["pushed_at"]
+        self.size = int(data["size"])  # type: ignore[arg-type]
+        self.clone_url = str(data.get("clone_url", ""))
+
+    def get_readme(self) -> FakeContentFile:
+        readme = self._data.get("readme")
+        if readme is None:
+            raise _Missing("README not found")
+        return FakeContentFile("README.md", str(readme))
+
+    def get_languages(self) -> Dict[str, int]:
+        return dict(self._data.get("languages", {}))  # type: ignore[arg-type]
+
+    def get_contents(self, path: str):
+        files: Mapping[str, str] = self._data.get("files", {})  # type: ignore[assignment]
+        if path == "":
+            return [FakeContentFile(name) for name in files]
+        if path not in files:
+            raise _Missing(path)
+        return FakeContentFile(path, files[path])
+
+
+class FakeUser:
+    def __init__(self, repos: List[FakeRepo]) -> None:
+        self._repos = repos
+
+    def get_repos(self) -> Iterator[FakeRepo]:
+        return iter(self._repos)
+
+
+class FakeGithub:
+    """Object with the PyGithub ``get_user`` interface over recorded repo data."""
+
+    def __init__(self, users: Mapping[str, List[Mapping[str, object]]]) -> None:
+        self._users = {name: FakeUser([FakeRepo(r) for r in repos]) for name, repos in users.items()}
+
+    def get_user(self, username: str) -> FakeUser:
+        return self._users[username]
+
+
+def github_recording(username: str, n_repos: int, clone_url: Optional[str] = None, seed: int = 0) -> Dict[str, List[Dict[str, object]]]:
+    """Recorded responses for ``n_repos`` repositories of one user.
+
+    With ``clone_url`` set, repositories are small enough to be cloned (from
+    that URL, normally a local fixture repo); otherwise they are reported as
+    large so only the API responses are analyzed.
+    """
+    rng = random.Random(seed)
+    mentions = list(get_lexicon().mentions)
+    base = datetime(2024, 1, 1)
+    repos = []
+    for i in range(n_repos):
+        repos.append({
+            "full_name": f"{username}/project-{i:03d}",
+            "pushed_at": base + timedelta(days=rng.randrange(600)),
+            "size": rng.randrange(50, 1500) if clone_url else rng.randrange(2000, 50000),
+            "clone_url": clone_url or "",
+            "readme": "# Project\n\nUses " + ", ".join(rng.sample(mentions, min(5, len(mentions)))) + ".\n",
+            "languages": {"Python": rng.randrange(1000, 90000), "JavaScript": rng.randrange(100, 9000)},
+            "files": {
+                "requirements.txt": "numpy\npandas\nscikit-learn\n",
+                "package.json": '{"dependencies": {"react": "^18.0.0"}}\n',
+            },
+        })
+    return {username: repos}
+
+
+# -- Kaggle notebook server ------------------------------------------------------
+
+def notebook_page(seed: int = 0, lines: int = 400) -> str:
+    rng = random.Random(seed)
+    imports = ["import numpy as np", "import pandas as pd", "from sklearn.model_selection import train_test_split",
+               "import torch", "import tensorflow as tf", "import matplotlib.pyplot as plt"]
+    body = [rng.choice(imports) if rng.random() < 0.1 else f"x_{i} = {rng.random():.6f}" for i in range(lines)]
+    return "<html><body><pre>\n" + "\n".join(body) + "\n</pre></body></html>\n"
+
+
+class NotebookServer:
+    """Local HTTP server answering every GET with a generated notebook page.
+
+    Serves on 127.0.0.1 so Kaggle analysis runs without network access; use
+    as a context manager and build URLs with ``url(i)``.
+    """
+
+    def __init__(self, lines: int = 400) -> None:
+        pages: Dict[str, bytes] = {}
+        lock = threading.Lock()
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                with lock:
+                    body = pages.get(self.path)
+                    if body is None:
+                        body = pages[self.path] = notebook_page(seed=zlib.crc32(self.path.encode('utf-8')), lines=lines).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def url(self, i: int) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/code/bench/notebook-{i:03d}"
+
+    def __enter__(self) -> "NotebookServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
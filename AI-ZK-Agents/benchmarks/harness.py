@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+
+RESULTS_FORMAT = 1
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Linear-interpolated percentile of already sorted values (q in [0, 100])."""
+    if not sorted_values:
+        return 0.0
+    pos = (len(sorted_values) - 1) * q / 100.0
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+def measure(
+    name: str,
+    fn: Callable[[int], Any],
+    repeat: int,
+    warmup: int = 1,
+    items_per_call: int = 1,
+    params: Optional[Mapping[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Time ``fn(i)`` for i in range(repeat) and report latency, throughput and memory.
+
+    Latencies come from untraced calls; peak memory is measured on one more
+    call under tracemalloc so tracing overhead does not skew the timings.
+    ``items_per_call`` scales throughput when one call processes many items.
+    """
+    for i in range(warmup):
+        fn(i)
+    gc.collect()
+    latencies: List[float] = []
+    started = time.perf_counter()
+    for i in range(repeat):
+        t0 = time.perf_counter()
+        fn(i)
+        latencies.append(time.perf_counter() - t0)
+    total = time.perf_counter() - started
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn(repeat)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    ms = [x * 1000.0 for x in latencies]
+    return {
+        "name": name,
+        "params": dict(params or {}),
+        "calls": repeat,
+        "total_s": round(total, 6),
+        "throughput_per_s": round(repeat * items_per_call / total, 3) if total else None,
+        "latency_ms": {
+            "mean": round(sum(ms) / len(ms), 4) if ms else 0.0,
+            "p50": round(percentile(ms, 50), 4),
+            "p90": round(percentile(ms, 90), 4),
+            "p99": round(percentile(ms, 99), 4),
+            "max": round(ms[-1], 4) if ms else 0.0,
+        },
+        "peak_mem_kb": round(peak / 1024.0, 1),
+    }
+
+
+def git_revision(path: str) -> str:
+    try:
+        out = subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=path, stderr=subprocess.DEVNULL)
+        return out.decode("utf-8").strip()
+    except Exception:
+        return ""
+
+
+def environment(root: str) -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "git_revision": git_revision(root),
+        "argv": sys.argv[1:],
+    }
+
+
+def write_results(path: str, results: Sequence[Mapping[str, Any]], meta: Mapping[str, Any]) -> None:
+    doc = {
+        "format": RESULTS_FORMAT,
+        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "meta": dict(meta),
+        "results": list(results),
+    }
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(doc, fh, indent=2, sort_keys=True)
+        fh.write("\n")
+
+
+def compare(old: Mapping[str, Any], new: Mapping[str, Any]) -> List[Dict[str, Any]]:
+    """Per benchmark present in both runs: p50 latency, throughput and memory ratios (new/old)."""
+    before = {r["name"]: r for r in old.get("results", [])}
+    rows: List[Dict[str, Any]] = []
+    for r in new.get("results", []):
+        o = before.get(r["name"])
+        if o is None:
+            continue
+
+        def ratio(a: Optional[float], b: Optional[float]) -> Optional[float]:
+            return round(a / b, 3) if a is not None and b else None
+
+        rows.append({
+            "name": r["name"],
+            "p50_ratio": ratio(r["latency_ms"]["p50"], o["latency_ms"]["p50"]),
+            "throughput_ratio": ratio(r["throughput_per_s"], o["throughput_per_s"]),
+            "peak_mem_ratio": ratio(r["peak_mem_kb"], o["peak_mem_kb"]),
+        })
+    return rows
@@ -0,0 +1,119 @@
+"""Check that zk-agents subcommands import within their startup budget.
+
+Usage (from AI-ZK-Agents):
+    python -m benchmarks.import_budget
+    python -m benchmarks.import_budget --budget-ms 40 --runs 7
+
+Each subcommand's module is imported in a fresh interpreter under
+``-X importtime``. The import time counted is that of every top-level import
+a bare interpreter does not already make, and the best of ``--runs`` is kept
+to filter scheduler noise. The light commands must also not load any of the
+heavy third-party packages. Exits with status 1 if a budgeted command is over
+its budget or loads a forbidden package.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Optional, Set, Tuple
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGETED = ("match", "reputation")
+HEAVY = ("numpy", "pdfplumber", "github", "git", "nbformat", "openai", "requests")
+
+_PROBE = """
+import json, sys
+from zk_agents.cli import load
+load({command!r})
+print(json.dumps(sorted(m for m in {heavy!r} if m in sys.modules)))
+"""
+
+
+def _top_level_imports(stderr: str) -> Dict[str, int]:
+    """Module -> cumulative microseconds for the top-level lines of -X importtime output."""
+    out: Dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if name.startswith(" ") and not name.startswith("  "):  # one space of indent = top level
+            try:
+                out[name.strip()] = int(cumulative)
+            except ValueError:
+                pass  # header line
+    return out
+
+
+def _run(code: str) -> Tuple[Dict[str, int], str]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return _top_level_imports(proc.stderr), proc.stdout
+
+
+def baseline_modules() -> Set[str]:
+    """Top-level modules a bare interpreter imports (site and friends)."""
+    mods, _ = _run("pass")
+    return set(mods)
+
+
+def measure_command(command: str, runs: int, baseline: Set[str]) -> Dict[str, object]:
+    best: Optional[int] = None
+    heavy: List[str] = []
+    slowest: List[Tuple[str, int]] = []
+    for _ in range(runs):
+        mods, stdout = _run(_PROBE.format(command=command, heavy=HEAVY))
+        own = {m: us for m, us in mods.items() if m not in baseline}
+        total = sum(own.values())
+        if best is None or total < best:
+            best = total
+            slowest = sorted(own.items(), key=lambda kv: -kv[1])[:5]
+        heavy = json.loads(stdout.strip().splitlines()[-1])
+    return {
+        "command": command,
+        "import_ms": round((best or 0) / 1000.0, 2),
+        "heavy_modules": heavy,
+        "slowest": [{"module": m, "ms": round(us / 1000.0, 2)} for m, us in slowest],
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Check zk-agents subcommand import times against a budget")
+    p.add_argument("--budget-ms", type=float, default=50.0, help="Import budget for the light commands")
+    p.add_argument("--runs", type=int, default=5, help="Fresh interpreters per command; the best run counts")
+    p.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = p.parse_args(argv)
+
+    sys.path.insert(0, ROOT)
+    from zk_agents.cli import COMMANDS
+
+    baseline = baseline_modules()
+    results = [measure_command(c, max(1, args.runs), baseline) for c in COMMANDS]
+    failures = []
+    for r in results:
+        if r["command"] not in BUDGETED:
+            continue
+        if r["import_ms"] > args.budget_ms:
+            failures.append(f"{r['command']}: {r['import_ms']} ms > {args.budget_ms} ms")
+        if r["heavy_modules"]:
+            failures.append(f"{r['command']}: loads {', '.join(r['heavy_modules'])}")
+
+    if args.json:
+        print(json.dumps({"budget_ms": args.budget_ms, "results": results, "failures": failures}, indent=2))
+    else:
+        for r in results:
+            mark = "budget" if r["command"] in BUDGETED else ""
+            print(f"{r['command']:<16} {r['import_ms']:>8.2f} ms  {mark:<6}  heavy: {', '.join(r['heavy_modules']) or '-'}")
+        for f in failures:
+            print(f"FAIL {f}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
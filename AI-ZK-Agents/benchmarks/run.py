@@ -0,0 +1,199 @@
+"""Run the agent benchmarks on synthetic data and write the results as JSON.
+
+Usage (from AI-ZK-Agents):
+    python -m benchmarks.run --out results.json
+    python -m benchmarks.run --suite match,reputation --quick
+    python -m benchmarks.run --out new.json --compare results.json
+
+Everything runs offline: OpenAI is disabled, GitHub answers come from a
+recorded fake client (repos are cloned from a local fixture repository) and
+Kaggle notebooks are served from 127.0.0.1. Inputs are derived from --seed,
+so two runs on the same machine measure the same work.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+from typing import Any, Callable, Dict, List
+
+from . import generators as gen
+from .harness import compare, environment, measure, write_results
+
+
+SUITES = ("match", "project", "reputation", "skills")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def bench_match(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    from MatchingAlgorithm.core import compute_weighted_overlap
+
+    vocab = gen.skill_vocabulary(extra=args.vocab, seed=args.seed)
+    pairs = gen.skill_pairs(args.pairs, vocab, args.job_skills, args.user_skills, seed=args.seed)
+    params = {"pairs": args.pairs, "vocab": len(vocab), "job_skills": args.job_skills, "user_skills": args.user_skills}
+    return [measure(
+        "match.compute_weighted_overlap",
+        lambda i: compute_weighted_overlap(*pairs[i % len(pairs)]),
+        repeat=args.pairs,
+        warmup=min(100, args.pairs),
+        params=params,
+    )]
+
+
+def bench_project(args: argparse.Namespace, workdir: str) -> List[Dict[str, Any]]:
+    from ProjectVerification.utils import score_repo_against_requirements
+
+    repo = os.path.join(workdir, "project")
+    gen.make_repo_tree(repo, args.repo_files, seed=args.seed)
+    reqs = gen.skill_dict(random.Random(args.seed), gen.skill_vocabulary(), 6)
+    results = []
+    for manifest in ("list", "merkle"):
+        results.append(measure(
+            f"project.score_repo_against_requirements[{manifest}]",
+            lambda i, m=manifest: score_repo_against_requirements(repo, reqs, manifest=m),
+            repeat=args.project_repeat,
+            items_per_call=args.repo_files,
+            params={"files": args.repo_files, "manifest": manifest},
+        ))
+    cache_dir = os.path.join(workdir, "project-cache")
+    results.append(measure(
+        "project.score_repo_against_requirements[cached]",
+        lambda i: score_repo_against_requirements(repo, reqs, cache_dir=cache_dir),
+        repeat=args.project_repeat,
+        items_per_call=args.repo_files,
+        params={"files": args.repo_files, "manifest": "list", "cache_dir": True},
+    ))
+    return results
+
+
+def bench_reputation(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    from ReputationAdjustment.core import adjust_reputation
+
+    events = gen.reputation_events(args.events, args.workers, seed=args.seed)
+    return [measure(
+        "reputation.adjust_reputation",
+        lambda i: adjust_reputation(*events[i % len(events)]),
+        repeat=args.events,
+        warmup=min(100, args.events),
+        params={"events": args.events, "workers": args.workers},
+    )]
+
+
+def bench_skills(args: argparse.Namespace, workdir: str) -> List[Dict[str, Any]]:
+    from SkillVerification.core import run_for_candidate
+
+    resumes = gen.write_resumes(os.path.join(workdir, "resumes"), args.resumes, args.resume_pages, seed=args.seed)
+    fixture = os.path.join(workdir, "clone-fixture")
+    gen.make_repo_tree(fixture, args.clone_files, seed=args.seed)
+    clone_url = gen.init_git_repo(fixture)
+    client = gen.FakeGithub(gen.github_recording("bench-user", args.repos, clone_url=clone_url, seed=args.seed))
+    params = {
+        "resumes": args.resumes,
+        "resume_pages": args.resume_pages,
+        "repos": args.repos,
+        "clone_files": args.clone_files,
+        "notebooks": args.notebooks,
+    }
+    with gen.NotebookServer() as server:
+        urls = [server.url(i) for i in range(args.notebooks)]
+        return [measure(
+            "skills.run_for_candidate",
+            lambda i: run_for_candidate(f"cand-{i}", resumes, "bench-user", urls, github_client=client),
+            repeat=args.skills_repeat,
+            params=params,
+        )]
+
+
+def _apply_quick(args: argparse.Namespace) -> None:
+    args.pairs = min(args.pairs, 2000)
+    args.events = min(args.events, 5000)
+    args.repo_files = min(args.repo_files, 300)
+    args.project_repeat = min(args.project_repeat, 3)
+    args.resume_pages = min(args.resume_pages, 3)
+    args.repos = min(args.repos, 3)
+    args.clone_files = min(args.clone_files, 50)
+    args.notebooks = min(args.notebooks, 2)
+    args.skills_repeat = min(args.skills_repeat, 2)
+
+
+def _print_table(results: List[Dict[str, Any]]) -> None:
+    print(f"{'benchmark':<50} {'p50 ms':>10} {'p99 ms':>10} {'ops/s':>12} {'peak KiB':>10}")
+    for r in results:
+        lat = r["latency_ms"]
+        print(f"{r['name']:<50} {lat['p50']:>10.3f} {lat['p99']:>10.3f} {r['throughput_per_s'] or 0:>12.1f} {r['peak_mem_kb']:>10.1f}")
+
+
+def main(argv: List[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description="Benchmark the ZK agents on synthetic data")
+    p.add_argument("--suite", default=",".join(SUITES), help=f"Comma-separated subset of {', '.join(SUITES)}")
+    p.add_argument("--out", help="Write results JSON here")
+    p.add_argument("--compare", help="Earlier results JSON to compare against (ratios are new/old)")
+    p.add_argument("--seed", type=int, default=1234)
+    p.add_argument("--quick", action="store_true", help="Small inputs, for a smoke run")
+    p.add_argument("--keep-cache", action="store_true", help="Leave the SkillVerification disk caches enabled")
+    p.add_argument("--workdir", help="Directory for generated fixtures (default: a temporary one)")
+    p.add_argument("--pairs", type=int, default=20000)
+    p.add_argument("--vocab", type=int, default=500, help="Made-up skills added to the lexicon ids")
+    p.add_argument("--job-skills", type=int, default=8)
+    p.add_argument("--user-skills", type=int, default=20)
+    p.add_argument("--events", type=int, default=50000)
+    p.add_argument("--workers", type=int, default=1000)
+    p.add_argument("--repo-files", type=int, default=2000)
+    p.add_argument("--project-repeat", type=int, default=5)
+    p.add_argument("--resumes", type=int, default=2)
+    p.add_argument("--resume-pages", type=int, default=6)
+    p.add_argument("--repos", type=int, default=6)
+    p.add_argument("--clone-files", type=int, default=200)
+    p.add_argument("--notebooks", type=int, default=4)
+    p.add_argument("--skills-repeat", type=int, default=5)
+    args = p.parse_args(argv)
+
+    suites = [s.strip() for s in args.suite.split(",") if s.strip()]
+    unknown = sorted(set(suites) - set(SUITES))
+    if unknown:
+        p.error(f"unknown suite(s): {', '.join(unknown)}")
+    if args.quick:
+        _apply_quick(args)
+
+    # Must happen before SkillVerification.config is imported.
+    os.environ.pop("OPENAI_API_KEY", None)
+    if not args.keep_cache:
+        os.environ["ZK_AGENTS_CACHE"] = "0"
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix="zk-bench-")
+    runners: Dict[str, Callable[[], List[Dict[str, Any]]]] = {
+        "match": lambda: bench_match(args),
+        "project": lambda: bench_project(args, workdir),
+        "reputation": lambda: bench_reputation(args),
+        "skills": lambda: bench_skills(args, workdir),
+    }
+    results: List[Dict[str, Any]] = []
+    try:
+        for name in suites:
+            results.extend(runners[name]())
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    _print_table(results)
+    meta = dict(environment(ROOT), seed=args.seed, suites=suites, cache=args.keep_cache)
+    if args.out:
+        write_results(args.out, results, meta)
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as fh:
+            old = json.load(fh)
+        print()
+        print(f"{'benchmark':<50} {'p50 x':>8} {'ops/s x':>8} {'mem x':>8}")
+        for row in compare(old, {"results": results}):
+            cells = [row[k] if row[k] is not None else float("nan") for k in ("p50_ratio", "throughput_ratio", "peak_mem_ratio")]
+            print(f"{row['name']:<50} {cells[0]:>8.3f} {cells[1]:>8.3f} {cells[2]:>8.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,18 @@
 from __future__ import annotations
 
+import json
 import sys
 import tempfile
 from pathlib import Path
 
 from dotenv import load_dotenv
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from SkillVerification import telemetry
 from SkillVerification.core import run_for_candidate
 
 load_dotenv()
@@ -46,5 +48,16 @@ def upload():
         temp_path.unlink(missing_ok=True)
 
 
+@app.get("/metrics")
+def metrics():
+    return Response(telemetry.prometheus_text(), mimetype="text/plain; version=0.0.4")
+
+
+@app.get("/spans")
+def spans():
+    body = "".join(json.dumps(sp, default=str) + "\n" for sp in telemetry.recent_spans())
+    return Response(body, mimetype="application/x-ndjson")
+
+
 if __name__ == "__main__":
     app.run(host="127.0.0.1", port=8000, debug=True)
\ No newline at end of file
@@ -0,0 +1,52 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+@pytest.fixture(autouse=True)
+def no_disk_cache(monkeypatch):
+    """Keep tests off the user's on-disk caches: ``cache=None`` means no cache."""
+    from SkillVerification import canonical_cache, embeddings, github_analyzer, kaggle_analyzer, resume_parser
+
+    for module in (canonical_cache, embeddings, github_analyzer, kaggle_analyzer, resume_parser):
+        monkeypatch.setattr(module, "CACHE_ENABLED", False)
+
+
+@pytest.fixture(autouse=True)
+def live_transport():
+    """Run every test against a live transport, whatever ZK_TRANSPORT says."""
+    from SkillVerification.transport import Transport, get_transport, set_transport
+
+    previous = get_transport()
+    set_transport(Transport("live"))
+    yield
+    set_transport(previous)
+
+
+class DictCache:
+    """In-memory stand-in for DiskCache that records hits and writes."""
+
+    def __init__(self):
+        self.data = {}
+        self.hits = 0
+        self.sets = 0
+
+    def get(self, key):
+        value = self.data.get(key)
+        if value is not None:
+            self.hits += 1
+        return value
+
+    def set(self, key, value):
+        self.sets += 1
+        self.data[key] = value
+
+
+@pytest.fixture
+def dict_cache():
+    return DictCache()
@@ -0,0 +1,195 @@
+import os
+import subprocess
+import tempfile
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from SkillVerification import telemetry
+from SkillVerification.github_analyzer import analyze_github_user
+from SkillVerification.transport import Transport, set_transport
+
+GIT_ENV = dict(os.environ, GIT_AUTHOR_NAME="t", GIT_AUTHOR_EMAIL="t@example.invalid",
+               GIT_COMMITTER_NAME="t", GIT_COMMITTER_EMAIL="t@example.invalid")
+
+SOURCES = {
+    "app.py": "import numpy as np\nimport pandas as pd\n",
+    "web/index.js": "import React from 'react'\n",
+    "nb/train.py": "import torch\nfrom sklearn import svm\n",
+}
+
+
+def _git(*args, cwd=None):
+    subprocess.run(["git", *args], cwd=cwd, env=GIT_ENV, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def make_bare_repo(root, name, files):
+    """Bare repository ``<root>/<name>.git`` holding ``files``; returns its file:// URL."""
+    work = os.path.join(root, name)
+    for rel, body in files.items():
+        path = os.path.join(work, rel)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as fh:
+            fh.write(body)
+    _git("init", "-q", cwd=work)
+    _git("add", "-A", cwd=work)
+    _git("commit", "-q", "-m", "fixture", cwd=work)
+    bare = os.path.join(root, name + ".git")
+    _git("clone", "-q", "--bare", work, bare)
+    return "file://" + bare
+
+
+class Content:
+    def __init__(self, name, body=""):
+        self.name = name
+        self.decoded_content = body.encode("utf-8")
+
+
+class Missing(Exception):
+    status = 404
+
+
+class StubRepo:
+    """The part of a PyGithub Repository analyze_repo uses; counts API calls."""
+
+    def __init__(self, name, clone_url, pushed_at, files=None, readme="", languages=None):
+        self.full_name = name
+        self.clone_url = clone_url
+        self.pushed_at = pushed_at
+        self.size = 10
+        self.files = dict(files or {})
+        self.readme = readme
+        self.languages = dict(languages or {})
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _call(self):
+        with self._lock:
+            self.calls += 1
+
+    def get_readme(self):
+        self._call()
+        if not self.readme:
+            raise Missing("no README")
+        return Content("README.md", self.readme)
+
+    def get_languages(self):
+        self._call()
+        return self.languages
+
+    def get_contents(self, path):
+        self._call()
+        if path == "":
+            return [Content(n) for n in self.files]
+        return Content(path, self.files[path])
+
+
+class StubGithub:
+    def __init__(self, repos):
+        self.repos = repos
+
+    def get_user(self, username):
+        client = self
+
+        class User:
+            def get_repos(self):
+                return iter(client.repos)
+
+        return User()
+
+
+@pytest.fixture
+def repos(tmp_path):
+    pushed = datetime(2024, 5, 1, 12, 0, 0)
+    out = []
+    for i in range(6):
+        url = make_bare_repo(str(tmp_path), f"r{i}", {k: v + f"# {i}\n" for k, v in SOURCES.items()})
+        out.append(StubRepo(
+            f"dev/r{i}", url, pushed + timedelta(days=i),
+            files={"requirements.txt": "flask>=2\nnumpy==1.26\n"},
+            readme="Built with Docker and Python" if i % 2 else "",
+            languages={"Python": 1200, "JavaScript": 300},
+        ))
+    return out
+
+
+@pytest.fixture
+def clone_dir(tmp_path, monkeypatch):
+    """Directory receiving the analyzer's temporary clones."""
+    path = tmp_path / "clones"
+    path.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(path))
+    return path
+
+
+def test_parallel_scan_matches_serial(repos, clone_dir):
+    serial = analyze_github_user("dev", client=StubGithub(repos), cache=None, max_workers=1)
+    parallel = analyze_github_user("dev", client=StubGithub(repos), cache=None, max_workers=4)
+    assert serial  # the fixture repos do contain lexicon skills
+    assert any(ev["type"] == "import" for evs in serial.values() for ev in evs)
+    assert dict(parallel) == dict(serial)
+    assert list(parallel) == list(serial)
+
+
+def test_cache_hits_are_keyed_by_pushed_at(repos, clone_dir, dict_cache):
+    first = analyze_github_user("dev", client=StubGithub(repos), cache=dict_cache, max_workers=2)
+    assert dict_cache.sets == len(repos) and dict_cache.hits == 0
+    calls = [r.calls for r in repos]
+
+    again = analyze_github_user("dev", client=StubGithub(repos), cache=dict_cache, max_workers=2)
+    assert again == first
+    assert dict_cache.hits == len(repos)
+    assert [r.calls for r in repos] == calls  # served from the cache, no API calls
+
+    repos[2].pushed_at += timedelta(hours=1)
+    analyze_github_user("dev", client=StubGithub(repos), cache=dict_cache, max_workers=2)
+    assert dict_cache.hits == 2 * len(repos) - 1
+    assert [r.calls - c for r, c in zip(repos, calls)] == [0, 0, calls[2], 0, 0, 0]
+
+
+def test_incomplete_scans_are_not_cached(repos, clone_dir, dict_cache):
+    repos[0].clone_url = "file:///nonexistent/repo.git"
+    analyze_github_user("dev", client=StubGithub(repos), cache=dict_cache, max_workers=2)
+    assert dict_cache.sets == len(repos) - 1
+
+
+def test_temp_clones_are_removed(repos, clone_dir):
+    repos[1].clone_url = "file:///nonexistent/repo.git"  # failed clones are cleaned up too
+    analyze_github_user("dev", client=StubGithub(repos), cache=None, max_workers=3)
+    assert list(clone_dir.iterdir()) == []
+
+
+def test_stop_event_skips_remaining_repos(repos, clone_dir):
+    stop = threading.Event()
+    stop.set()
+    assert analyze_github_user("dev", client=StubGithub(repos), cache=None, max_workers=2, stop=stop) == {}
+    assert all(r.calls == 0 for r in repos)
+
+
+def _external_calls():
+    counts = {}
+    for (name, labels), value in telemetry.counters().items():
+        if name == "zk_external_calls_total":
+            counts[dict(labels)["service"]] = value
+    return counts
+
+
+def test_external_calls_are_counted_only_when_they_happen(repos, clone_dir, tmp_path):
+    cassettes = str(tmp_path / "cassettes")
+    expected = None
+    for mode in ("live", "record", "replay"):
+        set_transport(Transport(mode, cassettes))
+        for r in repos:
+            r.calls = 0
+        before = _external_calls()
+        analyze_github_user("dev", client=StubGithub(repos), cache=None, max_workers=2)
+        after = _external_calls()
+        delta = {k: after.get(k, 0) - before.get(k, 0) for k in ("github", "git_clone")}
+        if mode == "replay":
+            assert delta == {"github": 0, "git_clone": 0}
+            continue
+        # get_user, one page of repos, then the per-repo API calls
+        assert delta == {"github": 2 + sum(r.calls for r in repos), "git_clone": len(repos)}
+        expected = expected or delta
+        assert delta == expected
@@ -0,0 +1,126 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from SkillVerification import kaggle_analyzer
+from SkillVerification.kaggle_analyzer import analyze_kaggle_notebooks, fetch_import_tokens, iter_import_tokens
+
+
+class StubServer:
+    """Local HTTP server for notebook pages, with ETag revalidation.
+
+    ``pages`` maps path -> (etag, text). Requests carrying the current ETag
+    in If-None-Match get a 304. Records the status of every response and
+    the highest number of requests handled at once.
+    """
+
+    def __init__(self, pages, delay=0.0):
+        self.pages = dict(pages)
+        self.statuses = []
+        self.active = 0
+        self.max_active = 0
+        lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with lock:
+                    server.active += 1
+                    server.max_active = max(server.max_active, server.active)
+                try:
+                    time.sleep(delay)
+                    etag, text = server.pages[self.path]
+                    if self.headers.get("If-None-Match") == etag:
+                        status, body = 304, b""
+                    else:
+                        status, body = 200, text.encode("utf-8")
+                    with lock:
+                        server.statuses.append(status)
+                    self.send_response(status)
+                    self.send_header("ETag", etag)
+                    if status == 200:
+                        self.send_header("Content-Type", "text/plain; charset=utf-8")
+                        self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                finally:
+                    with lock:
+                        server.active -= 1
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def url(self, path):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{path}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _tokens(text):
+    return list(iter_import_tokens([text]))
+
+
+def test_chunk_boundaries_do_not_change_tokens(monkeypatch):
+    monkeypatch.setattr(kaggle_analyzer, "_CHUNK_CHARS", 32)
+    text = "".join(f"import mod{i}\nx = {i}\nfrom pkg{i}.sub import y\n" for i in range(40))
+    expected = _tokens(text)
+    assert len(expected) == 80
+    for size in (1, 5, 31, 32, 33, 100, len(text)):
+        chunks = [text[i:i + size] for i in range(0, len(text), size)]
+        assert list(iter_import_tokens(chunks)) == expected
+
+
+def test_text_without_newlines_is_not_buffered_whole(monkeypatch):
+    monkeypatch.setattr(kaggle_analyzer, "_CHUNK_CHARS", 64)
+    consumed = []
+
+    def chunks():
+        yield "import numpy "
+        for i in range(1000):
+            consumed.append(i)
+            yield "a" * 16
+
+    tokens = iter_import_tokens(chunks())
+    assert next(tokens) == "numpy"
+    assert len(consumed) < 10  # scanned after about one block, not at the end of the page
+    assert list(tokens) == []
+
+
+def test_304_reuses_cached_tokens(dict_cache):
+    with StubServer({"/nb": ('"v1"', "import pandas\nimport numpy\n")}) as srv:
+        session = requests.Session()
+        first = fetch_import_tokens(srv.url("/nb"), session=session, cache=dict_cache)
+        again = fetch_import_tokens(srv.url("/nb"), session=session, cache=dict_cache)
+        assert first == again == ["pandas", "numpy"]
+        assert srv.statuses == [200, 304]
+
+        srv.pages["/nb"] = ('"v2"', "import torch\n")
+        assert fetch_import_tokens(srv.url("/nb"), session=session, cache=dict_cache) == ["torch"]
+        assert srv.statuses == [200, 304, 200]
+
+
+def test_requests_per_host_are_capped(monkeypatch):
+    monkeypatch.setattr(kaggle_analyzer, "KAGGLE_PER_HOST", 2)
+    monkeypatch.setattr(kaggle_analyzer, "_host_slots", {})
+    monkeypatch.setattr(kaggle_analyzer, "CACHE_ENABLED", False)
+    pages = {f"/nb{i}": (f'"e{i}"', f"import mod{i}\nimport numpy\n") for i in range(8)}
+    with StubServer(pages, delay=0.05) as srv:
+        urls = [srv.url(p) for p in pages]
+        results = analyze_kaggle_notebooks(urls, max_workers=8, session=requests.Session())
+    assert srv.max_active == 2
+    assert len(results) == 8
+    assert [sorted(r) for r in results] == [["NumPy"]] * 8
+    assert [r["NumPy"][0]["url"] for r in results] == urls
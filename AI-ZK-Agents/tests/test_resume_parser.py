@@ -0,0 +1,40 @@
+import pytest
+
+from benchmarks.generators import write_resumes
+from SkillVerification import resume_parser
+from SkillVerification.resume_parser import extract_resume_skills, get_pool
+
+
+@pytest.fixture(scope="module")
+def resumes(tmp_path_factory):
+    return write_resumes(str(tmp_path_factory.mktemp("resumes")), count=2, n_pages=6, seed=3)
+
+
+def test_pool_matches_serial_parse(resumes):
+    serial = extract_resume_skills(resumes, max_workers=1, stop_early=False)
+    pooled = extract_resume_skills(resumes, max_workers=2, pages_per_task=2, stop_early=False)
+    assert serial and pooled == serial
+
+
+def test_pool_is_sized_by_max_workers(resumes, monkeypatch):
+    used = []
+    monkeypatch.setattr(resume_parser, "get_pool", lambda n: used.append(n) or get_pool(n))
+    extract_resume_skills(resumes, max_workers=3, pages_per_task=2)
+    assert used == [3]
+    assert get_pool(3)._max_workers == 3
+    assert get_pool(3) is get_pool(3) and get_pool(2) is not get_pool(3)
+
+
+def test_range_tasks_do_not_carry_the_pdf(resumes, monkeypatch):
+    submitted = []
+    pool = get_pool(2)
+    real_submit = pool.submit
+    monkeypatch.setattr(pool, "submit", lambda fn, *args: submitted.append(args) or real_submit(fn, *args))
+    extract_resume_skills(resumes, max_workers=2, pages_per_task=2, stop_early=False)
+    assert submitted
+    assert all(not isinstance(a, (bytes, bytearray)) for args in submitted for a in args)
+
+
+def test_changed_file_is_not_parsed_under_old_hash(resumes):
+    with pytest.raises(RuntimeError):
+        resume_parser._load_pdf(resumes[0], "0" * 64)
@@ -0,0 +1,43 @@
+import random
+
+import pytest
+
+from MatchingAlgorithm.core import compute_weighted_overlap
+from MatchingAlgorithm.index import SkillIndex
+
+SKILLS = ["python", "javascript", "rust", "tf", "docker", "go", "sql", "react", "kubernetes", "pandas"]
+
+
+def brute_force(job, candidates, k):
+    scored = [(compute_weighted_overlap(job, skills)[0], cand) for cand, skills in candidates.items()]
+    scored.sort(key=lambda t: (-t[0], t[1]))
+    return [(cand, score) for score, cand in scored[:k]]
+
+
+def _weight(rng):
+    # mostly values whose sums land a few ULPs apart after division
+    return rng.choice([0.1, 0.2, 0.3, 0.7, 0.5, 0.235, 1 / 3, 2 / 3, 0.6, rng.random()])
+
+
+def _skills(rng, n):
+    return {s: _weight(rng) for s in rng.sample(SKILLS, n)}
+
+
+def test_top_k_breaks_float_ties_by_id():
+    job = {"x": 0.3, "y": 0.2, "z": 1.0}
+    # overlaps 0.5 and one ULP below it divide to the same score
+    candidates = {"c1": {"x": 0.3, "y": 0.2}, "c0": {"z": 0.49999999999999994}}
+    assert compute_weighted_overlap(job, candidates["c0"])[0] == compute_weighted_overlap(job, candidates["c1"])[0]
+    index = SkillIndex.from_candidates(candidates)
+    assert index.top_k(job, 2) == brute_force(job, candidates, 2)
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_top_k_matches_brute_force(seed):
+    rng = random.Random(seed)
+    candidates = {f"c{i:03d}": _skills(rng, rng.randint(0, 6)) for i in range(rng.randint(1, 60))}
+    index = SkillIndex.from_candidates(candidates)
+    for _ in range(20):
+        job = _skills(rng, rng.randint(1, 6))
+        for k in (1, 3, 10, len(candidates) + 2):
+            assert index.top_k(job, k) == brute_force(job, candidates, k)
@@ -0,0 +1,11 @@
+"""zk_agents package
+
+Single ``zk-agents`` entry point for the agent CLIs (``python -m zk_agents
+<command> ...``). A subcommand imports only its own agent package, so the
+light commands (match, reputation) start without loading the PDF, GitHub,
+git, OpenAI or numpy dependencies of the others.
+"""
+
+__all__ = [
+    "cli",
+]
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import argparse
+import importlib
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# subcommand -> (module with main(argv), one-line help); modules are imported on use
+COMMANDS: Dict[str, Tuple[str, str]] = {
+    "match": ("MatchingAlgorithm.cli", "Weighted match score between job requirements and candidate skills"),
+    "verify-project": ("ProjectVerification.cli", "Verify a repository against job requirements"),
+    "reputation": ("ReputationAdjustment.cli", "Adjust worker reputation, replay event logs, manage the store"),
+    "verify-skills": ("SkillVerification.cli", "Score a candidate's skills from resume, GitHub and Kaggle evidence"),
+    "worker": ("AgentWorker.cli", "Resident worker serving JSON jobs from stdin or a Unix socket"),
+}
+
+
+def load(command: str) -> Callable[[Optional[List[str]]], object]:
+    """``main`` of the module behind ``command``, importing only that module."""
+    module_name, _ = COMMANDS[command]
+    return importlib.import_module(module_name).main
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="zk-agents",
+        description="ZK agent tools; run 'zk-agents <command> --help' for a command's options",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="commands:\n" + "\n".join(f"  {name:<16}{help_}" for name, (_, help_) in COMMANDS.items()),
+    )
+    parser.add_argument("command", choices=sorted(COMMANDS), metavar="command")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    load(args.command)(args.args)
+    return 0
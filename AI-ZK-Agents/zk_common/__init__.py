@@ -0,0 +1,15 @@
+"""zk_common package
+
+Shared core for the ZK-emitting agent modules (MatchingAlgorithm,
+ProjectVerification, ReputationAdjustment): canonical JSON encoding,
+domain-separated blake2b secrets/commitments (including batch APIs), the
+shared skill lexicon, and the small helpers every module used to carry its
+own copy of.
+"""
+
+__all__ = [
+    "commitments",
+    "encoding",
+    "lexicon",
+    "utils",
+]
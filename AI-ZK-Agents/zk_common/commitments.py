@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence
+
+from .encoding import canonical_dumps
+
+
+class DomainHasher:
+    """blake2b-256 secrets and commitments for one module namespace.
+
+    A namespace such as ``"MAI"`` yields domain prefixes ``MAI-<domain>|``
+    for secrets and ``MAI-COMMIT-v1|`` for commitments. Each prefix is
+    absorbed once into a blake2b state that is copied per message, which is
+    byte-identical to hashing ``prefix + payload`` from scratch.
+    """
+
+    def __init__(self, namespace: str) -> None:
+        self.namespace = namespace
+        self._states: Dict[bytes, Any] = {}
+        self._lock = threading.Lock()
+        self._commit_state = self._state(f"{namespace}-COMMIT-v1|".encode("utf-8"))
+
+    def _state(self, prefix: bytes):
+        st = self._states.get(prefix)
+        if st is None:
+            st = blake2b(digest_size=32)
+            st.update(prefix)
+            with self._lock:
+                st = self._states.setdefault(prefix, st)
+        return st
+
+    def hash_prefixed(self, prefix: bytes, payload: bytes) -> bytes:
+        h = self._state(prefix).copy()
+        h.update(payload)
+        return h.digest()
+
+    def derive_secret(self, domain: str, payload_obj: Any, salt: Optional[bytes] = None) -> bytes:
+        prefix = f"{self.namespace}-{domain}|".encode("utf-8")
+        payload = canonical_dumps(payload_obj)
+        if salt:
+            return self.hash_prefixed(prefix, salt + b"|" + payload)
+        return self.hash_prefixed(prefix, payload)
+
+    def commitment(self, secret32: bytes) -> bytes:
+        h = self._commit_state.copy()
+        h.update(secret32)
+        return h.digest()
+
+    def commitments(self, secrets: Iterable[bytes]) -> List[bytes]:
+        """Commitments for many secrets; repeated secrets are hashed once."""
+        secrets = list(secrets)
+        cmap = self.commitment_map(secrets)
+        return [cmap[s] for s in secrets]
+
+    def commitment_map(self, secrets: Iterable[bytes]) -> Dict[bytes, bytes]:
+        out: Dict[bytes, bytes] = {}
+        base = self._commit_state
+        for s in secrets:
+            if s not in out:
+                h = base.copy()
+                h.update(s)
+                out[s] = h.digest()
+        return out
+
+
+class SecretMemo:
+    """Bounded LRU of derived secrets for payloads that recur (e.g. one job
+    scored against many candidates).
+
+    ``key`` must uniquely determine ``payload_obj``; it is used instead of
+    the payload so hits skip both canonical encoding and hashing.
+    """
+
+    def __init__(self, hasher: DomainHasher, domain: str, maxsize: int = 1024) -> None:
+        self.hasher = hasher
+        self.domain = domain
+        self.maxsize = maxsize
+        self._memo: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, payload_obj: Any) -> bytes:
+        with self._lock:
+            secret = self._memo.get(key)
+            if secret is not None:
+                self._memo.move_to_end(key)
+                return secret
+        secret = self.hasher.derive_secret(self.domain, payload_obj)
+        with self._lock:
+            self._memo[key] = secret
+            if len(self._memo) > self.maxsize:
+                self._memo.popitem(last=False)
+        return secret
+
+
+def batch_to_zk_json(
+    results: Sequence[Any],
+    hasher: DomainHasher,
+    now: Callable[[], str],
+) -> List[Dict[str, Any]]:
+    """Render many results with one timestamp and one commitment pass.
+
+    Each result provides ``zk_secrets()`` (the secrets its output commits to)
+    and ``to_zk_json(generated_at=..., commitments=...)`` accepting a
+    precomputed secret -> commitment map.
+    """
+    generated_at = now()
+    cmap = hasher.commitment_map(s for r in results for s in r.zk_secrets())
+    return [r.to_zk_json(generated_at=generated_at, commitments=cmap) for r in results]
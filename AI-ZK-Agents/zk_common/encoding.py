@@ -0,0 +1,36 @@
+import json
+from json import encoder as _json_encoder
+from typing import Any
+
+
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+
+
+def _make_iterencode():
+    # JSONEncoder.encode rebuilds the C encoder on every call; building it
+    # once removes most of the per-payload overhead for the small flat
+    # dict/float payloads hashed into secrets. Same C code path, same bytes.
+    c_make_encoder = getattr(_json_encoder, "c_make_encoder", None)
+    if c_make_encoder is None:
+        return None
+    try:
+        return c_make_encoder(
+            None, _ENCODER.default, _json_encoder.encode_basestring, None,
+            _ENCODER.key_separator, _ENCODER.item_separator, True, False, True,
+        )
+    except TypeError:
+        return None
+
+
+_iterencode = _make_iterencode()
+
+
+def canonical_dumps(obj: Any) -> bytes:
+    """Serialize object to canonical JSON bytes (sorted keys, no spaces).
+
+    Payloads must be acyclic; the cached encoder skips circular-reference
+    bookkeeping.
+    """
+    if _iterencode is not None:
+        return "".join(_iterencode(obj, 0)).encode("utf-8")
+    return _ENCODER.encode(obj).encode("utf-8")
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from hashlib import blake2b
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+from .encoding import canonical_dumps
+
+
+LEXICON_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "skills_lexicon.json")
+LEXICON_FORMAT = 1
+_LIST_FIELDS = ("aliases", "mentions", "imports", "cues")
+
+logger = logging.getLogger(__name__)
+
+
+class Lexicon:
+    """Skill lexicon shared by every agent module, with precomputed lookups.
+
+    Each entry has an ``id`` (the normalized skill name used by the ZK
+    modules), a display ``name`` (the canonical skill of SkillVerification)
+    and optional lists:
+
+    - ``aliases``: extra spellings ``normalize_skill_name`` maps to the id
+    - ``mentions``: tokens recognized in resumes/READMEs, mapped to the name
+    - ``imports``: import/package names mapped to the name
+    - ``cues``: ProjectVerification filename/content cues for the id
+
+    ``version`` hashes the entries, so caches keyed on it are invalidated
+    when the file changes. Structures that consumers build from a lexicon
+    (regex automata) are memoized per instance with ``derived``.
+    """
+
+    def __init__(self, entries: List[Mapping[str, Any]], source: Optional[str] = None) -> None:
+        self.source = source
+        self.entries: List[Dict[str, Any]] = []
+        self.alias_map: Dict[str, str] = {}
+        self.names: Dict[str, str] = {}
+        self.mentions: Dict[str, str] = {}
+        self.imports: Dict[str, str] = {}
+        self.cues: Dict[str, List[str]] = {}
+        for raw in entries:
+            entry = {"id": str(raw["id"]), "name": str(raw["name"])}
+            for field in _LIST_FIELDS:
+                entry[field] = [str(v) for v in raw.get(field, ())]
+            sid, name = entry["id"], entry["name"]
+            if sid in self.names:
+                raise ValueError(f"duplicate skill id in lexicon: {sid!r}")
+            self.entries.append(entry)
+            self.names[sid] = name
+            for alias in entry["aliases"]:
+                self.alias_map.setdefault(alias, sid)
+            for token in entry["mentions"]:
+                if self.mentions.setdefault(token, name) != name:
+                    raise ValueError(f"lexicon mention {token!r} maps to both {self.mentions[token]!r} and {name!r}")
+            for imp in entry["imports"]:
+                self.imports.setdefault(imp.lower(), name)
+            if entry["cues"]:
+                self.cues[sid] = list(entry["cues"])
+        self.canonical: FrozenSet[str] = frozenset(self.names.values())
+        self.version = blake2b(canonical_dumps(self.entries), digest_size=8).hexdigest()
+        self._derived: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def derived(self, key: str, factory: Callable[["Lexicon"], Any]) -> Any:
+        """Build ``factory(self)`` once per lexicon and return the cached value."""
+        value = self._derived.get(key)
+        if value is None:
+            with self._lock:
+                value = self._derived.get(key)
+                if value is None:
+                    value = self._derived[key] = factory(self)
+        return value
+
+
+def lexicon_path() -> str:
+    return os.getenv("ZK_SKILL_LEXICON") or LEXICON_PATH
+
+
+def load_lexicon(path: Optional[str] = None) -> Lexicon:
+    """Read a lexicon file (``{"format": 1, "skills": [...]}``)."""
+    path = path or lexicon_path()
+    with open(path, "r", encoding="utf-8") as fh:
+        data = json.load(fh)
+    if data.get("format") != LEXICON_FORMAT:
+        raise ValueError(f"unsupported lexicon format in {path}: {data.get('format')!r}")
+    return Lexicon(data["skills"], source=path)
+
+
+_current: Optional[Lexicon] = None
+_current_stamp: Optional[Tuple[str, int, int]] = None
+_rejected_stamp: Optional[Tuple[str, int, int]] = None
+_listeners: List[Callable[[Lexicon], None]] = []
+_reload_lock = threading.Lock()
+
+
+def _stamp(path: str) -> Tuple[str, int, int]:
+    st = os.stat(path)
+    return path, st.st_mtime_ns, st.st_size
+
+
+def get_lexicon() -> Lexicon:
+    """The process-wide lexicon, loaded on first use."""
+    if _current is None:
+        reload_lexicon()
+    return _current
+
+
+def reload_lexicon(path: Optional[str] = None) -> Lexicon:
+    """Load the lexicon file again and notify ``on_reload`` listeners."""
+    global _current, _current_stamp
+    with _reload_lock:
+        path = path or lexicon_path()
+        stamp = _stamp(path)
+        lex = load_lexicon(path)
+        _current, _current_stamp = lex, stamp
+        listeners = list(_listeners)
+    for cb in listeners:
+        cb(lex)
+    return lex
+
+
+def maybe_reload_lexicon() -> bool:
+    """Reload if the lexicon file changed on disk; True when it was reloaded.
+
+    Costs one ``stat``, so long-running workers can call it per job. A file
+    that fails to load or validate (e.g. caught half-written) is logged and
+    the current lexicon is kept; that version of the file is not parsed
+    again, only the next change to it. Before the first ``get_lexicon`` there
+    is nothing to reload, and the first load is left to it.
+    """
+    global _rejected_stamp
+    if _current is None:
+        return False
+    path = lexicon_path()
+    try:
+        stamp = _stamp(path)
+    except OSError:
+        return False
+    if stamp == _current_stamp or stamp == _rejected_stamp:
+        return False
+    try:
+        reload_lexicon(path)
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+        _rejected_stamp = stamp
+        logger.warning("keeping lexicon %s: cannot load %s: %s: %s", _current.version, path, type(e).__name__, e)
+        return False
+    return True
+
+
+def on_reload(callback: Callable[[Lexicon], None]) -> None:
+    """Call ``callback(lexicon)`` whenever the shared lexicon is reloaded."""
+    with _reload_lock:
+        _listeners.append(callback)
@@ -0,0 +1,62 @@
+import re
+import sys
+from datetime import datetime
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Dict
+
+from .lexicon import Lexicon, get_lexicon, on_reload
+
+
+def hash32(payload: bytes) -> bytes:
+    h = blake2b(digest_size=32)
+    h.update(payload)
+    return h.digest()
+
+
+def to_hex32(b: bytes) -> str:
+    if len(b) != 32:
+        raise ValueError("expected 32-byte value")
+    return "0x" + b.hex()
+
+
+def hex_to_bytes32(x: str) -> bytes:
+    x = x.lower().strip()
+    if x.startswith("0x"):
+        x = x[2:]
+    b = bytes.fromhex(x)
+    if len(b) != 32:
+        raise ValueError("expected 32-byte hex value")
+    return b
+
+
+def now_utc_iso() -> str:
+    return datetime.utcnow().isoformat() + "Z"
+
+
+_SKILL_STRIP_RE = re.compile(r"[^a-z0-9_\-+.#]")
+
+
+# alias -> skill id, from the shared lexicon
+SKILL_ALIASES: Dict[str, str] = get_lexicon().alias_map
+
+
+@lru_cache(maxsize=8192)
+def normalize_skill_name(name: str) -> str:
+    """Lowercase, strip punctuation outside ``_-+.#`` and resolve aliases.
+
+    Results are memoized and interned: batch jobs normalize the same few
+    hundred skill strings over and over, so repeats cost one cache lookup
+    and equal names share one string object.
+    """
+    t = _SKILL_STRIP_RE.sub("", name.strip().lower())
+    return sys.intern(SKILL_ALIASES.get(t, t))
+
+
+def _use_lexicon(lex: Lexicon) -> None:
+    global SKILL_ALIASES
+    SKILL_ALIASES = lex.alias_map
+    normalize_skill_name.cache_clear()
+
+
+on_reload(_use_lexicon)
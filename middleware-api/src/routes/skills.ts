@@ -1,6 +1,6 @@
 // skillsMiddleware.ts
 
-import { spawn } from 'child_process';
+import { ChildProcess, spawn } from 'child_process';
 import { promises as fs } from 'fs';
 import path from 'path';
 
@@ -29,112 +29,185 @@ function getErrorMessage(error: unknown): string {
   return String(error);
 }
 
+// Python executables tried in order when starting the resident worker
+const PYTHON_COMMANDS = ['python3', 'python', '/usr/bin/python3', '/usr/bin/python'];
+
+interface PendingJob {
+  resolve: (value: any) => void;
+  reject: (error: Error) => void;
+}
+
+// Client for the long-running AgentWorker process. One Python interpreter is
+// started lazily and kept alive; jobs are sent as newline-delimited JSON and
+// matched to responses by id, so imports are paid once instead of per request.
+class AgentWorkerClient {
+  private proc: ChildProcess | null = null;
+  private starting: Promise<ChildProcess> | null = null;
+  private commandIndex = 0;
+  private nextId = 1;
+  private stdoutBuffer = '';
+  private pending = new Map<number, PendingJob>();
+
+  constructor(private cwd: string, private env: NodeJS.ProcessEnv) {}
+
+  private start(): Promise<ChildProcess> {
+    if (this.proc) return Promise.resolve(this.proc);
+    if (this.starting) return this.starting;
+
+    this.starting = new Promise<ChildProcess>((resolve, reject) => {
+      const tryNextPython = () => {
+        if (this.commandIndex >= PYTHON_COMMANDS.length) {
+          this.commandIndex = 0;
+          reject(new Error('No working Python executable found'));
+          return;
+        }
+
+        const pythonCommand = PYTHON_COMMANDS[this.commandIndex];
+        console.log(`Starting agent worker with: ${pythonCommand}`);
+        const proc = spawn(pythonCommand, ['-m', 'AgentWorker.cli'], { cwd: this.cwd, env: this.env });
+
+        proc.once('spawn', () => {
+          this.proc = proc;
+          resolve(proc);
+        });
+
+        proc.once('error', (err) => {
+          console.error(`Failed to spawn ${pythonCommand}:`, err);
+          if (this.proc === proc) {
+            this.handleExit(proc, err);
+            return;
+          }
+          this.commandIndex++;
+          tryNextPython();
+        });
+
+        proc.stdout.on('data', (data) => this.handleStdout(data.toString()));
+        proc.stderr.on('data', (data) => console.error(`[agent-worker] ${data.toString().trimEnd()}`));
+        proc.on('close', (code) => this.handleExit(proc, new Error(`Agent worker exited with code ${code}`)));
+      };
+
+      tryNextPython();
+    }).finally(() => {
+      this.starting = null;
+    });
+
+    return this.starting;
+  }
+
+  private handleStdout(chunk: string) {
+    this.stdoutBuffer += chunk;
+    let newline: number;
+    while ((newline = this.stdoutBuffer.indexOf('\n')) >= 0) {
+      const line = this.stdoutBuffer.slice(0, newline).trim();
+      this.stdoutBuffer = this.stdoutBuffer.slice(newline + 1);
+      if (!line) continue;
+
+      let response: any;
+      try {
+        response = JSON.parse(line);
+      } catch (err) {
+        console.warn('Ignoring unparseable agent worker output:', getErrorMessage(err));
+        continue;
+      }
+
+      const job = this.pending.get(response.id);
+      if (!job) continue;
+      this.pending.delete(response.id);
+      if (response.ok) {
+        job.resolve(response.result);
+      } else {
+        job.reject(new Error(response.error));
+      }
+    }
+  }
+
+  private handleExit(proc: ChildProcess, error: Error) {
+    if (this.proc !== proc) return;
+    this.proc = null;
+    this.stdoutBuffer = '';
+    for (const job of this.pending.values()) {
+      job.reject(error);
+    }
+    this.pending.clear();
+  }
+
+  // Switch to the next interpreter, e.g. when the current one lacks packages.
+  fallBackToNextPython(): boolean {
+    if (this.commandIndex >= PYTHON_COMMANDS.length - 1) return false;
+    this.commandIndex++;
+    const proc = this.proc;
+    if (proc) {
+      this.handleExit(proc, new Error('Agent worker restarting with another Python executable'));
+      proc.kill();
+    }
+    return true;
+  }
+
+  async call<T>(task: string, params: Record<string, unknown>): Promise<T> {
+    const proc = await this.start();
+    const id = this.nextId++;
+    return new Promise<T>((resolve, reject) => {
+      this.pending.set(id, { resolve, reject });
+      proc.stdin!.write(JSON.stringify({ id, task, params }) + '\n');
+    });
+  }
+}
+
 // Simplified middleware that focuses on skill verification without ZK components for now
 export async function initSkillsMiddleware() {
-  // Path to the SkillVerification Python script
+  // Path to the AI-ZK-Agents packages served by the resident worker
   const skillVerificationPath = path.join(__dirname, '../../../AI-ZK-Agents');
+  const worker = new AgentWorkerClient(skillVerificationPath, {
+    ...process.env,
+    // Add the venv path to make sure it finds the right Python
+    PATH: `/mnt/c/Users/koira/Programming/midnight/Midnight/AI-ZK-Agents/.venv/bin:${process.env.PATH}`
+  });
 
   async function verifySkills(request: SkillVerificationRequest): Promise<SkillVerificationResult> {
     const tempDir = path.join(__dirname, '../temp');
     await fs.mkdir(tempDir, { recursive: true });
 
-    const args = ['scripts/test_skill_verification.py', '--candidate-id', request.candidateId];
-    
+    const params: Record<string, unknown> = { candidate_id: request.candidateId };
+
     // Handle resume file
+    const resumePath = path.join(tempDir, `${request.candidateId}-resume.pdf`);
     if (request.resumeFile) {
-      const resumePath = path.join(tempDir, `${request.candidateId}-resume.pdf`);
       await fs.writeFile(resumePath, request.resumeFile);
-      args.push('--resume', resumePath);
+      params.resume_paths = [resumePath];
     }
 
     // Handle GitHub username
     if (request.githubUsername) {
-      args.push('--github', request.githubUsername);
+      params.github_username = request.githubUsername;
     }
 
     // Handle Kaggle URLs
     if (request.kaggleUrls) {
-      request.kaggleUrls.forEach(url => {
-        args.push('--kaggle', url);
-      });
+      params.kaggle_urls = request.kaggleUrls;
     }
 
-    return new Promise((resolve, reject) => {
-      // Try different Python executables in order
-      const pythonCommands = ['python3', 'python', '/usr/bin/python3', '/usr/bin/python'];
-      let currentCommandIndex = 0;
-
-      const tryNextPython = () => {
-        if (currentCommandIndex >= pythonCommands.length) {
-          reject(new Error('No working Python executable found'));
-          return;
-        }
-
-        const pythonCommand = pythonCommands[currentCommandIndex];
-        console.log(`Trying Python command: ${pythonCommand}`);
-
-        const pythonProcess = spawn(pythonCommand, args, {
-          cwd: skillVerificationPath,
-          env: { 
-            ...process.env,
-            // Add the venv path to make sure it finds the right Python
-            PATH: `/mnt/c/Users/koira/Programming/midnight/Midnight/AI-ZK-Agents/.venv/bin:${process.env.PATH}`
-          }
-        });
-
-        let stdout = '';
-        let stderr = '';
-
-        pythonProcess.stdout.on('data', (data) => {
-          stdout += data.toString();
-        });
-
-        pythonProcess.stderr.on('data', (data) => {
-          stderr += data.toString();
-        });
-
-        pythonProcess.on('close', async (code) => {
-          // Clean up temp files
-          if (request.resumeFile) {
-            try {
-              await fs.unlink(path.join(tempDir, `${request.candidateId}-resume.pdf`));
-            } catch (err) {
-              console.warn('Failed to clean up resume file:', getErrorMessage(err));
-            }
-          }
-
-          if (code !== 0) {
-            console.error(`${pythonCommand} failed with code ${code}: ${stderr}`);
-            if (stderr.includes('ModuleNotFoundError') && currentCommandIndex < pythonCommands.length - 1) {
-              currentCommandIndex++;
-              tryNextPython();
-              return;
-            }
-            reject(new Error(`SkillVerification failed with code ${code}: ${stderr}`));
-            return;
-          }
-
-          try {
-            const result = JSON.parse(stdout);
-            resolve(result);
-          } catch (err) {
-            reject(new Error(`Failed to parse SkillVerification output: ${getErrorMessage(err)}`));
-          }
-        });
-
-        pythonProcess.on('error', (err) => {
-          console.error(`Failed to spawn ${pythonCommand}:`, err);
-          if (currentCommandIndex < pythonCommands.length - 1) {
-            currentCommandIndex++;
-            tryNextPython();
-          } else {
-            reject(new Error(`Failed to spawn SkillVerification process: ${getErrorMessage(err)}`));
+    try {
+      for (;;) {
+        try {
+          return await worker.call<SkillVerificationResult>('skills.verify', params);
+        } catch (err) {
+          const message = getErrorMessage(err);
+          if (message.includes('ModuleNotFoundError') && worker.fallBackToNextPython()) {
+            continue;
           }
-        });
-      };
-
-      tryNextPython();
-    });
+          throw new Error(`SkillVerification failed: ${message}`);
+        }
+      }
+    } finally {
+      // Clean up temp files
+      if (request.resumeFile) {
+        try {
+          await fs.unlink(resumePath);
+        } catch (err) {
+          console.warn('Failed to clean up resume file:', getErrorMessage(err));
+        }
+      }
+    }
   }
 
   // Main function to verify and process skills